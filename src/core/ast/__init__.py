@@ -2,38 +2,81 @@
     It has the functionality to re-export the AST node classes 
     so that they are accessible in an orderly and centralized manner.
 """
-from .ast_base import *
-from .ast_expressions import *
-from .ast_statements import *
-from .ast_definitions import *
 
 # Base
-from .ast_base import AstNode
+from .ast_base import AstNode, Module, save_ast, load_ast
 
-# Definiciones
+# Expressions
+from .ast_expressions import (
+    LiteralExpr,
+    Identifier,
+    UnaryExpr,
+    BinaryExpr,
+    ComparisonExpr,
+    CallExpr,
+    TupleExpr,
+    ListExpr,
+    SetExpr,
+    DictExpr,
+)
 
+# Statements
+from .ast_statements import (
+    Block,
+    ExprStmt,
+    Assign,
+    Return,
+    Break,
+    Continue,
+    Pass,
+    If,
+    While,
+    For,
+)
 
-# Exportaciones públicas
+# Definitions
+from .ast_definitions import (
+    FunctionDef,
+    ClassDef,
+    Subscript,
+    Attribute,
+)
+
+# Traversal
+from .ast_visitor import NodeVisitor, ToDictVisitor, iter_child_nodes, walk
+
+# Public exports
 __all__ = [
     "AstNode",
+    "Module",
     "LiteralExpr",
     "Identifier",
     "UnaryExpr",
     "BinaryExpr",
     "ComparisonExpr",
     "CallExpr",
-    "TupleExpr",      
-    "ListExpr",       
-    "DictExpr",       
-    "SetExpr",        
-    "Subscript",      
-    "Attribute",      
+    "TupleExpr",
+    "ListExpr",
+    "SetExpr",
+    "DictExpr",
+    "Block",
+    "ExprStmt",
     "Assign",
     "Return",
-    "Block",
     "Break",
     "Continue",
+    "Pass",
     "If",
-    "For",
     "While",
+    "For",
+    "FunctionDef",
+    "ClassDef",
+    "Subscript",
+    "Attribute",
+    "NodeVisitor",
+    "ToDictVisitor",
+    "iter_child_nodes",
+    "walk",
+    "save_ast",
+    "load_ast",
 ]
@@ -11,50 +11,455 @@ Each AST node tracks its source code position (line, column) and can be
 converted to a dictionary representation for debugging and processing.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, List
+import json
+import math
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from itertools import repeat
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Optional,
+    List,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
+try:
+    import orjson
 
-@dataclass
+    ORJSON_OK = True
+except Exception:
+    ORJSON_OK = False
+
+__all__ = [
+    "AstNode",
+    "Module",
+    "save_ast",
+    "load_ast",
+]
+
+
+@dataclass(slots=True)
 class AstNode:
     """
     Base class for all AST nodes.
     It functions as a general class from which other nodes inherit.
+
+    Nodes are mutable and unhashable until ``freeze()`` makes them immutable
+    and hashable.
     """
 
+    # Declared first, so __init__ sets it before the fields __setattr__ guards.
+    _frozen: bool = field(default=False, init=False, repr=False, compare=False)
     line: Optional[int] = (
         None  # Tell us in which line and column of the source code the AST node is located.
     )
     col: Optional[int] = None
+    # Structural hash, cached on first use once frozen (see _node_hash).
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    # Per-class metadata shared by every instance (never dataclass fields).
+    _type_name: ClassVar[str] = "AstNode"
+    _field_names: ClassVar[Tuple[str, ...]] = ()
+    # Small integer tag per node class; visitors index dispatch tables by it.
+    KIND: ClassVar[int] = 0
+
+    def __init_subclass__(cls, **kwargs):
+        # Explicit form: slots=True rebuilds the class, which breaks bare super().
+        super(AstNode, cls).__init_subclass__(**kwargs)
+        cls._type_name = cls.__name__
+        # The slots rebuild runs this hook again once @dataclass has collected
+        # the final fields; until then the parent's fields are all we have.
+        if "__dataclass_fields__" in cls.__dict__:
+            cls._field_names = _serialized_field_names(cls)
+            # eq=True makes @dataclass set __hash__ to None; restore ours
+            # unless the class defines its own.
+            if cls.__dict__.get("__hash__") is None:
+                cls.__hash__ = _node_hash
+        previous = _NODE_CLASSES.get(cls.__name__)
+        if (
+            previous is not None
+            and previous.__module__ == cls.__module__
+            and previous.__qualname__ == cls.__qualname__
+        ):
+            # Same class rebuilt by slots=True: keep its tag.
+            cls.KIND = previous.KIND
+            _NODE_KINDS[cls.KIND] = cls
+        else:
+            cls.KIND = len(_NODE_KINDS)
+            _NODE_KINDS.append(cls)
+        _NODE_CLASSES[cls.__name__] = cls
+        _LOADERS.pop(cls.__name__, None)
+        # Never inherit a serializer that was compiled for the parent's fields.
+        cls._shallow_dict = _lazy_shallow_dict
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the AST node and its children to a dictionary representation.
         """
-        dictionary = {"_type": self.__class__.__name__}
-        for key, value in self.__dict__.items():
-            if key in ("line", "col"):
+        return _convert(self)[0]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AstNode":
+        """
+        Rebuild a node and its children from ``to_dict`` output.
+
+        The concrete class comes from ``data["_type"]``, so ``AstNode.from_dict``
+        loads any node; calling it on a subclass also checks the result type.
+        """
+        node = _load_node(data)
+        if not isinstance(node, cls):
+            raise TypeError(f"Expected {cls.__name__}, got {data['_type']}")
+        return node
+
+    def freeze(self) -> "AstNode":
+        """
+        Make the tree immutable and hashable, in place, and return self.
+
+        Every list becomes a tuple and assigning to a field of a frozen node
+        raises ``FrozenInstanceError``. Parsing builds children in lists;
+        once a tree is final, tuples are smaller and faster to iterate, and
+        empty ones share the ``()`` singleton. Serialization and the viewers
+        accept both.
+        """
+        pending = [self]
+        while pending:
+            node = pending.pop()
+            if node._frozen:  # its whole subtree already is
                 continue
-            dictionary[key] = _convert(value)
-        if self.line is not None:
-            dictionary["line"] = self.line
-        if self.col is not None:
-            dictionary["col"] = self.col
-        return dictionary
+            for name in node._field_names:
+                value = getattr(node, name)
+                if isinstance(value, AstNode):
+                    pending.append(value)
+                elif isinstance(value, (list, tuple)):
+                    setattr(node, name, _freeze_sequence(value, pending))
+            _object_setattr(node, "_frozen", True)
+        return self
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # __init__ assigns _frozen first, while the slot is still empty.
+        if name != "_frozen" and self._frozen:
+            raise FrozenInstanceError(
+                f"cannot assign to field {name!r} of a frozen {self._type_name}"
+            )
+        _object_setattr(self, name, value)
 
-@dataclass
-class Module(AstNode):
-    """Top-level AST node representing a complete module or file."""
+    def __getstate__(self) -> Dict[str, Any]:
+        # _hash mixes in str hashes, which are salted per process, so it
+        # never travels with a pickle or copy; the receiver recomputes it.
+        state = {name: getattr(self, name) for name in self._field_names}
+        state["line"] = self.line
+        state["col"] = self.col
+        state["_frozen"] = self._frozen
+        return state
 
-    body: List[AstNode] = field(default_factory=list)
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            _object_setattr(self, name, value)
+        _object_setattr(self, "_hash", None)
+
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """
+        Serialize the node as UTF-8 JSON, compact or indented by two spaces.
 
+        Uses orjson (an optional dependency) when it is installed, and the
+        standard library's json module otherwise. orjson only takes 64-bit
+        integers and writes ``inf``/``nan`` as ``null``, so trees with larger
+        integers or non-finite floats always use json, which writes
+        ``Infinity`` and ``NaN``. Both writers produce the same structure
+        and values, but float spelling differs: orjson writes ``1e16`` and
+        ``2.5e-7`` where json writes ``1e+16`` and ``2.5e-07``. Compare the
+        parsed documents, not the bytes.
+        """
+        data, orjson_safe = _convert(self)
+        if ORJSON_OK and orjson_safe:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+            except TypeError:  # any other value orjson does not take
+                pass
+        layout = {"indent": 2} if indent else {"separators": (",", ":")}
+        return json.dumps(data, ensure_ascii=False, **layout).encode("utf-8")
+
+    def _shallow_dict(self, pending: list) -> Dict[str, Any]:
+        """
+        Build this node's dictionary, leaving children to the caller.
+
+        Every child value gets a ``None`` placeholder (so key order matches the
+        field order) and a ``(container, key, value)`` entry on ``pending``.
+        The first call on each node class compiles a version specialized to
+        that class's fields and installs it on the class.
+        """
+        shallow = _compile_shallow_dict(type(self))
+        type(self)._shallow_dict = shallow
+        return shallow(self, pending)
 
-def _convert(value):
-    if isinstance(value, AstNode):
-        return value.to_dict()
+
+_lazy_shallow_dict = AstNode._shallow_dict
+_object_setattr = object.__setattr__
+
+
+def _hashable(value: Any) -> Any:
+    """Turn a field value into something ``hash`` accepts, keeping node order."""
     if isinstance(value, (list, tuple)):
-        return [_convert(x) for x in value]
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((k, _hashable(v)) for k, v in value.items())
+    return value
+
+
+def _node_hash(self: AstNode) -> int:
+    """
+    Structural hash over the node class and its serialized fields.
+
+    Positions are left out, which keeps it consistent with ``==``. Only
+    frozen nodes are hashable, as a mutable node's hash could go stale;
+    theirs is computed once and stored on ``_hash``.
+    """
+    if not self._frozen:
+        raise TypeError(
+            f"unhashable type: {self._type_name!r} (call freeze() first)"
+        )
+    h = self._hash
+    if h is None:
+        h = hash(
+            (self.KIND,) + tuple(_hashable(getattr(self, n)) for n in self._field_names)
+        )
+        _object_setattr(self, "_hash", h)
+    return h
+
+
+AstNode.__hash__ = _node_hash
+
+
+# Node classes by name, and the generated loaders used by from_dict.
+_NODE_CLASSES: Dict[str, type] = {"AstNode": AstNode}
+_NODE_KINDS: List[type] = [AstNode]
+_LOADERS: Dict[str, Any] = {}
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _is_node_type(tp) -> bool:
+    return isinstance(tp, type) and issubclass(tp, AstNode)
+
+
+def _field_kind(tp) -> str:
+    """Classify a field annotation as 'scalar', 'node', 'nodes' or 'any'."""
+    if tp in _SCALAR_TYPES:
+        return "scalar"
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is Union and len(args) == 2 and type(None) in args:
+        (tp,) = [a for a in args if a is not type(None)]
+        origin, args = get_origin(tp), get_args(tp)
+    if _is_node_type(tp):
+        return "node"
+    if origin is list and len(args) == 1 and _is_node_type(args[0]):
+        return "nodes"
+    return "any"
+
+
+def _serialized_field_names(cls) -> Tuple[str, ...]:
+    """Names of the dataclass fields ``to_dict`` emits, in declaration order."""
+    return tuple(
+        f.name
+        for f in fields(cls)
+        if f.name not in ("line", "col") and not f.name.startswith("_")
+    )
+
+
+def _compile_shallow_dict(cls):
+    """Generate a straight-line ``_shallow_dict`` for a dataclass node class."""
+    # Covers dataclass subclasses declared without slots, whose fields did
+    # not exist yet when __init_subclass__ ran.
+    cls._field_names = _serialized_field_names(cls)
+    types = {f.name: f.type for f in fields(cls)}
+    lines = [
+        "def _shallow_dict(self, pending):",
+        f"    d = {{'_type': {cls._type_name!r}}}",
+    ]
+    for name in cls._field_names:
+        kind = _field_kind(types[name])
+        if kind == "scalar":
+            lines.append(f"    d[{name!r}] = self.{name}")
+            continue
+        lines.append(f"    v = self.{name}")
+        if kind == "nodes":
+            lines.append("    lst = [None] * len(v)")
+            lines.append(f"    d[{name!r}] = lst")
+            lines.append("    pending.extend(zip(repeat(lst), range(len(v)), v))")
+        else:
+            lines.append(f"    d[{name!r}] = None")
+            if kind == "node":
+                lines.append("    if v is not None:")
+                lines.append(f"        pending.append((d, {name!r}, v))")
+            else:
+                lines.append(f"    pending.append((d, {name!r}, v))")
+    lines += [
+        "    if self.line is not None:",
+        "        d['line'] = self.line",
+        "    if self.col is not None:",
+        "        d['col'] = self.col",
+        "    return d",
+    ]
+    namespace = {"repeat": repeat}
+    exec("\n".join(lines), namespace)
+    shallow = namespace["_shallow_dict"]
+    shallow.__qualname__ = f"{cls.__qualname__}._shallow_dict"
+    shallow.__doc__ = _lazy_shallow_dict.__doc__
+    return shallow
+
+
+def _is_tuple_list(tp) -> bool:
+    """True for annotations like ``List[Tuple[AstNode, Block]]``."""
+    args = get_args(tp)
+    return (
+        get_origin(tp) is list
+        and len(args) == 1
+        and get_origin(args[0]) is tuple
+    )
+
+
+def _compile_loader(cls):
+    """Generate a straight-line loader building ``cls`` from its dict form."""
+    cls._field_names = _serialized_field_names(cls)
+    types = {f.name: f.type for f in fields(cls)}
+    lines = ["def load(d):"]
+    args = ["line=d.get('line')", "col=d.get('col')"]
+    for name in cls._field_names:
+        tp = types[name]
+        kind = _field_kind(tp)
+        local = f"f_{name}"
+        if kind == "scalar":
+            lines.append(f"    {local} = d[{name!r}]")
+        elif kind == "node":
+            lines.append(f"    v = d[{name!r}]")
+            lines.append(f"    {local} = None if v is None else load_node(v)")
+        elif kind == "nodes":
+            lines.append(
+                f"    {local} = "
+                f"[None if x is None else load_node(x) for x in d[{name!r}]]"
+            )
+        elif _is_tuple_list(tp):
+            # JSON has no tuples; restore pairs such as If.elifs.
+            lines.append(
+                f"    {local} = "
+                f"[tuple(load_value(x) for x in item) for item in d[{name!r}]]"
+            )
+        else:
+            lines.append(f"    {local} = load_value(d[{name!r}])")
+        args.append(f"{name}={local}")
+    lines.append(f"    return cls({', '.join(args)})")
+    namespace = {"cls": cls, "load_node": _load_node, "load_value": _load_value}
+    exec("\n".join(lines), namespace)
+    return namespace["load"]
+
+
+def _load_node(data: Dict[str, Any]) -> AstNode:
+    type_name = data["_type"]
+    try:
+        loader = _LOADERS[type_name]
+    except KeyError:
+        loader = _LOADERS[type_name] = _compile_loader(_NODE_CLASSES[type_name])
+    return loader(data)
+
+
+def _load_value(value):
     if isinstance(value, dict):
-        return {k: _convert(v) for k, v in value.items()}
-    return value  # str, int, float, bool, None
+        if "_type" in value:
+            return _load_node(value)
+        return {k: _load_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_load_value(x) for x in value]
+    return value
+
+
+def save_ast(node: AstNode, path) -> None:
+    """Write ``node`` to ``path`` as compact JSON (see ``to_json_bytes``)."""
+    with open(path, "wb") as fh:
+        fh.write(node.to_json_bytes())
+
+
+def load_ast(path) -> AstNode:
+    """Read a tree previously written by ``save_ast``."""
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    if ORJSON_OK:
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the Infinity/NaN literals json writes for us.
+            data = json.loads(raw)
+    else:
+        data = json.loads(raw)
+    return AstNode.from_dict(data)
+
+
+def _freeze_sequence(items, pending: list) -> tuple:
+    """Tuple copy of ``items`` (nested sequences included); queues nodes."""
+    frozen = []
+    for item in items:
+        if isinstance(item, AstNode):
+            pending.append(item)
+        elif isinstance(item, (list, tuple)):
+            item = _freeze_sequence(item, pending)
+        frozen.append(item)
+    return tuple(frozen)
+
+
+# Integer range orjson can encode.
+_ORJSON_INT_MIN = -(2**63)
+_ORJSON_INT_MAX = 2**64 - 1
+
+
+def _convert(value) -> Tuple[Any, bool]:
+    """
+    Convert nodes, lists, tuples and dicts to plain data without recursion.
+
+    Work items are ``(container, key, value)``; each one stores the converted
+    value into ``container[key]`` and queues whatever children it has, so
+    arbitrarily deep trees never hit the interpreter's recursion limit.
+
+    Returns the data and whether orjson can write it faithfully: False when
+    it holds an ``inf``/``nan`` float (orjson writes ``null``) or an integer
+    beyond 64 bits (orjson refuses it). Literal values are the only scalars
+    that reach this loop, as typed fields are copied by ``_shallow_dict``.
+    """
+    orjson_safe = True
+    root = [None]
+    pending = [(root, 0, value)]
+    pop = pending.pop
+    push = pending.append
+    while pending:
+        container, key, value = pop()
+        if isinstance(value, AstNode):
+            container[key] = value._shallow_dict(pending)
+        elif isinstance(value, (list, tuple)):
+            lst = [None] * len(value)
+            container[key] = lst
+            pending.extend(zip(repeat(lst), range(len(value)), value))
+        elif isinstance(value, dict):
+            d = dict.fromkeys(value)
+            container[key] = d
+            for k, v in value.items():
+                push((d, k, v))
+        else:
+            container[key] = value  # str, int, float, bool, None
+            if type(value) is float:
+                if not math.isfinite(value):
+                    orjson_safe = False
+            elif type(value) is int and not (
+                _ORJSON_INT_MIN <= value <= _ORJSON_INT_MAX
+            ):
+                orjson_safe = False
+    return root[0], orjson_safe
+
+
+@dataclass(slots=True)
+class Module(AstNode):
+    """Top-level AST node representing a complete module or file."""
+
+    body: List[AstNode] = field(default_factory=list)
@@ -1,48 +1,60 @@
 """AST nodes for definitions like functions, classes, and modules."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 from .ast_base import AstNode
+from .ast_statements import Block
 
+__all__ = [
+    "FunctionDef",
+    "ClassDef",
+    "Subscript",
+    "Attribute",
+]
 
-@dataclass
+
+@dataclass(slots=True)
 class FunctionDef(AstNode):
     """Function definition: def name(params): body"""
 
     name: str = ""
-    params: List[str] = field(default_factory=list)  # parameter names
-    body: List[AstNode] = field(default_factory=list)  # statements in function
+    params: List[AstNode] = field(default_factory=list)  # parameter identifiers
+    body: Optional[Block] = None  # statements in function
+
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassDef(AstNode):
     """Class definition: class name: body"""
 
     name: str = ""
-    body: List[AstNode] = field(default_factory=list)  # methods and statements
+    body: Optional[Block] = None  # methods and statements
 
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
 
-@dataclass
+
+@dataclass(slots=True)
 class Subscript(AstNode):
     """
     Represents a subscript operation, such as accessing an element of a list or dictionary.
     """
 
-    def __init__(self, value, index, line=None, col=None):
-        self.value = value
-        self.index = index
-        self.line = line
-        self.col = col
+    value: Optional[AstNode] = None
+    index: Optional[AstNode] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Attribute(AstNode):
     """
     Represents an attribute access operation, such as accessing a property of an object.
     """
 
-    def __init__(self, value, attr, line=None, col=None):
-        self.value = value
-        self.attr = attr
-        self.line = line
-        self.col = col
+    value: Optional[AstNode] = None
+    attr: str = ""
+
+    def __post_init__(self):
+        self.attr = sys.intern(self.attr)
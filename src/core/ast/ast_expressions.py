@@ -3,13 +3,27 @@ AST nodes for expressions.
 """
 
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, List, Tuple, Optional
 from .ast_base import AstNode
 
+__all__ = [
+    "LiteralExpr",
+    "Identifier",
+    "UnaryExpr",
+    "BinaryExpr",
+    "ComparisonExpr",
+    "CallExpr",
+    "TupleExpr",
+    "ListExpr",
+    "SetExpr",
+    "DictExpr",
+]
+
 
 # ---------- Atomic expressions ----------
-@dataclass
+@dataclass(slots=True)
 class LiteralExpr(AstNode):
     """
     Represents a literal value(numbers, strings, True/False/None (and basic collections after)).
@@ -17,16 +31,20 @@ class LiteralExpr(AstNode):
     value: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(AstNode):
     """
     Represents an identifier (variable or function name).
     """
     name: str = ""
 
+    def __post_init__(self):
+        # The same names recur throughout a program; keep one copy of each.
+        self.name = sys.intern(self.name)
+
 
 # ---------- Operators ----------
-@dataclass
+@dataclass(slots=True)
 class UnaryExpr(AstNode):
     """
     Represents a unary operation, e.g. -x, +y, not z
@@ -34,8 +52,12 @@ class UnaryExpr(AstNode):
     op: str = ""
     operand: Optional[AstNode] = None
 
+    def __post_init__(self):
+        # Operators come from a small fixed vocabulary; share one string each.
+        self.op = sys.intern(self.op)
+
 
-@dataclass
+@dataclass(slots=True)
 class BinaryExpr(AstNode):
     """
     Represents a binary operation, e.g. x + y, a * b, c ** d
@@ -44,8 +66,11 @@ class BinaryExpr(AstNode):
     op: str = ""  # "PLUS", "MINUS", "TIMES", "POWER", etc. (token o symbol)
     right: Optional[AstNode] = None
 
+    def __post_init__(self):
+        self.op = sys.intern(self.op)
 
-@dataclass
+
+@dataclass(slots=True)
 class ComparisonExpr(AstNode):
     """
     Represents a comparison operation, e.g. x < y, a == b
@@ -55,16 +80,19 @@ class ComparisonExpr(AstNode):
     right: Optional[AstNode] = None
     # Note: could be chained comparisons (a < b < c) but for simplicity, we keep it binary
 
+    def __post_init__(self):
+        self.op = sys.intern(self.op)
+
 
 # ---------- Calls ----------
-@dataclass
+@dataclass(slots=True)
 class CallExpr(AstNode):
     callee: Optional[AstNode] = None  # Identifier, but could be more complex (e.g., obj.method)
     args: List[AstNode] = field(default_factory=list)  # positional arguments
 
 
 # ---------- Collections ----------
-@dataclass
+@dataclass(slots=True)
 class TupleExpr(AstNode):
     """
     Represents a tuple literal, e.g. (1, 2, 3)
@@ -74,7 +102,7 @@ class TupleExpr(AstNode):
     elements: List[AstNode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ListExpr(AstNode):
     """
     Represents a list literal, e.g. [1, 2, 3]
@@ -82,14 +110,14 @@ class ListExpr(AstNode):
 
     elements: List[AstNode] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class SetExpr(AstNode):
     """
     Represents a set literal, e.g. {1, 2, 3}
     """
     elements: List[AstNode] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class DictExpr(AstNode):
     """
     Represents a dictionary literal, e.g. {"a": 1, "b": 2}
@@ -2,11 +2,25 @@
 AST nodes for statements and blocks.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import ClassVar, List, Optional, Tuple
 from .ast_base import AstNode
 
-@dataclass
+__all__ = [
+    "Block",
+    "ExprStmt",
+    "Assign",
+    "Return",
+    "Break",
+    "Continue",
+    "Pass",
+    "If",
+    "While",
+    "For",
+]
+
+@dataclass(slots=True)
 class Block(AstNode):
     """
     Represents a block of statements, such as the body of a function,
@@ -19,7 +33,7 @@ class Block(AstNode):
     statements: List[AstNode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExprStmt(AstNode):
     """
     Represents an expression used as a statement.
@@ -32,7 +46,7 @@ class ExprStmt(AstNode):
     value: Optional[AstNode] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Assign(AstNode):
     """
     Represents an assignment statement.
@@ -51,8 +65,12 @@ class Assign(AstNode):
     op: str = "="
     value: Optional[AstNode] = None
 
+    def __post_init__(self):
+        # Same interning as the expression operators.
+        self.op = sys.intern(self.op)
 
-@dataclass
+
+@dataclass(slots=True)
 class Return(AstNode):
     """
     Represents a return statement in a function.
@@ -68,8 +86,26 @@ class Return(AstNode):
     value: Optional[AstNode] = None
 
 
-@dataclass
-class Break(AstNode):
+class _SharedLeaf:
+    """
+    Mixin for statements that carry nothing but their position.
+
+    ``get()`` hands out one shared instance when no position is given, so
+    position-less Break/Continue/Pass nodes are not allocated per use.
+    """
+
+    __slots__ = ()
+    _singleton: ClassVar[AstNode]
+
+    @classmethod
+    def get(cls, line: Optional[int] = None, col: Optional[int] = None):
+        if line is None and col is None:
+            return cls._singleton
+        return cls(line=line, col=col)
+
+
+@dataclass(slots=True)
+class Break(_SharedLeaf, AstNode):
     """
     Represents a 'break' statement inside a loop.
 
@@ -77,8 +113,8 @@ class Break(AstNode):
         Used to exit the nearest enclosing while or for loop immediately.
     """
 
-@dataclass
-class Continue(AstNode):
+@dataclass(slots=True)
+class Continue(_SharedLeaf, AstNode):
     """
     Represents a 'continue' statement inside a loop.
 
@@ -87,8 +123,8 @@ class Continue(AstNode):
         and continues with the next iteration of the loop.
     """
 
-@dataclass
-class Pass(AstNode):
+@dataclass(slots=True)
+class Pass(_SharedLeaf, AstNode):
     """
     Represents a no-op statement.
 
@@ -96,7 +132,12 @@ class Pass(AstNode):
         'pass' is used as a placeholder where a statement is syntactically required.
     """
 
-@dataclass
+Break._singleton = Break()
+Continue._singleton = Continue()
+Pass._singleton = Pass()
+
+
+@dataclass(slots=True)
 class If(AstNode):
     """
     Represents an if/elif/else conditional statement.
@@ -122,7 +163,7 @@ class If(AstNode):
     orelse: Optional[Block] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class While(AstNode):
     """
     Represents a 'while' loop statement.
@@ -136,7 +177,7 @@ class While(AstNode):
     body: Optional[Block] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class For(AstNode):
     """
     Represents a 'for' loop statement.
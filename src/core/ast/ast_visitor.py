@@ -0,0 +1,128 @@
+"""
+Shared traversal for AST passes.
+
+NodeVisitor dispatches each node to a ``visit_<ClassName>`` method, falling
+back to ``generic_visit``, which walks the node's serialized fields. Later
+passes (pretty-printing, type checking, code generation) subclass it instead
+of re-implementing their own isinstance ladders.
+"""
+
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Type
+
+from .ast_base import AstNode
+
+__all__ = [
+    "NodeVisitor",
+    "ToDictVisitor",
+    "iter_child_nodes",
+    "walk",
+]
+
+
+def iter_child_nodes(node: AstNode) -> Iterator[AstNode]:
+    """Yield the direct child nodes of ``node`` in field order."""
+    for name in node._field_names:
+        value = getattr(node, name)
+        if isinstance(value, AstNode):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                if isinstance(item, AstNode):
+                    yield item
+                elif isinstance(item, tuple):  # (cond, body) / (key, value) pairs
+                    for sub in item:
+                        if isinstance(sub, AstNode):
+                            yield sub
+
+
+def walk(node: AstNode) -> Iterator[AstNode]:
+    """
+    Yield ``node`` and every descendant in pre-order, without recursion.
+
+    Passes that only need to see each node once (counting, collecting names,
+    checks that ignore nesting) can loop over this instead of subclassing
+    NodeVisitor; a single explicit stack replaces one frame per level.
+    """
+    stack = [node]
+    pop = stack.pop
+    while stack:
+        current = pop()
+        yield current
+        children = list(iter_child_nodes(current))
+        children.reverse()
+        stack.extend(children)
+
+
+class NodeVisitor:
+    """
+    Base class for AST walkers.
+
+    The method used for each node class is resolved once per visitor class
+    and stored in a table indexed by the node's ``KIND``, so repeated visits
+    are a list lookup instead of a ``getattr`` string lookup.
+    """
+
+    _handlers: ClassVar[List[Optional[Callable]]] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._handlers = []
+
+    def visit(self, node: AstNode) -> Any:
+        """Visit a node and return whatever its handler returns."""
+        try:
+            method = self._handlers[node.KIND]
+        except IndexError:
+            method = None
+        if method is None:
+            method = type(self)._resolve_handler(type(node))
+        return method(self, node)
+
+    @classmethod
+    def _resolve_handler(cls, node_cls: Type[AstNode]) -> Callable:
+        handlers = cls._handlers
+        if len(handlers) <= node_cls.KIND:
+            handlers.extend([None] * (node_cls.KIND + 1 - len(handlers)))
+        method = getattr(cls, "visit_" + node_cls.__name__, cls.generic_visit)
+        handlers[node_cls.KIND] = method
+        return method
+
+    def generic_visit(self, node: AstNode) -> Any:
+        """Visit every child node reachable from the node's fields."""
+        for name in node._field_names:
+            self._visit_value(getattr(node, name))
+
+    def _visit_value(self, value: Any) -> None:
+        if isinstance(value, AstNode):
+            self.visit(value)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self._visit_value(item)
+
+
+class ToDictVisitor(NodeVisitor):
+    """
+    Visitor equivalent of ``AstNode.to_dict``.
+
+    Produces the same dictionaries; subclasses can override ``visit_<Class>``
+    to customize the output for specific node types.
+    """
+
+    def generic_visit(self, node: AstNode) -> Dict[str, Any]:
+        dictionary = {"_type": node._type_name}
+        for name in node._field_names:
+            dictionary[name] = self._convert(getattr(node, name))
+        if node.line is not None:
+            dictionary["line"] = node.line
+        if node.col is not None:
+            dictionary["col"] = node.col
+        return dictionary
+
+    def _convert(self, value: Any) -> Any:
+        if isinstance(value, AstNode):
+            return self.visit(value)
+        if isinstance(value, (list, tuple)):
+            return [self._convert(x) for x in value]
+        if isinstance(value, dict):
+            return {k: self._convert(v) for k, v in value.items()}
+        return value  # str, int, float, bool, None
@@ -1,37 +1,111 @@
+from array import array
+
+__all__ = ["SymbolTable"]
+
+# Stands for a None line or position in the integer columns.
+_MISSING = -1
+
+
 class SymbolTable:
     """
     Manages a symbol table for identifiers in source code.
 
     Stores symbol names, their positions, and types. Provides methods to add, check, retrieve, and remove symbols.
+
+    Entries are stored column-wise: `_index` maps each symbol to a row of the
+    parallel `_lines`, `_positions` and `_types` columns, so a symbol costs one
+    dict slot and a few array cells instead of two nested dicts. `table` and
+    `get` build the dictionary form on demand, as a snapshot: it costs O(n)
+    (O(1) for `get`) per call and editing it does not change the table. Use
+    `line_of`, `pos_of` and `type_of` for single fields, and `set_type`,
+    `add` and `remove` for changes. Rows of removed symbols are reused by
+    later additions, so the columns never outgrow the table.
     """
 
     def __init__(self):
-        self.table = {}
+        self._index = {}
+        self._lines = array("q")
+        self._positions = array("q")
+        self._types = []
+        self._free_rows = []
 
     def __str__(self):
         return str(self.table)
 
+    @property
+    def table(self):
+        """
+        dict: {symbol: {"Position": {"line", "pos"}, "Type"}} in insertion order.
+
+        A new snapshot is built on every access, so look symbols up with `get`
+        or the `*_of` accessors rather than `table[symbol]`. Changes made to
+        the snapshot are not written back.
+        """
+        return {symbol: self._entry(row) for symbol, row in self._index.items()}
+
+    def _entry(self, row):
+        line = self._lines[row]
+        pos = self._positions[row]
+        return {
+            "Position": {
+                "line": None if line == _MISSING else line,
+                "pos": None if pos == _MISSING else pos,
+            },
+            "Type": self._types[row],
+        }
+
+    def _append(self, symbol, pos, line, tk_type):
+        if line is None:
+            line = _MISSING
+        if pos is None:
+            pos = _MISSING
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._lines[row] = line
+            self._positions[row] = pos
+            self._types[row] = tk_type
+        else:
+            row = len(self._types)
+            self._lines.append(line)
+            self._positions.append(pos)
+            self._types.append(tk_type)
+        self._index[symbol] = row
+
     def add(self, symbol, pos, line, tk_type=None):
         """
         Adds a symbol to the table.
 
         Args:
             symbol (str): The identifier name.
-            pos (int): Position in the source code.
-            line (int): Line number.
+            pos (int or None): Position in the source code (not negative).
+            line (int or None): Line number (not negative).
             tk_type (str, optional): Type of the symbol.
 
         Raises:
             Exception: If the symbol is already declared.
         """
-        if symbol not in self.table:
-            self.table[symbol] = {
-                "Position": {"line": line, "pos": pos},
-                "Type": tk_type,
-            }
+        if symbol not in self._index:
+            self._append(symbol, pos, line, tk_type)
         else:
             raise Exception(f"{symbol} has already been declared")
 
+    def extend(self, entries, tk_type=None):
+        """
+        Adds many symbols at once, keeping existing entries.
+
+        Unlike `add`, a symbol that is already declared is skipped rather than
+        reported, so callers can pass first occurrences without checking.
+
+        Args:
+            entries (iterable): (symbol, (pos, line)) pairs.
+            tk_type (str, optional): Type shared by all the symbols.
+        """
+        index = self._index
+        append = self._append
+        for symbol, (pos, line) in entries:
+            if symbol not in index:
+                append(symbol, pos, line, tk_type)
+
     def exists(self, symbol):
         """
         Checks if a symbol exists in the table.
@@ -42,7 +116,7 @@ class SymbolTable:
         Returns:
             bool: True if symbol exists, False otherwise.
         """
-        return symbol in self.table
+        return symbol in self._index
 
     def get(self, symbol):
         """
@@ -52,15 +126,57 @@ class SymbolTable:
             symbol (str): The identifier name.
 
         Returns:
-            dict: Symbol information.
+            dict: A copy of the symbol information; changing it does not
+            change the table (see `set_type`).
 
         Raises:
             Exception: If the symbol is not declared.
         """
-        if symbol in self.table:
-            return self.table[symbol]
+        return self._entry(self._row(symbol))
 
-        raise Exception(f"{symbol} has not been declared")
+    def line_of(self, symbol):
+        """
+        Returns the line of a symbol's first occurrence (None if unknown).
+
+        Raises:
+            Exception: If the symbol is not declared.
+        """
+        line = self._lines[self._row(symbol)]
+        return None if line == _MISSING else line
+
+    def pos_of(self, symbol):
+        """
+        Returns the position of a symbol's first occurrence (None if unknown).
+
+        Raises:
+            Exception: If the symbol is not declared.
+        """
+        pos = self._positions[self._row(symbol)]
+        return None if pos == _MISSING else pos
+
+    def type_of(self, symbol):
+        """
+        Returns the type of a symbol.
+
+        Raises:
+            Exception: If the symbol is not declared.
+        """
+        return self._types[self._row(symbol)]
+
+    def set_type(self, symbol, tk_type):
+        """
+        Changes the type of a declared symbol.
+
+        Raises:
+            Exception: If the symbol is not declared.
+        """
+        self._types[self._row(symbol)] = tk_type
+
+    def _row(self, symbol):
+        row = self._index.get(symbol)
+        if row is None:
+            raise Exception(f"{symbol} has not been declared")
+        return row
 
     def remove(self, symbol):
         """
@@ -68,5 +184,9 @@ class SymbolTable:
 
         Args:
             symbol (str): The identifier name.
+
+        The symbol's row is kept for reuse by the next addition.
         """
-        del self.table[symbol]
+        row = self._index.pop(symbol)
+        self._types[row] = None
+        self._free_rows.append(row)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+from itertools import accumulate
 from typing import Literal
 
 
@@ -11,8 +13,13 @@ class Error:
         column (int): Column number where the error occurred.
         type (str): Type of error ('lexer', 'parser', or 'semantic').
         data (str, optional): Source code data for context.
+
+    Errors are not changed after construction, so `__repr__` (which formats
+    the source context) is computed once, and equal errors hash equal.
     """
 
+    __slots__ = ("message", "line", "column", "type", "data", "_repr")
+
     def __init__(
         self,
         message,
@@ -26,8 +33,14 @@ class Error:
         self.column = column
         self.type = _type
         self.data = data
+        self._repr = None
 
     def __repr__(self):
+        if self._repr is None:
+            self._repr = self._format()
+        return self._repr
+
+    def _format(self):
         return (
             f"ERROR({self.type.upper()}): {self.message} at line {self.line}, column {self.column}"
             + (
@@ -44,6 +57,8 @@ class Error:
         return f"Error({self.message}, line={self.line}, column={self.column}, _type={self.type})"
 
     def __eq__(self, other):
+        if not isinstance(other, Error):
+            return NotImplemented
         return (
             self.message == other.message
             and self.line == other.line
@@ -51,6 +66,9 @@ class Error:
             and self.type == other.type
         )
 
+    def __hash__(self):
+        return hash((self.message, self.line, self.column, self.type))
+
 
 def get_context(data, lineno, lexpos):
     """
@@ -58,21 +76,44 @@ def get_context(data, lineno, lexpos):
 
     Args:
         data (str): Source code.
-        lineno (int): Line number of the error.
+        lineno (int): Line number of the error; numbers outside the source
+            (such as the 0 of end-of-input errors) select the last line.
         lexpos (int): Position in the source code.
 
     Returns:
         str: Context string with a caret (^) marking the error position.
     """
-    error_line = data.split("\n")[lineno - 1]
+    starts = _line_starts(data)
+    line_count = len(starts) - 1  # the last start is one past the end
+    if not 1 <= lineno <= line_count:
+        # Unknown (EOF errors report line 0) or past the end: show the last line.
+        lineno = line_count
+    start = starts[lineno - 1]
+    error_line = data[start : starts[lineno] - 1]
+    # Length of the text before the error line, without its final newline
+    prefix_len = start - 1 if lineno > 1 else 0
+    stripped = error_line.lstrip()
     where = (
-        error_line.lstrip()
+        stripped
         + "\n"
         + " "
         * (
-            (lexpos - len("\n".join(data.split("\n")[: lineno - 1])))
-            - ((len(error_line) - len(error_line.lstrip())) + 1)
+            (lexpos - prefix_len)
+            - ((len(error_line) - len(stripped)) + 1)
         )
         + "^"
     )
     return where
+
+
+@lru_cache(maxsize=1)
+def _line_starts(data):
+    """
+    Offsets at which each line of `data` starts, plus one past the end.
+
+    Errors of one source are formatted together, so the scan runs once per
+    source instead of once per error.
+    """
+    starts = [0]
+    starts.extend(accumulate(len(line) + 1 for line in data.split("\n")))
+    return starts
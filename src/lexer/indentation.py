@@ -6,9 +6,9 @@ into Python-like INDENT/DEDENT tokens. It is invoked exclusively by the lexer ru
 `t_NEWLINE` and communicates with the lexer through a small, explicit contract.
 
 The lexer instance passed here (`lexer`) MUST provide:
-lexer._indent_stack : list[int]
-Stack of absolute indentation columns. Base level is 0.
-lexer._pending : list[lex.LexToken]
+lexer._indent_stack : array("i")
+    Stack of absolute indentation columns, stored unboxed. Base level is 0.
+lexer._pending : collections.deque[tokens.SyntheticToken]
     FIFO queue where synthesized INDENT/DEDENT tokens are enqueued.
 lexer._expect_indent : bool
     True if the previous token was a ':' outside delimiters, and thus an indent is required.
@@ -17,15 +17,16 @@ lexer._delim_depth : int
 
 """
 
+from bisect import bisect_right
+
+from .tokens import make_token
+
 
 def _expand_tabs_count(s: str, tab_width: int) -> int:
-    col = 0
-    for ch in s:
-        if ch == "\t":
-            col += tab_width - (col % tab_width)
-        else:
-            col += 1
-    return col
+    # Space-only indentation (the common case) needs no expansion at all.
+    if "\t" not in s:
+        return len(s)
+    return len(s.expandtabs(tab_width))
 
 # TODO(any): Refactor
 def process_newline_and_indent(lexer, t, tab_width: int):
@@ -35,16 +36,23 @@ def process_newline_and_indent(lexer, t, tab_width: int):
     `t.value` may contain multiple blank lines. We take the spaces that
     appear after the LAST "\n" to decide the indentation of the next line.
     """
-    # 1. Update line number
-    nl_count = t.value.count("\n")
-    t.lexer.lineno += nl_count
+    # 1. Update line number (blank lines may carry spaces or "\r", so count
+    #    the newlines rather than using the match length)
+    value = t.value
+    t.lexer.lineno += value.count("\n")
+    # Errors and synthetic tokens belong to the line being indented, which
+    # starts after the last "\n" of the match, not to the NEWLINE itself.
+    line_start = value.rfind("\n") + 1
+    lineno = t.lexer.lineno
+    lexpos = t.lexpos + line_start
 
     # 2. If we are inside ()/[]/{}, we ignore structural indentation.
     if getattr(lexer, "_delim_depth", 0) > 0:
         return None
 
-    # 3. Take the spaces/tabs after the last \n (may be an empty string)
-    after_last_nl = t.value.rsplit("\n", 1)[-1]
+    # 3. Take the spaces/tabs after the last \n (may be an empty string);
+    #    slicing from rfind avoids building the list rsplit returns
+    after_last_nl = value[line_start:]
 
     # 4. Look at the following real char (without consuming it)
     data, pos = t.lexer.lexdata, t.lexer.lexpos
@@ -62,7 +70,7 @@ def process_newline_and_indent(lexer, t, tab_width: int):
     if spaces == top:
         # If we came from “:”, I had to increase the indentation.
         if getattr(lexer, "_expect_indent", False):
-            lexer._indent_error("Expected an indented block", t.lineno, t.lexpos)
+            lexer._indent_error("Expected an indented block", lineno, lexpos)
             lexer._expect_indent = False
         return None
 
@@ -70,39 +78,46 @@ def process_newline_and_indent(lexer, t, tab_width: int):
     if spaces > top:
         if spaces % tab_width != 0:
             lexer._indent_error(
-                "Indentation is not a multiple of 4", t.lineno, t.lexpos
+                "Indentation is not a multiple of 4", lineno, lexpos
             )
 
         # If we don't come from “:”, it's unexpected indentation.
         if not getattr(lexer, "_expect_indent", False):
-            lexer._indent_error("Unexpected indent", t.lineno, t.lexpos)
+            lexer._indent_error("Unexpected indent", lineno, lexpos)
 
         # (Optional) If they skip >1 level at once, report it.
         delta = spaces - top
         levels = delta // tab_width
         if getattr(lexer, "_strict_single_step_indent", False) and levels > 1:
             lexer._indent_error(
-                f"Over-indented: increased by {levels} levels", t.lineno, t.lexpos
+                f"Over-indented: increased by {levels} levels", lineno, lexpos
             )
 
         # Store the absolute column of the new level.
         lexer._indent_stack.append(spaces)
-        lexer._pending.append(lexer._make_token("INDENT", "", t.lineno, t.lexpos))
+        lexer._pending.append(make_token("INDENT", "", lineno, lexpos))
         lexer._expect_indent = False
         return None
 
     # 9. Decreased indent: issue DEDENTs until reaching 'spaces'
     if spaces % tab_width != 0:
-        lexer._indent_error("Indentation is not a multiple of 4", t.lineno, t.lexpos)
-
-    while len(lexer._indent_stack) > 1 and lexer._indent_stack[-1] > spaces:
-        lexer._indent_stack.pop()
-        lexer._pending.append(lexer._make_token("DEDENT", "", t.lineno, t.lexpos))
+        lexer._indent_error("Indentation is not a multiple of 4", lineno, lexpos)
+
+    # The stack is strictly increasing, so every level above `spaces` sits in
+    # one tail slice: drop it and queue one DEDENT per dropped level at once.
+    stack = lexer._indent_stack
+    keep = bisect_right(stack, spaces)  # >= 1, the base level 0 always stays
+    dropped = len(stack) - keep
+    if dropped:
+        del stack[keep:]
+        lexer._pending.extend(
+            make_token("DEDENT", "", lineno, lexpos) for _ in range(dropped)
+        )
 
     # If we did not fall exactly on a valid previous level
     if lexer._indent_stack and lexer._indent_stack[-1] != spaces:
         lexer._indent_error(
-            "Unindent does not match any outer indentation level", t.lineno, t.lexpos
+            "Unindent does not match any outer indentation level", lineno, lexpos
         )
 
     lexer._expect_indent = False
@@ -17,8 +17,8 @@ Key features:
     debug (bool): Enable debug output for indentation errors
     errors (list[Error]): Collection of lexical errors found
     symbol_table (SymbolTable): Symbol table tracking identifiers
-    _indent_stack (list[int]): Stack of indentation levels in spaces
-    _pending (list): Queue of pending INDENT/DEDENT tokens
+    _indent_stack (array[int]): Stack of indentation levels in spaces
+    _pending (deque): Queue of pending INDENT/DEDENT tokens
     _at_line_start (bool): Flag for line start position
     _base_token: Original PLY token function
 Regular expression rules defined for:
@@ -36,17 +36,67 @@ Example usage:
         print(token)
 """
 
+import re
+import sys
+from array import array
+from collections import deque
+
 from ply import lex
 
 from ..core.utils import Error
 from ..core.symbol_table import SymbolTable
-from .tokens import TOKENS, KEYWORDS, TAB_WIDTH
+from .tokens import TOKENS, KEYWORDS, TAB_WIDTH, make_token
 from .indentation import process_newline_and_indent  # NUEVO
 
-# Helper sets used by the lexer to track suites and delimiter nesting.
-SUITE_COLON = {"COLON"}  # ':' fuera de delimitadores abre bloque
-OPEN_DELIMS = {"LPAREN", "LBRACKET", "LBRACE"}
-CLOSE_DELIMS = {"RPAREN", "RBRACKET", "RBRACE"}
+# PLY optimize mode skips rule validation and reads prebuilt tables; only
+# used under -O so edits to the rules are always picked up during development.
+_OPTIMIZE = not __debug__
+_LEXTAB = f"{__package__}.lextab"
+
+# Bound once so t_ID does a single call per identifier.
+_keyword_type = KEYWORDS.get
+
+# Single-character tokens that no other rule can start with ('.' is left to
+# PLY because it may begin a number such as `.5`).
+_PUNCTUATION = {
+    ",": "COMMA",
+    ":": "COLON",
+    "(": "LPAREN",
+    ")": "RPAREN",
+    "[": "LBRACKET",
+    "]": "RBRACKET",
+    "{": "LBRACE",
+    "}": "RBRACE",
+}
+
+_LEADING_WS_RE = re.compile(r"[ \t]+")
+
+# Escape sequences recognized inside string literals; anything else is kept as-is.
+_ESCAPES = {
+    "\\\\": "\\",
+    '\\"': '"',
+    "\\'": "'",
+    "\\n": "\n",
+    "\\t": "\t",
+    "\\r": "\r",
+}
+_ESCAPE_RE = re.compile(r"\\[\\\"'ntr]")
+
+
+def _unescape(match):
+    return _ESCAPES[match.group()]
+
+
+# One pattern per quote style, keyed by the opening quote. Each is written as
+# an unrolled loop (plain run, then escape/quote + plain run) so the regex
+# engine never has to choose between overlapping alternatives.
+_STRING_PATTERNS = {
+    '"""': re.compile(r'"""[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""'),
+    "'''": re.compile(r"'''[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''"),
+    '"': re.compile(r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"'),
+    "'": re.compile(r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'"),
+}
+_UNTERMINATED_STRING_RE = re.compile(r'(?:"""|\'\'\'|["\']).+?(?=\n|$)')
 
 
 class Lexer:
@@ -92,17 +142,12 @@ class Lexer:
     t_FLOOR_DIVIDE_ASSIGN = r"\/\/\="
     t_MOD_ASSIGN = r"\%\="
     t_POWER_ASSIGN = r"\*\*="
-    t_LPAREN = r"\("
-    t_RPAREN = r"\)"
-    t_LBRACE = r"\{"
-    t_RBRACE = r"\}"
-    t_LBRACKET = r"\["
-    t_RBRACKET = r"\]"
-    t_COLON = r"\:"
-    t_COMMA = r"\,"
     t_DOT = r"\."
 
-    t_ignore = ""  # global ignore empty because the whitespace is handled by rules.
+    # Inline spaces/tabs are skipped by PLY itself, with no rule call per run.
+    # Indentation never reaches this: `t_NEWLINE` consumes the spaces after each
+    # newline, and `_next_token` handles the first line (`_leading_indent`).
+    t_ignore = " \t"
 
     #   Lifecycle
     def __init__(self, errors: list[Error], debug: bool = False):
@@ -123,10 +168,17 @@ class Lexer:
         self.symbol_table = SymbolTable()
 
         # Indentation state
-        self._indent_stack = [0]  # absolute columns (0, 4, 8, ...)
-        self._pending = []  # queue of synthetic INDENT/DEDENT tokens
+        self._indent_stack = array("i", [0])  # absolute columns (0, 4, 8, ...)
+        self._pending = deque()  # queue of synthetic INDENT/DEDENT tokens
         self._expect_indent = False  # becomes True after ':' outside delimiters
         self._delim_depth = 0  # (), [], {}
+        # First position of each identifier seen since the last `finalize`.
+        self._id_buffer = {}
+        # Single-character punctuation matched without PLY; see `_next_token`.
+        self._punctuation = {
+            char: (type_, getattr(self, "t_" + type_))
+            for char, type_ in _PUNCTUATION.items()
+        }
 
     def build(self):
         """
@@ -135,24 +187,43 @@ class Lexer:
         Captures the original `token` function.
         Installs `_next_token` as the token producer to interleave pending INDENT/DEDENT.
 
+        Under `python -O` PLY runs in optimize mode and loads the rules from the
+        committed `lextab` module instead of re-validating them; regenerate it
+        (delete it and run once with -O) after changing any `t_...` rule.
         """
-        self.lex = lex.lex(module=self)
+        self.lex = lex.lex(module=self, optimize=_OPTIMIZE, lextab=_LEXTAB)
         self._base_token = self.lex.token # TODO(any): Use init() to set up
         self.lex.token = self._next_token
 
     def input(self, data: str):
         """
         Feed source text to the lexer.
-        A leading newline is prepended to ensure the first physical line passes through
-        `t_NEWLINE`, which is where indentation is evaluated and the base indent (0)
-        is asserted.
+        The text is passed through unchanged, so line numbers and positions refer
+        to `data` itself. Indentation on the first physical line is evaluated by
+        `_leading_indent`, since no newline precedes it.
+
+        Line numbering and indentation state start over, so one built lexer can
+        be reused for several inputs. The symbol table keeps accumulating.
 
         """
         self.data = data
-        if not data.startswith("\n"):
-            data = "\n" + data
+        self._indent_stack = array("i", [0])
+        self._pending.clear()
+        self._expect_indent = False
+        self._delim_depth = 0
+        self.lex.lineno = 1
         self.lex.input(data)
 
+    def finalize(self):
+        """
+        Registers the identifiers buffered by `t_ID` in the symbol table.
+        Runs automatically when PLY reaches the end of the input; call it only
+        to inspect the symbol table before lexing has finished.
+
+        """
+        self.symbol_table.extend(self._id_buffer.items(), "identifier")
+        self._id_buffer.clear()
+
     def _next_token(self):
         """
         Token source that can also emit extra INDENT/DEDENT tokens.
@@ -162,7 +233,23 @@ class Lexer:
         """
         while True:
             if self._pending:
-                return self._pending.pop(0)
+                return self._pending.popleft()
+
+            # Fast path: punctuation that no other rule can start with is
+            # emitted directly through its rule, skipping PLY's master regex.
+            lexer = self.lex
+            pos = lexer.lexpos
+            data = lexer.lexdata
+            if pos < len(data):
+                char = data[pos]
+                entry = self._punctuation.get(char)
+                if entry is not None:
+                    type_, rule = entry
+                    lexer.lexpos = pos + 1
+                    return rule(make_token(type_, char, lexer.lineno, pos, lexer))
+                if pos == 0 and char in " \t":
+                    self._leading_indent()
+                    continue
 
             tok = self._base_token()
 
@@ -171,39 +258,26 @@ class Lexer:
                     return None
                 continue
 
-            if tok.type in OPEN_DELIMS:
-                self._delim_depth += 1
-            elif tok.type in CLOSE_DELIMS:
-                if self._delim_depth > 0:
-                    self._delim_depth -= 1
-            if tok.type in SUITE_COLON and self._delim_depth == 0:
-                self._expect_indent = True
-
             if self._pending:
                 self._pending.append(tok)
-                return self._pending.pop(0)
+                return self._pending.popleft()
 
             return tok
 
-    # ---- Internal helpers (also used by `.indentation`) ----
-    def _make_token(self, type_, value, lineno, lexpos):
+    def _leading_indent(self):
         """
-        Creates and returns a LexToken object with the specified attributes.
-        Args:
-            type_ (str): The type/category of the token
-            value: The actual value/text of the token
-            lineno (int): The line number where the token appears
-            lexpos (int): The position/index where the token starts in the input
-        Returns:
-            lex.LexToken: A token object containing the specified type, value, line number and position
+        Evaluates indentation on the first physical line.
+        `t_ignore` would otherwise skip it, and no newline precedes it for
+        `t_NEWLINE` to pick it up from.
+
         """
-        tok = lex.LexToken()
-        tok.type = type_
-        tok.value = value
-        tok.lineno = lineno
-        tok.lexpos = lexpos
-        return tok
+        lexer = self.lex
+        match = _LEADING_WS_RE.match(lexer.lexdata)
+        tok = make_token("WS", match.group(), lexer.lineno, 0, lexer)
+        lexer.lexpos = match.end()
+        process_newline_and_indent(self, tok, TAB_WIDTH)
 
+    # ---- Internal helpers (also used by `.indentation`) ----
     def _indent_error(self, msg, lineno, lexpos):
         """
         Reports an indentation error during lexical analysis.
@@ -222,48 +296,66 @@ class Lexer:
     # ---- PLY rules (t_...) ----
     def t_ID(self, t):
         r"[A-Za-z_][A-Za-z0-9_]*"
-        t.type = self.keywords.get(t.value, "ID")
+        t.type = _keyword_type(t.value, "ID")
         if t.type == "ID":
-            # Optional: symbol table registration (kept as in your base)
-            try:
-                self.symbol_table.add(t.value, t.lexpos, t.lineno, "identifier")
-            except Exception:
-                pass
+            # Repeated names become one shared string, so symbol-table lookups
+            # and the Identifier nodes built from them compare by identity.
+            t.value = sys.intern(t.value)
+            # Remember only the first occurrence; the symbol table is filled in
+            # one batch at EOF (see `finalize`), keeping method calls off this path.
+            ids = self._id_buffer
+            if t.value not in ids:
+                ids[t.value] = (t.lexpos, t.lineno)
         return t
 
-    def t_WS(self, t):
-        r"[ \t]+"
-        # NOTE: Inline spaces/tabs are ignored. Indentation at line start is handled in `t_NEWLINE`.
-        return None
-
     def t_COMMENT(self, t):
         r"\#.*"
         return None
 
     def t_STRING(self, t):
-        r"(?:\"\"\"(?:[^\"\\]|\\.|\"(?!\"\"))*\"\"\"|\'\'\'(?:[^\'\\]|\\.|\'(?!\'\'))*\'\'\'|\"(?:[^\"\\\n]|\\.)*\"|\'(?:[^\'\\\n]|\\.)*\')"
-        if t.value.startswith('"""') or t.value.startswith("'''"):
-            content = t.value[3:-3]  # Triple quotes - multiline OK
-        else:
-            content = t.value[1:-1]  # Single/double quotes
-
-        # Process basic escapes
-        content = (
-            content.replace(r"\\", "\\")
-            .replace(r"\"", '"')
-            .replace(r"\'", "'")
-            .replace(r"\n", "\n")
-            .replace(r"\t", "\t")
-            .replace(r"\r", "\r")
-        )
+        r"[\"']"
+        # NOTE: Only the opening quote is matched here; the literal itself is
+        #       matched by the pattern for that quote style (see _STRING_PATTERNS),
+        #       trying the triple-quoted form first.
+        data, start = t.lexer.lexdata, t.lexpos
+        match = None
+        opener = data[start : start + 3]
+        if opener == '"""' or opener == "'''":
+            match = _STRING_PATTERNS[opener].match(data, start)
+            quote_len = 3
+        if match is None:
+            match = _STRING_PATTERNS[t.value].match(data, start)
+            quote_len = 1
+
+        if match is None:
+            return self._unterminated_string(t)
+
+        t.lexer.lexpos = match.end()
+        content = match.group()[quote_len:-quote_len]
+        # Process basic escapes in a single left-to-right pass, so an escaped
+        # backslash is never re-read as the start of another escape. Most
+        # literals have no backslash at all and skip the regex entirely.
+        if "\\" in content:
+            content = _ESCAPE_RE.sub(_unescape, content)
         t.value = content
         return t
 
-    def t_error_unterminated_string(self, t):
-        r'(?:"""|\'\'\'|["\']).+?(?=\n|$)'
+    def _unterminated_string(self, t):
+        """
+        Reports a string literal with no closing quote and skips the rest of its
+        line. A lone quote at the end of a line is reported as an illegal character.
+        """
+        match = _UNTERMINATED_STRING_RE.match(t.lexer.lexdata, t.lexpos)
+        if match is None:
+            # Same report as `t_error`; the quote itself is already consumed.
+            msg = f"Illegal character '{t.value}'"
+            self.errors.append(Error(msg, t.lineno, t.lexpos, "lexer", self.data))
+            return None
         msg = "Unterminated string literal"
         self.errors.append(Error(msg, t.lineno, t.lexpos, "lexer", self.data))
-        t.lexer.skip(len(t.value))
+        # Recovery resumes right after the broken literal, at the end of its
+        # line, so the next line is lexed in full.
+        t.lexer.lexpos = match.end()
         return None
 
     def t_NEWLINE(self, t):
@@ -273,12 +365,65 @@ class Lexer:
         process_newline_and_indent(self, t, TAB_WIDTH)
         return None
 
-    def t_NUMBER(self, t):
-        r"((\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?)"
-        if "." in t.value or "e" in t.value or "E" in t.value:
-            t.value = float(t.value)
-        else:
-            t.value = int(t.value)
+    # Numbers are split into two rules so the regex that matched already says
+    # which conversion applies. Both emit NUMBER; t_FLOAT must come first.
+    def t_FLOAT(self, t):
+        r"(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+"
+        t.type = "NUMBER"
+        t.value = float(t.value)
+        return t
+
+    def t_INT(self, t):
+        r"\d+"
+        t.type = "NUMBER"
+        t.value = int(t.value)
+        return t
+
+    # Delimiters and ':' are function rules so that delimiter nesting and
+    # suite tracking are updated as they are matched, instead of by a set
+    # lookup on every token in `_next_token`.
+    def t_LPAREN(self, t):
+        r"\("
+        self._delim_depth += 1
+        return t
+
+    def t_RPAREN(self, t):
+        r"\)"
+        if self._delim_depth > 0:
+            self._delim_depth -= 1
+        return t
+
+    def t_LBRACE(self, t):
+        r"\{"
+        self._delim_depth += 1
+        return t
+
+    def t_RBRACE(self, t):
+        r"\}"
+        if self._delim_depth > 0:
+            self._delim_depth -= 1
+        return t
+
+    def t_LBRACKET(self, t):
+        r"\["
+        self._delim_depth += 1
+        return t
+
+    def t_RBRACKET(self, t):
+        r"\]"
+        if self._delim_depth > 0:
+            self._delim_depth -= 1
+        return t
+
+    def t_COMMA(self, t):
+        r"\,"
+        return t
+
+    def t_COLON(self, t):
+        r"\:"
+        # A ':' outside delimiters opens a suite.
+        if self._delim_depth == 0:
+            self._expect_indent = True
         return t
 
     def t_error(self, t):
@@ -305,12 +450,15 @@ class Lexer:
             The (unused) token object provided by PLY at EOF.
 
         """
+        if self._id_buffer:
+            self.finalize()
+
         if self._pending:
-            return self._pending.pop(0)
+            return self._pending.popleft()
 
         if len(self._indent_stack) > 1:
             self._indent_stack.pop()
-            return self._make_token(
+            return make_token(
                 "DEDENT",
                 "",
                 getattr(self.lex, "lineno", 1),
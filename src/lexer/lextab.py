@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ASSIGN', 'BREAK', 'CLASS', 'COLON', 'COMMA', 'CONTINUE', 'DEDENT', 'DEF', 'DIVIDE', 'DIVIDE_ASSIGN', 'DOT', 'ELIF', 'ELSE', 'EQUALS', 'FALSE', 'FLOOR_DIVIDE', 'FLOOR_DIVIDE_ASSIGN', 'FOR', 'GREATER_THAN', 'GREATER_THAN_EQUALS', 'ID', 'IF', 'IN', 'INDENT', 'LBRACE', 'LBRACKET', 'LESS_THAN', 'LESS_THAN_EQUALS', 'LPAREN', 'MINUS', 'MINUS_ASSIGN', 'MOD', 'MOD_ASSIGN', 'NEWLINE', 'NONE', 'NOT', 'NOT_EQUALS', 'NUMBER', 'OR', 'PASS', 'PLUS', 'PLUS_ASSIGN', 'POWER', 'POWER_ASSIGN', 'RBRACE', 'RBRACKET', 'RETURN', 'RPAREN', 'STRING', 'TIMES', 'TIMES_ASSIGN', 'TRUE', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_ID>[A-Za-z_][A-Za-z0-9_]*)|(?P<t_COMMENT>\\#.*)|(?P<t_STRING>[\\"\'])|(?P<t_NEWLINE>(?:\\r?\\n[ \\t]*)+)|(?P<t_FLOAT>(?:\\d+\\.\\d*|\\.\\d+)(?:[eE][+-]?\\d+)?|\\d+[eE][+-]?\\d+)|(?P<t_INT>\\d+)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_COMMA>\\,)|(?P<t_COLON>\\:)|(?P<t_FLOOR_DIVIDE_ASSIGN>\\/\\/\\=)|(?P<t_POWER_ASSIGN>\\*\\*=)|(?P<t_DIVIDE_ASSIGN>\\/\\=)|(?P<t_EQUALS>\\=\\=)|(?P<t_FLOOR_DIVIDE>\\/\\/)|(?P<t_GREATER_THAN_EQUALS>\\>\\=)|(?P<t_LESS_THAN_EQUALS>\\<\\=)|(?P<t_MINUS_ASSIGN>\\-\\=)|(?P<t_MOD_ASSIGN>\\%\\=)|(?P<t_NOT_EQUALS>\\!\\=)|(?P<t_PLUS_ASSIGN>\\+\\=)|(?P<t_POWER>\\*\\*)|(?P<t_TIMES_ASSIGN>\\*\\=)|(?P<t_ASSIGN>\\=)|(?P<t_DIVIDE>\\/)|(?P<t_DOT>\\.)|(?P<t_GREATER_THAN>\\>)|(?P<t_LESS_THAN>\\<)|(?P<t_MINUS>\\-)|(?P<t_MOD>\\%)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)', [None, ('t_ID', 'ID'), ('t_COMMENT', 'COMMENT'), ('t_STRING', 'STRING'), ('t_NEWLINE', 'NEWLINE'), ('t_FLOAT', 'FLOAT'), ('t_INT', 'INT'), ('t_LPAREN', 'LPAREN'), ('t_RPAREN', 'RPAREN'), ('t_LBRACE', 'LBRACE'), ('t_RBRACE', 'RBRACE'), ('t_LBRACKET', 'LBRACKET'), ('t_RBRACKET', 'RBRACKET'), ('t_COMMA', 'COMMA'), ('t_COLON', 'COLON'), (None, 'FLOOR_DIVIDE_ASSIGN'), (None, 'POWER_ASSIGN'), (None, 'DIVIDE_ASSIGN'), (None, 'EQUALS'), (None, 'FLOOR_DIVIDE'), (None, 'GREATER_THAN_EQUALS'), (None, 'LESS_THAN_EQUALS'), (None, 'MINUS_ASSIGN'), (None, 'MOD_ASSIGN'), (None, 'NOT_EQUALS'), (None, 'PLUS_ASSIGN'), (None, 'POWER'), (None, 'TIMES_ASSIGN'), (None, 'ASSIGN'), (None, 'DIVIDE'), (None, 'DOT'), (None, 'GREATER_THAN'), (None, 'LESS_THAN'), (None, 'MINUS'), (None, 'MOD'), (None, 'PLUS'), (None, 'TIMES')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {'INITIAL': 't_eof'}
@@ -73,3 +73,43 @@ TOKENS = (
         "NEWLINE",
     )
 )
+
+
+class SyntheticToken:
+    """
+    Token built outside PLY's master regex (INDENT/DEDENT, EOF dedents and
+    the lexer's punctuation fast path).
+    Exposes the same fields and repr as ``ply.lex.LexToken`` but uses slots,
+    so indentation-heavy sources do not allocate a dict per token.
+    """
+
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, type_, value, lineno, lexpos, lexer=None):
+        self.type = type_
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.lexer = lexer
+
+    def __str__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+    __repr__ = __str__
+
+
+def make_token(type_, value, lineno, lexpos, lexer=None):
+    """
+    Creates a token that is not produced by PLY's master regex.
+    Synthetic tokens (INDENT/DEDENT) leave `lexer` unset; tokens handed to a
+    PLY rule function must pass it, since rules read `t.lexer`.
+    Args:
+        type_ (str): The type/category of the token
+        value: The actual value/text of the token
+        lineno (int): The line number where the token appears
+        lexpos (int): The position/index where the token starts in the input
+        lexer (lex.Lexer, optional): The PLY lexer, as set on rule tokens
+    Returns:
+        SyntheticToken: A token object containing the specified type, value, line number and position
+    """
+    return SyntheticToken(type_, value, lineno, lexpos, lexer)
@@ -86,7 +86,11 @@ class Parser(
         self.lexer = Lexer(errors=self.errors, debug=self.debug)
         self.lexer.build()
 
-        self._parser = yacc.yacc(module=self, start="module", debug=self.debug)
+        # Under -O, trust the committed parsetab without re-checking the grammar
+        # signature.
+        self._parser = yacc.yacc(
+            module=self, start="module", debug=self.debug, optimize=not __debug__
+        )
 
     def parse(self, text: str) -> AstNode:
         """
@@ -137,7 +141,8 @@ class Parser(
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     # ---------------------- ERRORS catching and recovery ----------------------
 
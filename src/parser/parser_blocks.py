@@ -19,16 +19,14 @@ class BlockRules:
             statement = p[1]
             p[0] = Block(
                 statements=[statement],
-                line=getattr(statement, "line", None),
-                col=getattr(statement, "col", None),
+                line=statement.line,
+                col=statement.col,
             )
         else:
             statements = p[2]
             if statements:
-                p[0] = Block(
-                    statements=statements,
-                    line=getattr(statements[0], "line", None),
-                    col=getattr(statements[0], "col", None),
-                )
+                # Statements are always AstNodes, so line/col always exist.
+                first = statements[0]
+                p[0] = Block(statements=statements, line=first.line, col=first.col)
             else:
                 p[0] = Block(statements=[])
@@ -12,7 +12,7 @@ class ConditionalRules:
         if len(p) == 1:
             p[0] = []
         else:
-            p[0] = [(p[2], p[4])] + p[5]
+            p[0] = [(p[2], p[4]), *p[5]]
 
     def p_else_block_opt(self, p):
         """else_block_opt : ELSE COLON suite
@@ -1,4 +1,4 @@
-from ..core.ast import FunctionDef, ClassDef, Block, Identifier
+from ..core.ast import FunctionDef, ClassDef, Identifier
 from .parser_utils import _pos
 
 
@@ -8,27 +8,27 @@ class DefinitionRules:
     def p_funcdef(self, p):
         "funcdef : DEF ID LPAREN param_list_opt RPAREN COLON suite"
         line, col = _pos(p, 1)
-        # TODO(Andres): Suite already returns a Block, so this check is redundant.
-        body = Block(statements=p[7]) if not isinstance(p[7], Block) else p[7]
-        p[0] = FunctionDef(name=p[2], params=p[4], body=body, line=line, col=col)
+        p[0] = FunctionDef(name=p[2], params=p[4], body=p[7], line=line, col=col)
 
     def p_classdef(self, p):
         "classdef : CLASS ID COLON suite"
         line, col = _pos(p, 1)
-        # TODO(Andres): Suite already returns a Block, so this check is redundant.
-        body = Block(statements=p[4]) if not isinstance(p[4], Block) else p[4]
-        p[0] = ClassDef(name=p[2], body=body, line=line, col=col)
+        p[0] = ClassDef(name=p[2], body=p[4], line=line, col=col)
 
     def p_param_list_opt(self, p):
-        """param_list_opt : param COMMA param_list_opt
-        | param
+        """param_list_opt : param_list
+        | param_list COMMA
         |"""
-        if len(p) == 1:  # empty
-            p[0] = []
-        elif len(p) == 2:  # single param
+        p[0] = p[1] if len(p) > 1 else []
+
+    def p_param_list(self, p):
+        """param_list : param
+        | param_list COMMA param"""
+        if len(p) == 2:
             p[0] = [p[1]]
-        else:  # param COMMA param_list_opt
-            p[0] = [p[1]] + p[3]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_param(self, p):
         """param : ID
@@ -178,22 +178,18 @@ class ExpressionRules:
         p[0] = UnaryExpr(op="NOT", operand=p[2], line=line, col=col)
 
     # ---------------------- BINARY OPERATORS ----------------------
-    def p_expr_power(self, p):
-        "expr : expr POWER expr %prec POWER"
-        line, col = _pos(p, 1)
-        p[0] = BinaryExpr(left=p[1], op="**", right=p[3], line=line, col=col)
-
-    def p_expr_multiplicative(self, p):
-        """expr : expr TIMES expr
+    # One rule for every operator that builds a BinaryExpr: the actions were
+    # identical, and the precedence table alone decides how they group.
+    def p_expr_binary(self, p):
+        """expr : expr POWER expr
+        | expr TIMES expr
         | expr DIVIDE expr
         | expr FLOOR_DIVIDE expr
-        | expr MOD expr"""
-        line, col = _pos(p, 1)
-        p[0] = BinaryExpr(left=p[1], op=p[2], right=p[3], line=line, col=col)
-
-    def p_expr_additive(self, p):
-        """expr : expr PLUS expr
-        | expr MINUS expr"""
+        | expr MOD expr
+        | expr PLUS expr
+        | expr MINUS expr
+        | expr AND expr
+        | expr OR expr"""
         line, col = _pos(p, 1)
         p[0] = BinaryExpr(left=p[1], op=p[2], right=p[3], line=line, col=col)
 
@@ -209,13 +205,6 @@ class ExpressionRules:
         line, col = _pos(p, 1)
         p[0] = ComparisonExpr(left=p[1], op=p[2], right=p[3], line=line, col=col)
 
-    # ---------------------- LOGICAL OPERATORS ----------------------
-    def p_expr_logical(self, p):
-        """expr : expr AND expr
-        | expr OR expr"""
-        line, col = _pos(p, 1)
-        p[0] = BinaryExpr(left=p[1], op=p[2], right=p[3], line=line, col=col)
-
     # ---------------------- FUNCTION CALLS ----------------------
     def p_expr_call(self, p):
         "expr : atom LPAREN arg_list_opt RPAREN"
@@ -224,24 +213,31 @@ class ExpressionRules:
 
     # ---------------------- EXPRESSION LISTS ----------------------
     def p_arg_list_opt(self, p):
-        """arg_list_opt : expr COMMA arg_list_opt
-        | expr"""
-        if len(p) == 2:
-            p[0] = [p[1]]
-        else:
-            p[0] = [p[1]] + p[3]
+        """arg_list_opt : arg_list
+        | arg_list COMMA"""
+        p[0] = p[1]
 
     def p_arg_list_opt_empty(self, p):
         "arg_list_opt :"
         p[0] = []
 
+    def p_arg_list(self, p):
+        """arg_list : expr
+        | arg_list COMMA expr"""
+        if len(p) == 2:
+            p[0] = [p[1]]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
+
     def p_key_value_list(self, p):
         """key_value_list : key_value
-        | key_value COMMA key_value_list"""
+        | key_value_list COMMA key_value"""
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = [p[1]] + p[3]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_key_value_list_opt(self, p):
         """key_value_list_opt : key_value_list
@@ -263,7 +259,8 @@ class ExpressionRules:
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_empty(self, p):
         "empty :"
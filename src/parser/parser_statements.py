@@ -105,12 +105,12 @@ class StatementRules:
 
     def p_break_stmt(self, p):
         "break_stmt : BREAK"
-        p[0] = Break()
+        p[0] = Break.get()
 
     def p_continue_stmt(self, p):
         "continue_stmt : CONTINUE"
-        p[0] = Continue()
+        p[0] = Continue.get()
 
     def p_pass_stmt(self, p):
         "pass_stmt : PASS"
-        p[0] = Pass()
+        p[0] = Pass.get()
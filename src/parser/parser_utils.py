@@ -1,3 +1,6 @@
 def _pos(p, i) -> tuple[int, int]:
     """Returns approximate (line, col) for the i-th symbol of the production."""
-    return p.lineno(i), p.lexpos(i)
+    # Same lookups as p.lineno(i) / p.lexpos(i), without two method calls.
+    # Nonterminals carry no position unless PLY tracking is on, hence the 0s.
+    sym = p.slice[i]
+    return getattr(sym, "lineno", 0), getattr(sym, "lexpos", 0)
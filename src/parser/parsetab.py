@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'moduleleftORleftANDleftEQUALSNOT_EQUALSLESS_THANLESS_THAN_EQUALSGREATER_THANGREATER_THAN_EQUALSleftPLUSMINUSleftTIMESDIVIDEFLOOR_DIVIDEMODrightUPLUSUMINUSNOTrightPOWERAND ASSIGN BREAK CLASS COLON COMMA CONTINUE DEDENT DEF DIVIDE DIVIDE_ASSIGN DOT ELIF ELSE EQUALS FALSE FLOOR_DIVIDE FLOOR_DIVIDE_ASSIGN FOR GREATER_THAN GREATER_THAN_EQUALS ID IF IN INDENT LBRACE LBRACKET LESS_THAN LESS_THAN_EQUALS LPAREN MINUS MINUS_ASSIGN MOD MOD_ASSIGN NEWLINE NONE NOT NOT_EQUALS NUMBER OR PASS PLUS PLUS_ASSIGN POWER POWER_ASSIGN RBRACE RBRACKET RETURN RPAREN STRING TIMES TIMES_ASSIGN TRUE WHILEif_stmt : IF expr COLON suite elif_blocks else_block_optcompound_statement : if_stmt\n        | while_stmt\n        | for_stmt\n        | funcdef\n        | classdeffuncdef : DEF ID LPAREN param_list_opt RPAREN COLON suitewhile_stmt : WHILE expr COLON suiteelif_blocks : ELIF expr COLON suite elif_blocks\n        |for_stmt : FOR ID IN expr COLON suitesuite : simple_statement\n        | INDENT statement_list DEDENTclassdef : CLASS ID COLON suiteelse_block_opt : ELSE COLON suite\n        |statement : simple_statement\n        | compound_statementparam_list_opt : param COMMA param_list_opt\n        | param\n        |expr : atomexpr : LPAREN expr RPARENsimple_statement : small_stmtatom : atom DOT IDsmall_stmt : assignment\n        | return_stmt\n        | break_stmt\n        | continue_stmt\n        | pass_stmt\n        | exprparam : ID\n        | ID ASSIGN expratom : NUMBERatom : STRINGassignment : assign_targets ASSIGN expr\n        | assign_targets PLUS_ASSIGN expr\n        | assign_targets MINUS_ASSIGN expr\n        | assign_targets TIMES_ASSIGN expr\n        | assign_targets DIVIDE_ASSIGN expr\n        | assign_targets FLOOR_DIVIDE_ASSIGN expr\n        | assign_targets MOD_ASSIGN expr\n        | assign_targets POWER_ASSIGN expratom : TRUEatom : FALSEatom : NONEatom : IDassign_targets : assign_targets ASSIGN target\n        | targetatom : LPAREN elements_opt RPARENtarget : ID\n        | LPAREN elements_opt RPAREN\n        | LBRACKET elements_opt RBRACKET\n        | target LBRACKET expr RBRACKET\n        | target DOT IDatom : LBRACKET elements_opt RBRACKETatom : atom LBRACKET expr RBRACKETatom : LBRACE key_value_list_opt RBRACEatom : atom LBRACKET subscript_item RBRACKETreturn_stmt : RETURN expr\n        | RETURNsubscript_item : exprsubscript_item : opt_expr COLON opt_exprbreak_stmt : BREAKsubscript_item : opt_expr COLON opt_expr COLON opt_exprcontinue_stmt : CONTINUEpass_stmt : PASSsubscript_item : COLON opt_exprsubscript_item : opt_expr COLONsubscript_item : COLONmodule : statement_listsubscript_item : COLON COLON opt_exprstatement_list : statement\n        | statement_list statementopt_expr :opt_expr : expratom : LBRACE set_elements RBRACEset_elements : exprset_elements : set_elements COMMA exprset_elements : set_elements COMMAexpr : PLUS expr %prec UPLUSexpr : MINUS expr %prec UMINUSexpr : NOT exprexpr : expr POWER expr %prec POWERexpr : expr TIMES expr\n        | expr DIVIDE expr\n        | expr FLOOR_DIVIDE expr\n        | expr MOD exprexpr : expr PLUS expr\n        | expr MINUS exprexpr : expr EQUALS expr\n        | expr NOT_EQUALS expr\n        | expr LESS_THAN expr\n        | expr LESS_THAN_EQUALS expr\n        | expr GREATER_THAN expr\n        | expr GREATER_THAN_EQUALS expr\n        | expr IN exprexpr : expr AND expr\n        | expr OR exprexpr : atom LPAREN arg_list_opt RPARENarg_list_opt : expr COMMA arg_list_opt\n        | exprarg_list_opt :key_value_list : key_value\n        | key_value COMMA key_value_listkey_value_list_opt : key_value_list\n        | emptykey_value : expr COLON exprelements_opt : elements\n        | emptyelements : expr\n        | elements COMMA exprempty :'
+_lr_signature = 'moduleleftORleftANDleftEQUALSNOT_EQUALSLESS_THANLESS_THAN_EQUALSGREATER_THANGREATER_THAN_EQUALSleftPLUSMINUSleftTIMESDIVIDEFLOOR_DIVIDEMODrightUPLUSUMINUSNOTrightPOWERAND ASSIGN BREAK CLASS COLON COMMA CONTINUE DEDENT DEF DIVIDE DIVIDE_ASSIGN DOT ELIF ELSE EQUALS FALSE FLOOR_DIVIDE FLOOR_DIVIDE_ASSIGN FOR GREATER_THAN GREATER_THAN_EQUALS ID IF IN INDENT LBRACE LBRACKET LESS_THAN LESS_THAN_EQUALS LPAREN MINUS MINUS_ASSIGN MOD MOD_ASSIGN NEWLINE NONE NOT NOT_EQUALS NUMBER OR PASS PLUS PLUS_ASSIGN POWER POWER_ASSIGN RBRACE RBRACKET RETURN RPAREN STRING TIMES TIMES_ASSIGN TRUE WHILEif_stmt : IF expr COLON suite elif_blocks else_block_optcompound_statement : if_stmt\n        | while_stmt\n        | for_stmt\n        | funcdef\n        | classdeffuncdef : DEF ID LPAREN param_list_opt RPAREN COLON suitewhile_stmt : WHILE expr COLON suiteelif_blocks : ELIF expr COLON suite elif_blocks\n        |for_stmt : FOR ID IN expr COLON suiteclassdef : CLASS ID COLON suitesuite : simple_statement\n        | INDENT statement_list DEDENTelse_block_opt : ELSE COLON suite\n        |param_list_opt : param_list\n        | param_list COMMA\n        |statement : simple_statement\n        | compound_statementexpr : atomparam_list : param\n        | param_list COMMA paramexpr : LPAREN expr RPARENsimple_statement : small_stmtatom : atom DOT IDsmall_stmt : assignment\n        | return_stmt\n        | break_stmt\n        | continue_stmt\n        | pass_stmt\n        | exprparam : ID\n        | ID ASSIGN expratom : NUMBERatom : STRINGassignment : assign_targets ASSIGN expr\n        | assign_targets PLUS_ASSIGN expr\n        | assign_targets MINUS_ASSIGN expr\n        | assign_targets TIMES_ASSIGN expr\n        | assign_targets DIVIDE_ASSIGN expr\n        | assign_targets FLOOR_DIVIDE_ASSIGN expr\n        | assign_targets MOD_ASSIGN expr\n        | assign_targets POWER_ASSIGN expratom : TRUEatom : FALSEatom : NONEatom : IDassign_targets : assign_targets ASSIGN target\n        | targetatom : LPAREN elements_opt RPARENtarget : ID\n        | LPAREN elements_opt RPAREN\n        | LBRACKET elements_opt RBRACKET\n        | target LBRACKET expr RBRACKET\n        | target DOT IDatom : LBRACKET elements_opt RBRACKETatom : atom LBRACKET expr RBRACKETatom : LBRACE key_value_list_opt RBRACEatom : atom LBRACKET subscript_item RBRACKETreturn_stmt : RETURN expr\n        | RETURNsubscript_item : exprsubscript_item : opt_expr COLON opt_exprbreak_stmt : BREAKsubscript_item : opt_expr COLON opt_expr COLON opt_exprcontinue_stmt : CONTINUEpass_stmt : PASSsubscript_item : COLON opt_exprsubscript_item : opt_expr COLONsubscript_item : COLONsubscript_item : COLON COLON opt_exprmodule : statement_listopt_expr :statement_list : statement\n        | statement_list statementopt_expr : expratom : LBRACE set_elements RBRACEset_elements : exprset_elements : set_elements COMMA exprset_elements : set_elements COMMAexpr : PLUS expr %prec UPLUSexpr : MINUS expr %prec UMINUSexpr : NOT exprexpr : expr POWER expr\n        | expr TIMES expr\n        | expr DIVIDE expr\n        | expr FLOOR_DIVIDE expr\n        | expr MOD expr\n        | expr PLUS expr\n        | expr MINUS expr\n        | expr AND expr\n        | expr OR exprexpr : expr EQUALS expr\n        | expr NOT_EQUALS expr\n        | expr LESS_THAN expr\n        | expr LESS_THAN_EQUALS expr\n        | expr GREATER_THAN expr\n        | expr GREATER_THAN_EQUALS expr\n        | expr IN exprexpr : atom LPAREN arg_list_opt RPARENarg_list_opt : arg_list\n        | arg_list COMMAarg_list_opt :arg_list : expr\n        | arg_list COMMA exprkey_value_list : key_value\n        | key_value_list COMMA key_valuekey_value_list_opt : key_value_list\n        | emptykey_value : expr COLON exprelements_opt : elements\n        | emptyelements : expr\n        | elements COMMA exprempty :'
     
-_lr_action_items = {'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,183,184,188,191,192,199,201,202,203,],[18,18,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,18,-50,-56,-8,-14,-100,-57,-59,-16,18,-50,-56,-1,-13,-11,-7,-15,-10,-9,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,183,184,188,191,192,199,201,202,203,],[19,19,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,19,-50,-56,-8,-14,-100,-57,-59,-16,19,-50,-56,-1,-13,-11,-7,-15,-10,-9,]),'FOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,183,184,188,191,192,199,201,202,203,],[20,20,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,20,-50,-56,-8,-14,-100,-57,-59,-16,20,-50,-56,-1,-13,-11,-7,-15,-10,-9,]),'DEF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,183,184,188,191,192,199,201,202,203,],[22,22,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,22,-50,-56,-8,-14,-100,-57,-59,-16,22,-50,-56,-1,-13,-11,-7,-15,-10,-9,]),'CLASS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,183,184,188,191,192,199,201,202,203,],[24,24,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,24,-50,-56,-8,-14,-100,-57,-59,-16,24,-50,-56,-1,-13,-11,-7,-15,-10,-9,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,118,119,121,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,179,183,184,188,191,192,194,197,198,199,201,202,203,],[26,26,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,26,26,-23,-50,26,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,26,-50,-56,-8,-14,-100,-57,-59,-16,26,26,-50,-56,-1,-13,-11,26,26,26,-7,-15,-10,-9,]),'BREAK':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,118,119,121,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,179,183,184,188,191,192,194,197,198,199,201,202,203,],[27,27,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,27,27,-23,-50,27,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,27,-50,-56,-8,-14,-100,-57,-59,-16,27,27,-50,-56,-1,-13,-11,27,27,27,-7,-15,-10,-9,]),'CONTINUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,118,119,121,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,179,183,184,188,191,192,194,197,198,199,201,202,203,],[28,28,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,28,28,-23,-50,28,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,28,-50,-56,-8,-14,-100,-57,-59,-16,28,28,-50,-56,-1,-13,-11,28,28,28,-7,-15,-10,-9,]),'PASS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,118,119,121,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,151,152,153,154,160,163,165,166,176,178,179,183,184,188,191,192,194,197,198,199,201,202,203,],[29,29,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,29,29,-23,-50,29,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,29,-50,-56,-8,-14,-100,-57,-59,-16,29,29,-50,-56,-1,-13,-11,29,29,29,-7,-15,-10,-9,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,65,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[23,23,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,60,60,-47,60,60,-64,-66,-67,80,60,60,60,-34,-35,-44,-45,-46,60,60,-74,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-47,60,117,124,60,60,60,60,60,60,60,-60,60,60,-81,-82,-83,60,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,23,23,60,-23,-50,60,23,-36,60,-47,60,-37,-38,-39,-40,-41,-42,-43,-25,60,-56,-58,-77,60,60,60,-10,-12,23,-50,-56,-8,-14,-100,60,-57,-59,60,60,-16,60,23,23,60,-50,-56,-1,-13,-11,23,60,23,23,-7,-15,-10,-9,]),'PLUS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,66,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,135,136,137,140,141,143,144,145,146,147,148,149,150,151,152,153,154,155,159,160,163,164,165,166,167,168,170,172,173,175,176,177,178,179,180,183,184,188,190,191,192,193,194,196,197,198,199,201,202,203,],[31,31,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,48,31,31,-47,31,31,-64,-66,-67,-22,31,31,31,-34,-35,-44,-45,-46,31,31,-74,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,48,31,-47,31,48,48,31,31,31,31,31,31,31,31,48,31,31,-81,-82,-83,31,48,48,-84,-85,-86,-87,-88,-89,-90,48,48,48,48,48,48,48,48,48,31,31,31,-23,-50,31,31,48,31,-47,31,48,48,48,48,48,48,48,48,-25,48,31,48,-56,-58,-77,31,31,31,-10,-12,31,-50,-56,-8,48,48,-14,-100,31,-57,-59,31,31,48,48,48,48,-16,31,31,31,31,-50,-56,-1,48,-13,-11,48,31,31,31,31,-7,-15,-10,-9,]),'MINUS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,66,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,135,136,137,140,141,143,144,145,146,147,148,149,150,151,152,153,154,155,159,160,163,164,165,166,167,168,170,172,173,175,176,177,178,179,180,183,184,188,190,191,192,193,194,196,197,198,199,201,202,203,],[32,32,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,49,32,32,-47,32,32,-64,-66,-67,-22,32,32,32,-34,-35,-44,-45,-46,32,32,-74,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,49,32,-47,32,49,49,32,32,32,32,32,32,32,32,49,32,32,-81,-82,-83,32,49,49,-84,-85,-86,-87,-88,-89,-90,49,49,49,49,49,49,49,49,49,32,32,32,-23,-50,32,32,49,32,-47,32,49,49,49,49,49,49,49,49,-25,49,32,49,-56,-58,-77,32,32,32,-10,-12,32,-50,-56,-8,49,49,-14,-100,32,-57,-59,32,32,49,49,49,49,-16,32,32,32,32,-50,-56,-1,49,-13,-11,49,32,32,32,32,-7,-15,-10,-9,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[33,33,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,33,33,-47,33,33,-64,-66,-67,-22,33,33,33,-34,-35,-44,-45,-46,33,33,-74,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-47,33,33,33,33,33,33,33,33,33,-60,33,33,-81,-82,-83,33,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,33,33,33,-23,-50,33,33,-36,33,-47,33,-37,-38,-39,-40,-41,-42,-43,-25,33,-56,-58,-77,33,33,33,-10,-12,33,-50,-56,-8,-14,-100,33,-57,-59,33,33,-16,33,33,33,33,-50,-56,-1,-13,-11,33,33,33,33,-7,-15,-10,-9,]),'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[35,35,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,35,35,-47,35,35,-64,-66,-67,-22,35,35,35,-34,-35,-44,-45,-46,35,35,-74,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-47,35,35,35,35,35,35,35,35,35,-60,35,35,-81,-82,-83,35,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,35,35,35,-23,-50,35,35,-36,35,-47,35,-37,-38,-39,-40,-41,-42,-43,-25,35,-56,-58,-77,35,35,35,-10,-12,35,-50,-56,-8,-14,-100,35,-57,-59,35,35,-16,35,35,35,35,-50,-56,-1,-13,-11,35,35,35,35,-7,-15,-10,-9,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[36,36,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,36,36,-47,36,36,-64,-66,-67,-22,36,36,36,-34,-35,-44,-45,-46,36,36,-74,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-47,36,36,36,36,36,36,36,36,36,-60,36,36,-81,-82,-83,36,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,36,36,36,-23,-50,36,36,-36,36,-47,36,-37,-38,-39,-40,-41,-42,-43,-25,36,-56,-58,-77,36,36,36,-10,-12,36,-50,-56,-8,-14,-100,36,-57,-59,36,36,-16,36,36,36,36,-50,-56,-1,-13,-11,36,36,36,36,-7,-15,-10,-9,]),'TRUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[37,37,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,37,37,-47,37,37,-64,-66,-67,-22,37,37,37,-34,-35,-44,-45,-46,37,37,-74,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-47,37,37,37,37,37,37,37,37,37,-60,37,37,-81,-82,-83,37,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,37,37,37,-23,-50,37,37,-36,37,-47,37,-37,-38,-39,-40,-41,-42,-43,-25,37,-56,-58,-77,37,37,37,-10,-12,37,-50,-56,-8,-14,-100,37,-57,-59,37,37,-16,37,37,37,37,-50,-56,-1,-13,-11,37,37,37,37,-7,-15,-10,-9,]),'FALSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[38,38,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,38,38,-47,38,38,-64,-66,-67,-22,38,38,38,-34,-35,-44,-45,-46,38,38,-74,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-47,38,38,38,38,38,38,38,38,38,-60,38,38,-81,-82,-83,38,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,38,38,38,-23,-50,38,38,-36,38,-47,38,-37,-38,-39,-40,-41,-42,-43,-25,38,-56,-58,-77,38,38,38,-10,-12,38,-50,-56,-8,-14,-100,38,-57,-59,38,38,-16,38,38,38,38,-50,-56,-1,-13,-11,38,38,38,38,-7,-15,-10,-9,]),'NONE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[39,39,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,39,39,-47,39,39,-64,-66,-67,-22,39,39,39,-34,-35,-44,-45,-46,39,39,-74,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-47,39,39,39,39,39,39,39,39,39,-60,39,39,-81,-82,-83,39,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,39,39,39,-23,-50,39,39,-36,39,-47,39,-37,-38,-39,-40,-41,-42,-43,-25,39,-56,-58,-77,39,39,39,-10,-12,39,-50,-56,-8,-14,-100,39,-57,-59,39,39,-16,39,39,39,39,-50,-56,-1,-13,-11,39,39,39,39,-7,-15,-10,-9,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,117,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,182,183,184,188,191,192,194,196,197,198,199,201,202,203,],[21,21,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,61,61,64,-47,65,61,70,61,-64,-66,-67,-22,61,61,61,-34,-35,-44,-45,-46,61,61,-74,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-47,61,125,61,61,61,61,61,61,61,-60,61,136,61,-81,-82,-83,61,142,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,21,21,61,156,-23,-50,61,21,-36,61,-47,61,-37,-38,-39,-40,-41,-42,-43,-25,61,-56,-58,-77,61,61,61,-10,-12,21,-50,-56,-8,-14,-100,61,-57,-59,61,61,-16,61,21,21,61,156,-50,-56,-1,-13,-11,21,61,21,21,-7,-15,-10,-9,]),'LBRACKET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,136,140,142,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,171,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[40,40,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,62,62,-47,62,62,-64,-66,-67,82,62,62,62,86,-34,-35,-44,-45,-46,62,62,-74,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-47,62,126,62,62,62,62,62,62,62,-60,62,62,-81,-82,-83,62,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,40,40,62,-23,-50,62,40,-36,86,62,-47,62,-37,-38,-39,-40,-41,-42,-43,-25,62,-55,-56,-58,-77,62,62,62,-10,-12,40,-50,-56,-8,-14,-100,62,-57,-59,62,62,-54,-16,62,40,40,62,-50,-53,-1,-13,-11,40,62,40,40,-7,-15,-10,-9,]),'LBRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,140,143,144,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,176,177,178,179,180,183,184,188,191,192,194,196,197,198,199,201,202,203,],[41,41,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,41,41,-47,41,41,-64,-66,-67,-22,41,41,41,-34,-35,-44,-45,-46,41,41,-74,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-47,41,41,41,41,41,41,41,41,41,-60,41,41,-81,-82,-83,41,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,41,41,41,-23,-50,41,41,-36,41,-47,41,-37,-38,-39,-40,-41,-42,-43,-25,41,-56,-58,-77,41,41,41,-10,-12,41,-50,-56,-8,-14,-100,41,-57,-59,41,41,-16,41,41,41,41,-50,-56,-1,-13,-11,41,41,41,41,-7,-15,-10,-9,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,152,153,154,160,163,165,166,176,183,184,188,191,192,199,201,202,203,],[0,-71,-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,-50,-56,-8,-14,-100,-57,-59,-16,-50,-56,-1,-13,-11,-7,-15,-10,-9,]),'DEDENT':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,152,153,154,160,163,165,166,176,178,183,184,188,191,192,199,201,202,203,],[-73,-17,-18,-24,-2,-3,-4,-5,-6,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-74,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,-50,-56,-8,-14,-100,-57,-59,-16,191,-50,-56,-1,-13,-11,-7,-15,-10,-9,]),'ELIF':([6,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,152,153,163,165,166,183,184,191,202,],[-24,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,177,-12,-50,-56,-100,-57,-59,-50,-56,-13,177,]),'ELSE':([6,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,143,144,145,149,150,152,153,163,165,166,176,183,184,191,202,203,],[-24,-26,-27,-28,-29,-30,-31,-47,-61,-64,-66,-67,-22,-34,-35,-44,-45,-46,-47,-60,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-50,-36,-47,-37,-38,-39,-40,-41,-42,-43,-25,-56,-58,-77,-10,-12,-50,-56,-100,-57,-59,189,-50,-56,-13,-10,-9,]),'POWER':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[43,-47,-22,-34,-35,-44,-45,-46,43,-47,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-23,-50,43,-47,43,43,43,43,43,43,43,43,-25,43,43,-56,-58,-77,-50,-56,43,43,-100,-57,-59,43,43,43,43,-50,-56,43,43,]),'TIMES':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[44,-47,-22,-34,-35,-44,-45,-46,44,-47,44,44,44,-81,-82,-83,44,44,-84,-85,-86,-87,-88,44,44,44,44,44,44,44,44,44,44,44,-23,-50,44,-47,44,44,44,44,44,44,44,44,-25,44,44,-56,-58,-77,-50,-56,44,44,-100,-57,-59,44,44,44,44,-50,-56,44,44,]),'DIVIDE':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[45,-47,-22,-34,-35,-44,-45,-46,45,-47,45,45,45,-81,-82,-83,45,45,-84,-85,-86,-87,-88,45,45,45,45,45,45,45,45,45,45,45,-23,-50,45,-47,45,45,45,45,45,45,45,45,-25,45,45,-56,-58,-77,-50,-56,45,45,-100,-57,-59,45,45,45,45,-50,-56,45,45,]),'FLOOR_DIVIDE':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[46,-47,-22,-34,-35,-44,-45,-46,46,-47,46,46,46,-81,-82,-83,46,46,-84,-85,-86,-87,-88,46,46,46,46,46,46,46,46,46,46,46,-23,-50,46,-47,46,46,46,46,46,46,46,46,-25,46,46,-56,-58,-77,-50,-56,46,46,-100,-57,-59,46,46,46,46,-50,-56,46,46,]),'MOD':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[47,-47,-22,-34,-35,-44,-45,-46,47,-47,47,47,47,-81,-82,-83,47,47,-84,-85,-86,-87,-88,47,47,47,47,47,47,47,47,47,47,47,-23,-50,47,-47,47,47,47,47,47,47,47,47,-25,47,47,-56,-58,-77,-50,-56,47,47,-100,-57,-59,47,47,47,47,-50,-56,47,47,]),'EQUALS':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[50,-47,-22,-34,-35,-44,-45,-46,50,-47,50,50,50,-81,-82,-83,50,50,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,50,50,50,-23,-50,50,-47,50,50,50,50,50,50,50,50,-25,50,50,-56,-58,-77,-50,-56,50,50,-100,-57,-59,50,50,50,50,-50,-56,50,50,]),'NOT_EQUALS':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[51,-47,-22,-34,-35,-44,-45,-46,51,-47,51,51,51,-81,-82,-83,51,51,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,51,51,51,-23,-50,51,-47,51,51,51,51,51,51,51,51,-25,51,51,-56,-58,-77,-50,-56,51,51,-100,-57,-59,51,51,51,51,-50,-56,51,51,]),'LESS_THAN':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[52,-47,-22,-34,-35,-44,-45,-46,52,-47,52,52,52,-81,-82,-83,52,52,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,52,52,52,-23,-50,52,-47,52,52,52,52,52,52,52,52,-25,52,52,-56,-58,-77,-50,-56,52,52,-100,-57,-59,52,52,52,52,-50,-56,52,52,]),'LESS_THAN_EQUALS':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[53,-47,-22,-34,-35,-44,-45,-46,53,-47,53,53,53,-81,-82,-83,53,53,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,53,53,53,-23,-50,53,-47,53,53,53,53,53,53,53,53,-25,53,53,-56,-58,-77,-50,-56,53,53,-100,-57,-59,53,53,53,53,-50,-56,53,53,]),'GREATER_THAN':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[54,-47,-22,-34,-35,-44,-45,-46,54,-47,54,54,54,-81,-82,-83,54,54,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,54,54,54,-23,-50,54,-47,54,54,54,54,54,54,54,54,-25,54,54,-56,-58,-77,-50,-56,54,54,-100,-57,-59,54,54,54,54,-50,-56,54,54,]),'GREATER_THAN_EQUALS':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[55,-47,-22,-34,-35,-44,-45,-46,55,-47,55,55,55,-81,-82,-83,55,55,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,55,55,55,-23,-50,55,-47,55,55,55,55,55,55,55,55,-25,55,55,-56,-58,-77,-50,-56,55,55,-100,-57,-59,55,55,55,55,-50,-56,55,55,]),'IN':([17,21,30,35,36,37,38,39,59,61,63,64,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[56,-47,-22,-34,-35,-44,-45,-46,56,-47,56,116,56,56,-81,-82,-83,56,56,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,56,-98,-99,-23,-50,56,-47,56,56,56,56,56,56,56,56,-25,56,56,-56,-58,-77,-50,-56,56,56,-100,-57,-59,56,56,56,56,-50,-56,56,56,]),'AND':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[57,-47,-22,-34,-35,-44,-45,-46,57,-47,57,57,57,-81,-82,-83,57,57,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,57,-98,57,-23,-50,57,-47,57,57,57,57,57,57,57,57,-25,57,57,-56,-58,-77,-50,-56,57,57,-100,-57,-59,57,57,57,57,-50,-56,57,57,]),'OR':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,135,136,137,141,143,144,145,152,153,155,159,163,165,166,170,172,173,175,183,184,190,193,],[58,-47,-22,-34,-35,-44,-45,-46,58,-47,58,58,58,-81,-82,-83,58,58,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,58,-98,-99,-23,-50,58,-47,58,58,58,58,58,58,58,58,-25,58,58,-56,-58,-77,-50,-56,58,58,-100,-57,-59,58,58,58,58,-50,-56,58,58,]),'DOT':([21,30,34,35,36,37,38,39,61,119,123,125,136,142,143,144,145,152,153,165,166,171,183,184,],[-47,81,87,-34,-35,-44,-45,-46,-47,-50,87,-47,-25,-55,-56,-58,-77,-50,-56,-57,-59,-54,-50,-53,]),'ASSIGN':([21,25,34,119,123,125,142,143,156,171,183,184,],[-51,71,-49,-52,-48,-51,-55,-53,180,-54,-52,-53,]),'PLUS_ASSIGN':([21,25,34,119,123,125,142,143,171,183,184,],[-51,72,-49,-52,-48,-51,-55,-53,-54,-52,-53,]),'MINUS_ASSIGN':([21,25,34,119,123,125,142,143,171,183,184,],[-51,73,-49,-52,-48,-51,-55,-53,-54,-52,-53,]),'TIMES_ASSIGN':([21,25,34,119,123,125,142,143,171,183,184,],[-51,74,-49,-52,-48,-51,-55,-53,-54,-52,-53,]),'DIVIDE_ASSIGN':([21,25,34,119,123,125,142,143,171,183,184,],[-51,75,-49,-52,-48,-51,-55,-53,-54,-52,-53,]),'FLOOR_DIVIDE_ASSIGN':([21,25,34,119,123,125,142,143,171,183,184,],[-51,76,-49,-52,-48,-51,-55,-53,-54,-52,-53,]),'MOD_ASSIGN':([21,25,34,119,123,125,142,143,171,183,184,],[-51,77,-49,-52,-48,-51,-55,-53,-54,-52,-53,]),'POWER_ASSIGN':([21,25,34,119,123,125,142,143,171,183,184,],[-51,78,-49,-52,-48,-51,-55,-53,-54,-52,-53,]),'RPAREN':([23,30,35,36,37,38,39,60,61,66,67,68,69,80,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,113,117,118,124,134,135,136,144,145,152,153,156,157,158,159,161,163,164,165,166,182,185,193,195,],[-113,-22,-34,-35,-44,-45,-46,-113,-47,118,119,-109,-110,-103,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,152,-21,-23,-113,163,-102,-25,-58,-77,-50,-56,-32,181,-20,-112,183,-100,-103,-57,-59,-21,-101,-33,-19,]),'COLON':([30,35,36,37,38,39,59,61,63,70,82,83,84,85,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,136,137,139,140,144,145,152,153,155,163,165,166,167,170,175,181,186,189,190,],[-22,-34,-35,-44,-45,-46,112,-47,115,121,140,-81,-82,-83,147,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-25,-76,167,168,-58,-77,-50,-56,179,-100,-57,-59,-75,-76,147,194,196,197,198,]),'COMMA':([30,35,36,37,38,39,61,66,68,83,84,85,89,91,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,135,136,144,145,146,152,153,156,158,159,163,165,166,172,173,193,],[-22,-34,-35,-44,-45,-46,-47,-111,120,-81,-82,-83,-111,146,-78,148,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,164,-25,-58,-77,-80,-50,-56,-32,182,-112,-100,-57,-59,-79,-108,-33,]),'RBRACKET':([30,35,36,37,38,39,40,61,62,68,69,83,84,85,88,89,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,114,118,126,136,137,138,140,141,144,145,152,153,159,162,163,165,166,167,168,169,170,186,187,196,200,],[-22,-34,-35,-44,-45,-46,-113,-47,-113,-109,-110,-81,-82,-83,143,-111,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,153,-23,-113,-25,165,166,-70,171,-58,-77,-50,-56,-112,184,-100,-57,-59,-69,-75,-68,-76,-63,-72,-75,-65,]),'RBRACE':([30,35,36,37,38,39,41,61,83,84,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,136,144,145,146,152,153,163,165,166,172,173,174,],[-22,-34,-35,-44,-45,-46,-113,-47,-81,-82,-83,144,145,-106,-107,-78,-104,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-23,-25,-58,-77,-80,-50,-56,-100,-57,-59,-79,-108,-105,]),'INDENT':([112,115,121,179,194,197,198,],[151,151,151,151,151,151,151,]),}
+_lr_action_items = {'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,185,186,190,193,194,201,203,204,205,],[18,18,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,18,-52,-58,-8,-12,-102,-59,-61,-16,18,-52,-58,-1,-14,-11,-7,-15,-10,-9,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,185,186,190,193,194,201,203,204,205,],[19,19,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,19,-52,-58,-8,-12,-102,-59,-61,-16,19,-52,-58,-1,-14,-11,-7,-15,-10,-9,]),'FOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,185,186,190,193,194,201,203,204,205,],[20,20,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,20,-52,-58,-8,-12,-102,-59,-61,-16,20,-52,-58,-1,-14,-11,-7,-15,-10,-9,]),'DEF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,185,186,190,193,194,201,203,204,205,],[22,22,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,22,-52,-58,-8,-12,-102,-59,-61,-16,22,-52,-58,-1,-14,-11,-7,-15,-10,-9,]),'CLASS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,185,186,190,193,194,201,203,204,205,],[24,24,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,24,-52,-58,-8,-12,-102,-59,-61,-16,24,-52,-58,-1,-14,-11,-7,-15,-10,-9,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,118,119,121,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,181,185,186,190,193,194,196,199,200,201,203,204,205,],[26,26,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,26,26,-25,-52,26,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,26,-52,-58,-8,-12,-102,-59,-61,-16,26,26,-52,-58,-1,-14,-11,26,26,26,-7,-15,-10,-9,]),'BREAK':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,118,119,121,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,181,185,186,190,193,194,196,199,200,201,203,204,205,],[27,27,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,27,27,-25,-52,27,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,27,-52,-58,-8,-12,-102,-59,-61,-16,27,27,-52,-58,-1,-14,-11,27,27,27,-7,-15,-10,-9,]),'CONTINUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,118,119,121,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,181,185,186,190,193,194,196,199,200,201,203,204,205,],[28,28,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,28,28,-25,-52,28,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,28,-52,-58,-8,-12,-102,-59,-61,-16,28,28,-52,-58,-1,-14,-11,28,28,28,-7,-15,-10,-9,]),'PASS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,118,119,121,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,152,153,154,155,162,165,167,168,178,180,181,185,186,190,193,194,196,199,200,201,203,204,205,],[29,29,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,29,29,-25,-52,29,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,29,-52,-58,-8,-12,-102,-59,-61,-16,29,29,-52,-58,-1,-14,-11,29,29,29,-7,-15,-10,-9,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,65,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[23,23,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,60,60,-49,60,60,-66,-68,-69,80,60,60,60,-36,-37,-46,-47,-48,60,60,-77,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-49,60,117,124,60,60,60,60,60,60,60,-62,60,60,-83,-84,-85,60,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,23,23,60,-25,-52,60,23,-38,60,-49,60,-39,-40,-41,-42,-43,-44,-45,-27,60,-58,-60,-79,60,60,60,-10,-13,23,-52,-58,-8,-12,-102,60,-59,-61,60,60,-16,60,23,23,60,-52,-58,-1,-14,-11,23,60,23,23,-7,-15,-10,-9,]),'PLUS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,66,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,137,138,141,142,144,145,146,147,148,149,150,151,152,153,154,155,156,161,162,165,166,167,168,169,170,172,174,176,177,178,179,180,181,182,185,186,187,190,192,193,194,195,196,198,199,200,201,203,204,205,],[31,31,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,48,31,31,-49,31,31,-66,-68,-69,-22,31,31,31,-36,-37,-46,-47,-48,31,31,-77,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,48,31,-49,31,48,48,31,31,31,31,31,31,31,31,48,31,31,-83,-84,-85,31,48,48,-86,-87,-88,-89,-90,-91,-92,48,48,48,48,48,48,48,48,48,31,31,31,-25,-52,31,31,48,31,-49,31,48,48,48,48,48,48,48,48,-27,48,31,48,-58,-60,-79,31,31,31,-10,-13,31,-52,-58,-8,48,48,-12,-102,31,-59,-61,31,31,48,48,48,48,-16,31,31,31,31,-52,-58,48,-1,48,-14,-11,48,31,31,31,31,-7,-15,-10,-9,]),'MINUS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,66,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,136,137,138,141,142,144,145,146,147,148,149,150,151,152,153,154,155,156,161,162,165,166,167,168,169,170,172,174,176,177,178,179,180,181,182,185,186,187,190,192,193,194,195,196,198,199,200,201,203,204,205,],[32,32,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,49,32,32,-49,32,32,-66,-68,-69,-22,32,32,32,-36,-37,-46,-47,-48,32,32,-77,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,49,32,-49,32,49,49,32,32,32,32,32,32,32,32,49,32,32,-83,-84,-85,32,49,49,-86,-87,-88,-89,-90,-91,-92,49,49,49,49,49,49,49,49,49,32,32,32,-25,-52,32,32,49,32,-49,32,49,49,49,49,49,49,49,49,-27,49,32,49,-58,-60,-79,32,32,32,-10,-13,32,-52,-58,-8,49,49,-12,-102,32,-59,-61,32,32,49,49,49,49,-16,32,32,32,32,-52,-58,49,-1,49,-14,-11,49,32,32,32,32,-7,-15,-10,-9,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[33,33,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,33,33,-49,33,33,-66,-68,-69,-22,33,33,33,-36,-37,-46,-47,-48,33,33,-77,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-49,33,33,33,33,33,33,33,33,33,-62,33,33,-83,-84,-85,33,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,33,33,33,-25,-52,33,33,-38,33,-49,33,-39,-40,-41,-42,-43,-44,-45,-27,33,-58,-60,-79,33,33,33,-10,-13,33,-52,-58,-8,-12,-102,33,-59,-61,33,33,-16,33,33,33,33,-52,-58,-1,-14,-11,33,33,33,33,-7,-15,-10,-9,]),'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[35,35,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,35,35,-49,35,35,-66,-68,-69,-22,35,35,35,-36,-37,-46,-47,-48,35,35,-77,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-49,35,35,35,35,35,35,35,35,35,-62,35,35,-83,-84,-85,35,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,35,35,35,-25,-52,35,35,-38,35,-49,35,-39,-40,-41,-42,-43,-44,-45,-27,35,-58,-60,-79,35,35,35,-10,-13,35,-52,-58,-8,-12,-102,35,-59,-61,35,35,-16,35,35,35,35,-52,-58,-1,-14,-11,35,35,35,35,-7,-15,-10,-9,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[36,36,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,36,36,-49,36,36,-66,-68,-69,-22,36,36,36,-36,-37,-46,-47,-48,36,36,-77,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-49,36,36,36,36,36,36,36,36,36,-62,36,36,-83,-84,-85,36,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,36,36,36,-25,-52,36,36,-38,36,-49,36,-39,-40,-41,-42,-43,-44,-45,-27,36,-58,-60,-79,36,36,36,-10,-13,36,-52,-58,-8,-12,-102,36,-59,-61,36,36,-16,36,36,36,36,-52,-58,-1,-14,-11,36,36,36,36,-7,-15,-10,-9,]),'TRUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[37,37,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,37,37,-49,37,37,-66,-68,-69,-22,37,37,37,-36,-37,-46,-47,-48,37,37,-77,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-49,37,37,37,37,37,37,37,37,37,-62,37,37,-83,-84,-85,37,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,37,37,37,-25,-52,37,37,-38,37,-49,37,-39,-40,-41,-42,-43,-44,-45,-27,37,-58,-60,-79,37,37,37,-10,-13,37,-52,-58,-8,-12,-102,37,-59,-61,37,37,-16,37,37,37,37,-52,-58,-1,-14,-11,37,37,37,37,-7,-15,-10,-9,]),'FALSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[38,38,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,38,38,-49,38,38,-66,-68,-69,-22,38,38,38,-36,-37,-46,-47,-48,38,38,-77,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-49,38,38,38,38,38,38,38,38,38,-62,38,38,-83,-84,-85,38,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,38,38,38,-25,-52,38,38,-38,38,-49,38,-39,-40,-41,-42,-43,-44,-45,-27,38,-58,-60,-79,38,38,38,-10,-13,38,-52,-58,-8,-12,-102,38,-59,-61,38,38,-16,38,38,38,38,-52,-58,-1,-14,-11,38,38,38,38,-7,-15,-10,-9,]),'NONE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[39,39,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,39,39,-49,39,39,-66,-68,-69,-22,39,39,39,-36,-37,-46,-47,-48,39,39,-77,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-49,39,39,39,39,39,39,39,39,39,-62,39,39,-83,-84,-85,39,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,39,39,39,-25,-52,39,39,-38,39,-49,39,-39,-40,-41,-42,-43,-44,-45,-27,39,-58,-60,-79,39,39,39,-10,-13,39,-52,-58,-8,-12,-102,39,-59,-61,39,39,-16,39,39,39,39,-52,-58,-1,-14,-11,39,39,39,39,-7,-15,-10,-9,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,117,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,184,185,186,190,193,194,196,198,199,200,201,203,204,205,],[21,21,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,61,61,64,-49,65,61,70,61,-66,-68,-69,-22,61,61,61,-36,-37,-46,-47,-48,61,61,-77,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-49,61,125,61,61,61,61,61,61,61,-62,61,137,61,-83,-84,-85,61,143,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,21,21,61,157,-25,-52,61,21,-38,61,-49,61,-39,-40,-41,-42,-43,-44,-45,-27,61,-58,-60,-79,61,61,61,-10,-13,21,-52,-58,-8,-12,-102,61,-59,-61,61,61,-16,61,21,21,61,157,-52,-58,-1,-14,-11,21,61,21,21,-7,-15,-10,-9,]),'LBRACKET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,137,141,143,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,173,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[40,40,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,62,62,-49,62,62,-66,-68,-69,82,62,62,62,86,-36,-37,-46,-47,-48,62,62,-77,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-49,62,126,62,62,62,62,62,62,62,-62,62,62,-83,-84,-85,62,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,40,40,62,-25,-52,62,40,-38,86,62,-49,62,-39,-40,-41,-42,-43,-44,-45,-27,62,-57,-58,-60,-79,62,62,62,-10,-13,40,-52,-58,-8,-12,-102,62,-59,-61,62,62,-56,-16,62,40,40,62,-52,-55,-1,-14,-11,40,62,40,40,-7,-15,-10,-9,]),'LBRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,23,26,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,115,116,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,137,141,144,145,146,147,148,149,150,151,152,153,154,155,162,165,166,167,168,169,170,178,179,180,181,182,185,186,190,193,194,196,198,199,200,201,203,204,205,],[41,41,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,41,41,-49,41,41,-66,-68,-69,-22,41,41,41,-36,-37,-46,-47,-48,41,41,-77,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-49,41,41,41,41,41,41,41,41,41,-62,41,41,-83,-84,-85,41,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,41,41,41,-25,-52,41,41,-38,41,-49,41,-39,-40,-41,-42,-43,-44,-45,-27,41,-58,-60,-79,41,41,41,-10,-13,41,-52,-58,-8,-12,-102,41,-59,-61,41,41,-16,41,41,41,41,-52,-58,-1,-14,-11,41,41,41,41,-7,-15,-10,-9,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,153,154,155,162,165,167,168,178,185,186,190,193,194,201,203,204,205,],[0,-74,-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,-52,-58,-8,-12,-102,-59,-61,-16,-52,-58,-1,-14,-11,-7,-15,-10,-9,]),'DEDENT':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,42,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,153,154,155,162,165,167,168,178,180,185,186,190,193,194,201,203,204,205,],[-76,-20,-21,-26,-2,-3,-4,-5,-6,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-77,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,-52,-58,-8,-12,-102,-59,-61,-16,193,-52,-58,-1,-14,-11,-7,-15,-10,-9,]),'ELIF':([6,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,153,154,165,167,168,185,186,193,204,],[-26,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,179,-13,-52,-58,-102,-59,-61,-52,-58,-14,179,]),'ELSE':([6,12,13,14,15,16,17,21,26,27,28,29,30,35,36,37,38,39,61,79,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,137,144,145,146,150,151,153,154,165,167,168,178,185,186,193,204,205,],[-26,-28,-29,-30,-31,-32,-33,-49,-63,-66,-68,-69,-22,-36,-37,-46,-47,-48,-49,-62,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-52,-38,-49,-39,-40,-41,-42,-43,-44,-45,-27,-58,-60,-79,-10,-13,-52,-58,-102,-59,-61,191,-52,-58,-14,-10,-9,]),'POWER':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[43,-49,-22,-36,-37,-46,-47,-48,43,-49,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-25,-52,43,-49,43,43,43,43,43,43,43,43,-27,43,43,-58,-60,-79,-52,-58,43,43,-102,-59,-61,43,43,43,43,-52,-58,43,43,43,]),'TIMES':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[44,-49,-22,-36,-37,-46,-47,-48,44,-49,44,44,44,-83,-84,-85,44,44,-86,-87,-88,-89,-90,44,44,44,44,44,44,44,44,44,44,44,-25,-52,44,-49,44,44,44,44,44,44,44,44,-27,44,44,-58,-60,-79,-52,-58,44,44,-102,-59,-61,44,44,44,44,-52,-58,44,44,44,]),'DIVIDE':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[45,-49,-22,-36,-37,-46,-47,-48,45,-49,45,45,45,-83,-84,-85,45,45,-86,-87,-88,-89,-90,45,45,45,45,45,45,45,45,45,45,45,-25,-52,45,-49,45,45,45,45,45,45,45,45,-27,45,45,-58,-60,-79,-52,-58,45,45,-102,-59,-61,45,45,45,45,-52,-58,45,45,45,]),'FLOOR_DIVIDE':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[46,-49,-22,-36,-37,-46,-47,-48,46,-49,46,46,46,-83,-84,-85,46,46,-86,-87,-88,-89,-90,46,46,46,46,46,46,46,46,46,46,46,-25,-52,46,-49,46,46,46,46,46,46,46,46,-27,46,46,-58,-60,-79,-52,-58,46,46,-102,-59,-61,46,46,46,46,-52,-58,46,46,46,]),'MOD':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[47,-49,-22,-36,-37,-46,-47,-48,47,-49,47,47,47,-83,-84,-85,47,47,-86,-87,-88,-89,-90,47,47,47,47,47,47,47,47,47,47,47,-25,-52,47,-49,47,47,47,47,47,47,47,47,-27,47,47,-58,-60,-79,-52,-58,47,47,-102,-59,-61,47,47,47,47,-52,-58,47,47,47,]),'AND':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[50,-49,-22,-36,-37,-46,-47,-48,50,-49,50,50,50,-83,-84,-85,50,50,-86,-87,-88,-89,-90,-91,-92,-93,50,-95,-96,-97,-98,-99,-100,50,-25,-52,50,-49,50,50,50,50,50,50,50,50,-27,50,50,-58,-60,-79,-52,-58,50,50,-102,-59,-61,50,50,50,50,-52,-58,50,50,50,]),'OR':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[51,-49,-22,-36,-37,-46,-47,-48,51,-49,51,51,51,-83,-84,-85,51,51,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,51,-25,-52,51,-49,51,51,51,51,51,51,51,51,-27,51,51,-58,-60,-79,-52,-58,51,51,-102,-59,-61,51,51,51,51,-52,-58,51,51,51,]),'EQUALS':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[52,-49,-22,-36,-37,-46,-47,-48,52,-49,52,52,52,-83,-84,-85,52,52,-86,-87,-88,-89,-90,-91,-92,52,52,-95,-96,-97,-98,-99,-100,52,-25,-52,52,-49,52,52,52,52,52,52,52,52,-27,52,52,-58,-60,-79,-52,-58,52,52,-102,-59,-61,52,52,52,52,-52,-58,52,52,52,]),'NOT_EQUALS':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[53,-49,-22,-36,-37,-46,-47,-48,53,-49,53,53,53,-83,-84,-85,53,53,-86,-87,-88,-89,-90,-91,-92,53,53,-95,-96,-97,-98,-99,-100,53,-25,-52,53,-49,53,53,53,53,53,53,53,53,-27,53,53,-58,-60,-79,-52,-58,53,53,-102,-59,-61,53,53,53,53,-52,-58,53,53,53,]),'LESS_THAN':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[54,-49,-22,-36,-37,-46,-47,-48,54,-49,54,54,54,-83,-84,-85,54,54,-86,-87,-88,-89,-90,-91,-92,54,54,-95,-96,-97,-98,-99,-100,54,-25,-52,54,-49,54,54,54,54,54,54,54,54,-27,54,54,-58,-60,-79,-52,-58,54,54,-102,-59,-61,54,54,54,54,-52,-58,54,54,54,]),'LESS_THAN_EQUALS':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[55,-49,-22,-36,-37,-46,-47,-48,55,-49,55,55,55,-83,-84,-85,55,55,-86,-87,-88,-89,-90,-91,-92,55,55,-95,-96,-97,-98,-99,-100,55,-25,-52,55,-49,55,55,55,55,55,55,55,55,-27,55,55,-58,-60,-79,-52,-58,55,55,-102,-59,-61,55,55,55,55,-52,-58,55,55,55,]),'GREATER_THAN':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[56,-49,-22,-36,-37,-46,-47,-48,56,-49,56,56,56,-83,-84,-85,56,56,-86,-87,-88,-89,-90,-91,-92,56,56,-95,-96,-97,-98,-99,-100,56,-25,-52,56,-49,56,56,56,56,56,56,56,56,-27,56,56,-58,-60,-79,-52,-58,56,56,-102,-59,-61,56,56,56,56,-52,-58,56,56,56,]),'GREATER_THAN_EQUALS':([17,21,30,35,36,37,38,39,59,61,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[57,-49,-22,-36,-37,-46,-47,-48,57,-49,57,57,57,-83,-84,-85,57,57,-86,-87,-88,-89,-90,-91,-92,57,57,-95,-96,-97,-98,-99,-100,57,-25,-52,57,-49,57,57,57,57,57,57,57,57,-27,57,57,-58,-60,-79,-52,-58,57,57,-102,-59,-61,57,57,57,57,-52,-58,57,57,57,]),'IN':([17,21,30,35,36,37,38,39,59,61,63,64,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,122,125,127,128,129,130,131,132,133,136,137,138,142,144,145,146,153,154,156,161,165,167,168,172,174,176,177,185,186,187,192,195,],[58,-49,-22,-36,-37,-46,-47,-48,58,-49,58,116,58,58,-83,-84,-85,58,58,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,58,-25,-52,58,-49,58,58,58,58,58,58,58,58,-27,58,58,-58,-60,-79,-52,-58,58,58,-102,-59,-61,58,58,58,58,-52,-58,58,58,58,]),'DOT':([21,30,34,35,36,37,38,39,61,119,123,125,137,143,144,145,146,153,154,167,168,173,185,186,],[-49,81,87,-36,-37,-46,-47,-48,-49,-52,87,-49,-27,-57,-58,-60,-79,-52,-58,-59,-61,-56,-52,-55,]),'ASSIGN':([21,25,34,119,123,125,143,144,157,173,185,186,],[-53,71,-51,-54,-50,-53,-57,-55,182,-56,-54,-55,]),'PLUS_ASSIGN':([21,25,34,119,123,125,143,144,173,185,186,],[-53,72,-51,-54,-50,-53,-57,-55,-56,-54,-55,]),'MINUS_ASSIGN':([21,25,34,119,123,125,143,144,173,185,186,],[-53,73,-51,-54,-50,-53,-57,-55,-56,-54,-55,]),'TIMES_ASSIGN':([21,25,34,119,123,125,143,144,173,185,186,],[-53,74,-51,-54,-50,-53,-57,-55,-56,-54,-55,]),'DIVIDE_ASSIGN':([21,25,34,119,123,125,143,144,173,185,186,],[-53,75,-51,-54,-50,-53,-57,-55,-56,-54,-55,]),'FLOOR_DIVIDE_ASSIGN':([21,25,34,119,123,125,143,144,173,185,186,],[-53,76,-51,-54,-50,-53,-57,-55,-56,-54,-55,]),'MOD_ASSIGN':([21,25,34,119,123,125,143,144,173,185,186,],[-53,77,-51,-54,-50,-53,-57,-55,-56,-54,-55,]),'POWER_ASSIGN':([21,25,34,119,123,125,143,144,173,185,186,],[-53,78,-51,-54,-50,-53,-57,-55,-56,-54,-55,]),'RPAREN':([23,30,35,36,37,38,39,60,61,66,67,68,69,80,83,84,85,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,113,117,118,124,134,135,136,137,145,146,153,154,157,158,159,160,161,163,165,166,167,168,184,187,195,197,],[-117,-22,-36,-37,-46,-47,-48,-117,-49,118,119,-113,-114,-105,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,153,-19,-25,-117,165,-103,-106,-27,-60,-79,-52,-58,-34,183,-17,-23,-116,185,-102,-104,-59,-61,-18,-107,-35,-24,]),'COLON':([30,35,36,37,38,39,59,61,63,70,82,83,84,85,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,137,138,140,141,145,146,153,154,156,165,167,168,169,172,176,183,188,191,192,],[-22,-36,-37,-46,-47,-48,112,-49,115,121,141,-83,-84,-85,149,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-27,-78,169,170,-60,-79,-52,-58,181,-102,-59,-61,-75,-78,149,196,198,199,200,]),'COMMA':([30,35,36,37,38,39,61,66,68,83,84,85,89,91,92,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,135,136,137,145,146,147,153,154,157,159,160,161,165,167,168,174,175,177,187,195,197,],[-22,-36,-37,-46,-47,-48,-49,-115,120,-83,-84,-85,-115,147,148,-80,-108,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,166,-106,-27,-60,-79,-82,-52,-58,-34,184,-23,-116,-102,-59,-61,-81,-109,-112,-107,-35,-24,]),'RBRACKET':([30,35,36,37,38,39,40,61,62,68,69,83,84,85,88,89,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,114,118,126,137,138,139,141,142,145,146,153,154,161,164,165,167,168,169,170,171,172,188,189,198,202,],[-22,-36,-37,-46,-47,-48,-117,-49,-117,-113,-114,-83,-84,-85,144,-115,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,154,-25,-117,-27,167,168,-72,173,-60,-79,-52,-58,-116,186,-102,-59,-61,-71,-75,-70,-78,-65,-73,-75,-67,]),'RBRACE':([30,35,36,37,38,39,41,61,83,84,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,137,145,146,147,153,154,165,167,168,174,175,177,],[-22,-36,-37,-46,-47,-48,-117,-49,-83,-84,-85,145,146,-110,-111,-80,-108,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-25,-27,-60,-79,-82,-52,-58,-102,-59,-61,-81,-109,-112,]),'INDENT':([112,115,121,181,196,199,200,],[152,152,152,152,152,152,152,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'module':([0,],[1,]),'statement_list':([0,151,],[2,178,]),'statement':([0,2,151,178,],[3,42,3,42,]),'simple_statement':([0,2,112,115,121,151,178,179,194,197,198,],[4,4,150,150,150,4,4,150,150,150,150,]),'compound_statement':([0,2,151,178,],[5,5,5,5,]),'small_stmt':([0,2,112,115,121,151,178,179,194,197,198,],[6,6,6,6,6,6,6,6,6,6,6,]),'if_stmt':([0,2,151,178,],[7,7,7,7,]),'while_stmt':([0,2,151,178,],[8,8,8,8,]),'for_stmt':([0,2,151,178,],[9,9,9,9,]),'funcdef':([0,2,151,178,],[10,10,10,10,]),'classdef':([0,2,151,178,],[11,11,11,11,]),'assignment':([0,2,112,115,121,151,178,179,194,197,198,],[12,12,12,12,12,12,12,12,12,12,12,]),'return_stmt':([0,2,112,115,121,151,178,179,194,197,198,],[13,13,13,13,13,13,13,13,13,13,13,]),'break_stmt':([0,2,112,115,121,151,178,179,194,197,198,],[14,14,14,14,14,14,14,14,14,14,14,]),'continue_stmt':([0,2,112,115,121,151,178,179,194,197,198,],[15,15,15,15,15,15,15,15,15,15,15,]),'pass_stmt':([0,2,112,115,121,151,178,179,194,197,198,],[16,16,16,16,16,16,16,16,16,16,16,]),'expr':([0,2,18,19,23,26,31,32,33,40,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,62,71,72,73,74,75,76,77,78,80,82,86,112,115,116,120,121,124,126,140,146,147,148,151,164,167,168,177,178,179,180,194,196,197,198,],[17,17,59,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,66,89,122,127,128,129,130,131,132,133,135,137,141,17,17,155,159,17,66,89,170,172,173,175,17,135,170,170,190,17,17,193,17,170,17,17,]),'assign_targets':([0,2,112,115,121,151,178,179,194,197,198,],[25,25,25,25,25,25,25,25,25,25,25,]),'atom':([0,2,18,19,23,26,31,32,33,40,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,62,71,72,73,74,75,76,77,78,80,82,86,112,115,116,120,121,124,126,140,146,147,148,151,164,167,168,177,178,179,180,194,196,197,198,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'target':([0,2,71,112,115,121,151,178,179,194,197,198,],[34,34,123,34,34,34,34,34,34,34,34,34,]),'elements_opt':([23,40,60,62,124,126,],[67,88,113,114,161,162,]),'elements':([23,40,60,62,124,126,],[68,68,68,68,68,68,]),'empty':([23,40,41,60,62,124,126,],[69,69,93,69,69,69,69,]),'key_value_list_opt':([41,],[90,]),'set_elements':([41,],[91,]),'key_value_list':([41,148,],[92,174,]),'key_value':([41,148,],[95,95,]),'arg_list_opt':([80,164,],[134,185,]),'subscript_item':([82,],[138,]),'opt_expr':([82,140,167,168,196,],[139,169,186,187,200,]),'suite':([112,115,121,179,194,197,198,],[149,154,160,192,199,201,202,]),'param_list_opt':([117,182,],[157,195,]),'param':([117,182,],[158,158,]),'elif_blocks':([149,202,],[176,203,]),'else_block_opt':([176,],[188,]),}
+_lr_goto_items = {'module':([0,],[1,]),'statement_list':([0,152,],[2,180,]),'statement':([0,2,152,180,],[3,42,3,42,]),'simple_statement':([0,2,112,115,121,152,180,181,196,199,200,],[4,4,151,151,151,4,4,151,151,151,151,]),'compound_statement':([0,2,152,180,],[5,5,5,5,]),'small_stmt':([0,2,112,115,121,152,180,181,196,199,200,],[6,6,6,6,6,6,6,6,6,6,6,]),'if_stmt':([0,2,152,180,],[7,7,7,7,]),'while_stmt':([0,2,152,180,],[8,8,8,8,]),'for_stmt':([0,2,152,180,],[9,9,9,9,]),'funcdef':([0,2,152,180,],[10,10,10,10,]),'classdef':([0,2,152,180,],[11,11,11,11,]),'assignment':([0,2,112,115,121,152,180,181,196,199,200,],[12,12,12,12,12,12,12,12,12,12,12,]),'return_stmt':([0,2,112,115,121,152,180,181,196,199,200,],[13,13,13,13,13,13,13,13,13,13,13,]),'break_stmt':([0,2,112,115,121,152,180,181,196,199,200,],[14,14,14,14,14,14,14,14,14,14,14,]),'continue_stmt':([0,2,112,115,121,152,180,181,196,199,200,],[15,15,15,15,15,15,15,15,15,15,15,]),'pass_stmt':([0,2,112,115,121,152,180,181,196,199,200,],[16,16,16,16,16,16,16,16,16,16,16,]),'expr':([0,2,18,19,23,26,31,32,33,40,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,62,71,72,73,74,75,76,77,78,80,82,86,112,115,116,120,121,124,126,141,147,148,149,152,166,169,170,179,180,181,182,196,198,199,200,],[17,17,59,63,66,79,83,84,85,89,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,66,89,122,127,128,129,130,131,132,133,136,138,142,17,17,156,161,17,66,89,172,174,176,177,17,187,172,172,192,17,17,195,17,172,17,17,]),'assign_targets':([0,2,112,115,121,152,180,181,196,199,200,],[25,25,25,25,25,25,25,25,25,25,25,]),'atom':([0,2,18,19,23,26,31,32,33,40,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,62,71,72,73,74,75,76,77,78,80,82,86,112,115,116,120,121,124,126,141,147,148,149,152,166,169,170,179,180,181,182,196,198,199,200,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'target':([0,2,71,112,115,121,152,180,181,196,199,200,],[34,34,123,34,34,34,34,34,34,34,34,34,]),'elements_opt':([23,40,60,62,124,126,],[67,88,113,114,163,164,]),'elements':([23,40,60,62,124,126,],[68,68,68,68,68,68,]),'empty':([23,40,41,60,62,124,126,],[69,69,93,69,69,69,69,]),'key_value_list_opt':([41,],[90,]),'set_elements':([41,],[91,]),'key_value_list':([41,],[92,]),'key_value':([41,148,],[95,175,]),'arg_list_opt':([80,],[134,]),'arg_list':([80,],[135,]),'subscript_item':([82,],[139,]),'opt_expr':([82,141,169,170,198,],[140,171,188,189,202,]),'suite':([112,115,121,181,196,199,200,],[150,155,162,194,201,203,204,]),'param_list_opt':([117,],[158,]),'param_list':([117,],[159,]),'param':([117,184,],[160,197,]),'elif_blocks':([150,204,],[178,205,]),'else_block_opt':([178,],[190,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -38,17 +38,19 @@ _lr_productions = [
   ('elif_blocks -> ELIF expr COLON suite elif_blocks','elif_blocks',5,'p_elif_blocks','parser_conditionals.py',10),
   ('elif_blocks -> <empty>','elif_blocks',0,'p_elif_blocks','parser_conditionals.py',11),
   ('for_stmt -> FOR ID IN expr COLON suite','for_stmt',6,'p_for_stmt','parser_loops.py',13),
+  ('classdef -> CLASS ID COLON suite','classdef',4,'p_classdef','parser_definitions.py',14),
   ('suite -> simple_statement','suite',1,'p_suite','parser_blocks.py',16),
   ('suite -> INDENT statement_list DEDENT','suite',3,'p_suite','parser_blocks.py',17),
-  ('classdef -> CLASS ID COLON suite','classdef',4,'p_classdef','parser_definitions.py',16),
   ('else_block_opt -> ELSE COLON suite','else_block_opt',3,'p_else_block_opt','parser_conditionals.py',18),
   ('else_block_opt -> <empty>','else_block_opt',0,'p_else_block_opt','parser_conditionals.py',19),
+  ('param_list_opt -> param_list','param_list_opt',1,'p_param_list_opt','parser_definitions.py',19),
+  ('param_list_opt -> param_list COMMA','param_list_opt',2,'p_param_list_opt','parser_definitions.py',20),
+  ('param_list_opt -> <empty>','param_list_opt',0,'p_param_list_opt','parser_definitions.py',21),
   ('statement -> simple_statement','statement',1,'p_statement','parser_statements.py',21),
   ('statement -> compound_statement','statement',1,'p_statement','parser_statements.py',22),
-  ('param_list_opt -> param COMMA param_list_opt','param_list_opt',3,'p_param_list_opt','parser_definitions.py',23),
-  ('param_list_opt -> param','param_list_opt',1,'p_param_list_opt','parser_definitions.py',24),
-  ('param_list_opt -> <empty>','param_list_opt',0,'p_param_list_opt','parser_definitions.py',25),
   ('expr -> atom','expr',1,'p_expr_atom','parser_expressions.py',23),
+  ('param_list -> param','param_list',1,'p_param_list','parser_definitions.py',25),
+  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','parser_definitions.py',26),
   ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_group','parser_expressions.py',27),
   ('simple_statement -> small_stmt','simple_statement',1,'p_simple_statement','parser_statements.py',27),
   ('atom -> atom DOT ID','atom',3,'p_atom_attribute','parser_expressions.py',31),
@@ -97,11 +99,11 @@ _lr_productions = [
   ('subscript_item -> COLON opt_expr','subscript_item',2,'p_subscript_item_slice_head','parser_expressions.py',116),
   ('subscript_item -> opt_expr COLON','subscript_item',2,'p_subscript_item_slice_tail','parser_expressions.py',121),
   ('subscript_item -> COLON','subscript_item',1,'p_subscript_item_slice_all','parser_expressions.py',126),
-  ('module -> statement_list','module',1,'p_module','parser.py',128),
   ('subscript_item -> COLON COLON opt_expr','subscript_item',3,'p_subscript_item_slice_step_only','parser_expressions.py',131),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',135),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',136),
+  ('module -> statement_list','module',1,'p_module','parser.py',132),
   ('opt_expr -> <empty>','opt_expr',0,'p_opt_expr_empty','parser_expressions.py',136),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',139),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',140),
   ('opt_expr -> expr','opt_expr',1,'p_opt_expr_expr','parser_expressions.py',140),
   ('atom -> LBRACE set_elements RBRACE','atom',3,'p_atom_set','parser_expressions.py',145),
   ('set_elements -> expr','set_elements',1,'p_set_elements_single','parser_expressions.py',150),
@@ -110,34 +112,36 @@ _lr_productions = [
   ('expr -> PLUS expr','expr',2,'p_expr_unary_plus','parser_expressions.py',165),
   ('expr -> MINUS expr','expr',2,'p_expr_unary_minus','parser_expressions.py',171),
   ('expr -> NOT expr','expr',2,'p_expr_unary_not','parser_expressions.py',176),
-  ('expr -> expr POWER expr','expr',3,'p_expr_power','parser_expressions.py',182),
-  ('expr -> expr TIMES expr','expr',3,'p_expr_multiplicative','parser_expressions.py',187),
-  ('expr -> expr DIVIDE expr','expr',3,'p_expr_multiplicative','parser_expressions.py',188),
-  ('expr -> expr FLOOR_DIVIDE expr','expr',3,'p_expr_multiplicative','parser_expressions.py',189),
-  ('expr -> expr MOD expr','expr',3,'p_expr_multiplicative','parser_expressions.py',190),
-  ('expr -> expr PLUS expr','expr',3,'p_expr_additive','parser_expressions.py',195),
-  ('expr -> expr MINUS expr','expr',3,'p_expr_additive','parser_expressions.py',196),
-  ('expr -> expr EQUALS expr','expr',3,'p_expr_comparison','parser_expressions.py',202),
-  ('expr -> expr NOT_EQUALS expr','expr',3,'p_expr_comparison','parser_expressions.py',203),
-  ('expr -> expr LESS_THAN expr','expr',3,'p_expr_comparison','parser_expressions.py',204),
-  ('expr -> expr LESS_THAN_EQUALS expr','expr',3,'p_expr_comparison','parser_expressions.py',205),
-  ('expr -> expr GREATER_THAN expr','expr',3,'p_expr_comparison','parser_expressions.py',206),
-  ('expr -> expr GREATER_THAN_EQUALS expr','expr',3,'p_expr_comparison','parser_expressions.py',207),
-  ('expr -> expr IN expr','expr',3,'p_expr_comparison','parser_expressions.py',208),
-  ('expr -> expr AND expr','expr',3,'p_expr_logical','parser_expressions.py',214),
-  ('expr -> expr OR expr','expr',3,'p_expr_logical','parser_expressions.py',215),
-  ('expr -> atom LPAREN arg_list_opt RPAREN','expr',4,'p_expr_call','parser_expressions.py',221),
-  ('arg_list_opt -> expr COMMA arg_list_opt','arg_list_opt',3,'p_arg_list_opt','parser_expressions.py',227),
-  ('arg_list_opt -> expr','arg_list_opt',1,'p_arg_list_opt','parser_expressions.py',228),
-  ('arg_list_opt -> <empty>','arg_list_opt',0,'p_arg_list_opt_empty','parser_expressions.py',235),
-  ('key_value_list -> key_value','key_value_list',1,'p_key_value_list','parser_expressions.py',239),
-  ('key_value_list -> key_value COMMA key_value_list','key_value_list',3,'p_key_value_list','parser_expressions.py',240),
-  ('key_value_list_opt -> key_value_list','key_value_list_opt',1,'p_key_value_list_opt','parser_expressions.py',247),
-  ('key_value_list_opt -> empty','key_value_list_opt',1,'p_key_value_list_opt','parser_expressions.py',248),
-  ('key_value -> expr COLON expr','key_value',3,'p_key_value','parser_expressions.py',252),
-  ('elements_opt -> elements','elements_opt',1,'p_elements_opt','parser_expressions.py',256),
-  ('elements_opt -> empty','elements_opt',1,'p_elements_opt','parser_expressions.py',257),
-  ('elements -> expr','elements',1,'p_elements','parser_expressions.py',261),
-  ('elements -> elements COMMA expr','elements',3,'p_elements','parser_expressions.py',262),
-  ('empty -> <empty>','empty',0,'p_empty','parser_expressions.py',269),
+  ('expr -> expr POWER expr','expr',3,'p_expr_binary','parser_expressions.py',184),
+  ('expr -> expr TIMES expr','expr',3,'p_expr_binary','parser_expressions.py',185),
+  ('expr -> expr DIVIDE expr','expr',3,'p_expr_binary','parser_expressions.py',186),
+  ('expr -> expr FLOOR_DIVIDE expr','expr',3,'p_expr_binary','parser_expressions.py',187),
+  ('expr -> expr MOD expr','expr',3,'p_expr_binary','parser_expressions.py',188),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_binary','parser_expressions.py',189),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_binary','parser_expressions.py',190),
+  ('expr -> expr AND expr','expr',3,'p_expr_binary','parser_expressions.py',191),
+  ('expr -> expr OR expr','expr',3,'p_expr_binary','parser_expressions.py',192),
+  ('expr -> expr EQUALS expr','expr',3,'p_expr_comparison','parser_expressions.py',198),
+  ('expr -> expr NOT_EQUALS expr','expr',3,'p_expr_comparison','parser_expressions.py',199),
+  ('expr -> expr LESS_THAN expr','expr',3,'p_expr_comparison','parser_expressions.py',200),
+  ('expr -> expr LESS_THAN_EQUALS expr','expr',3,'p_expr_comparison','parser_expressions.py',201),
+  ('expr -> expr GREATER_THAN expr','expr',3,'p_expr_comparison','parser_expressions.py',202),
+  ('expr -> expr GREATER_THAN_EQUALS expr','expr',3,'p_expr_comparison','parser_expressions.py',203),
+  ('expr -> expr IN expr','expr',3,'p_expr_comparison','parser_expressions.py',204),
+  ('expr -> atom LPAREN arg_list_opt RPAREN','expr',4,'p_expr_call','parser_expressions.py',210),
+  ('arg_list_opt -> arg_list','arg_list_opt',1,'p_arg_list_opt','parser_expressions.py',216),
+  ('arg_list_opt -> arg_list COMMA','arg_list_opt',2,'p_arg_list_opt','parser_expressions.py',217),
+  ('arg_list_opt -> <empty>','arg_list_opt',0,'p_arg_list_opt_empty','parser_expressions.py',221),
+  ('arg_list -> expr','arg_list',1,'p_arg_list','parser_expressions.py',225),
+  ('arg_list -> arg_list COMMA expr','arg_list',3,'p_arg_list','parser_expressions.py',226),
+  ('key_value_list -> key_value','key_value_list',1,'p_key_value_list','parser_expressions.py',234),
+  ('key_value_list -> key_value_list COMMA key_value','key_value_list',3,'p_key_value_list','parser_expressions.py',235),
+  ('key_value_list_opt -> key_value_list','key_value_list_opt',1,'p_key_value_list_opt','parser_expressions.py',243),
+  ('key_value_list_opt -> empty','key_value_list_opt',1,'p_key_value_list_opt','parser_expressions.py',244),
+  ('key_value -> expr COLON expr','key_value',3,'p_key_value','parser_expressions.py',248),
+  ('elements_opt -> elements','elements_opt',1,'p_elements_opt','parser_expressions.py',252),
+  ('elements_opt -> empty','elements_opt',1,'p_elements_opt','parser_expressions.py',253),
+  ('elements -> expr','elements',1,'p_elements','parser_expressions.py',257),
+  ('elements -> elements COMMA expr','elements',3,'p_elements','parser_expressions.py',258),
+  ('empty -> <empty>','empty',0,'p_empty','parser_expressions.py',266),
 ]
@@ -0,0 +1,15 @@
+'''Shared fixtures for the lexer tests.'''
+
+import pytest
+
+from src.lexer.lexer import Lexer
+
+
+@pytest.fixture(scope="session")
+def shared_lexer():
+    """One built Lexer for the whole session; building it compiles PLY's tables.
+    Returns the lexer and the error list it reports into."""
+    errors = []
+    lx = Lexer(errors)
+    lx.build()
+    return lx, errors
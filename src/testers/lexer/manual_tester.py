@@ -1,4 +1,6 @@
 import sys
+from itertools import zip_longest
+
 from src.lexer.lexer import Lexer
 
 def read_file(file_path):
@@ -18,25 +20,29 @@ def format_token(token):
 
 
 def compare_results(lexer_output, expected_output):
-    """Compare lexer output with expected output"""
-    lexer_tokens = [format_token(token) for token in lexer_output]
-    expected_lines = [
+    """Compare lexer output with expected output.
+
+    `lexer_output` may be any iterable of tokens; it is consumed lazily and
+    the comparison stops at the first mismatch.
+    """
+    lexer_tokens = map(format_token, lexer_output)
+    expected_lines = (
         line.strip() for line in expected_output.strip().split("\n") if line.strip()
-    ]
-
-    if len(lexer_tokens) != len(expected_lines):
-        print("❌ Test failed: Number of tokens doesn't match")
-        print(f"Expected {len(expected_lines)} tokens, got {len(lexer_tokens)}")
-        print("\nActual tokens:")
-        for token in lexer_tokens:
-            print(token)
-        print("\nExpected tokens:")
-        for token in expected_lines:
-            print(token)
-        return False
-
-    for i, (actual, expected) in enumerate(zip(lexer_tokens, expected_lines)):
-        if actual.strip() != expected.strip():
+    )
+
+    # Both sides are already normalized: expected lines were stripped above
+    # and format_token never adds surrounding whitespace.
+    pairs = zip_longest(lexer_tokens, expected_lines)
+    for i, (actual, expected) in enumerate(pairs):
+        if actual is None or expected is None:
+            # One side ran out; count what is left of the other one.
+            remaining = 1 + sum(1 for _ in pairs)
+            got = i + (remaining if expected is None else 0)
+            want = i + (remaining if actual is None else 0)
+            print("❌ Test failed: Number of tokens doesn't match")
+            print(f"Expected {want} tokens, got {got}")
+            return False
+        if actual != expected:
             print(f"❌ Mismatch at token {i+1}:")
             print(f"Expected: {expected}")
             print(f"Got: {actual}")
@@ -64,15 +70,8 @@ def main():
     lexer.data = test_content
     lexer.lex.input(test_content)
 
-    # Collect all tokens
-    tokens = []
-    while True:
-        tok = lexer.lex.token()
-        if not tok:
-            break
-        tokens.append(tok)
-
-    if compare_results(tokens, expected_content):
+    # Tokens are streamed into the comparison instead of collected first
+    if compare_results(iter(lexer.lex.token, None), expected_content):
         print("✅ Test passed: All tokens match expected output")
     else:
         print("❌ Test failed: Tokens don't match expected output")
@@ -1,39 +1,31 @@
 '''Unit tests for the Indentation component of the TransPYler project.'''
 
-from src.lexer.lexer import Lexer
 
-def _lex_all(src: str):
-    """Consume the entire input and return (tokens, errors)."""
-    errors = []
-    lx = Lexer(errors)
-    lx.build()
-    lx.data = src
-    lx.lex.input(lx.data)
-    tokens = []
-    while True:
-        t = lx.lex.token()
-        if not t:
-            break
-        tokens.append(t)
+def _lex_all(src: str, shared_lexer):
+    """Consume the entire input with the session lexer and return (tokens, errors)."""
+    lx, errors = shared_lexer
+    errors.clear()
+    lx.input(src)
+    tokens = list(iter(lx.lex.token, None))
     return tokens, errors
 
 def _indent_types(tokens):
     """Return only indentation token types."""
     return [t.type for t in tokens if t.type in ("INDENT", "DEDENT")]
 
-def test_simple_block_indent_and_dedent():
+def test_simple_block_indent_and_dedent(shared_lexer):
     src = (
         "def f():\n"
         "    x = 1\n"
         "    return x\n"
     )  # At EOF, the closing DEDENT must be emitted
-    tokens, errors = _lex_all(src)
+    tokens, errors = _lex_all(src, shared_lexer)
     inds = _indent_types(tokens)
     assert not errors
     # Exactly 1 INDENT when entering the block and 1 DEDENT when closing it
     assert inds == ["INDENT", "DEDENT"]
 
-def test_nested_blocks_sequence_counts():
+def test_nested_blocks_sequence_counts(shared_lexer):
     src = (
         "def f():\n"
         "    if x:\n"
@@ -42,7 +34,7 @@ def test_nested_blocks_sequence_counts():
         "        y = 2\n"
         "    z = 3\n"
     )
-    tokens, errors = _lex_all(src)
+    tokens, errors = _lex_all(src, shared_lexer)
     inds = _indent_types(tokens)
     assert not errors
     # Levels: def(INDENT), if(INDENT), close if(DEDENT),
@@ -50,20 +42,20 @@ def test_nested_blocks_sequence_counts():
     assert inds.count("INDENT") == 3
     assert inds.count("DEDENT") == 3
 
-def test_multiple_dedents_at_eof():
+def test_multiple_dedents_at_eof(shared_lexer):
     src = (
         "def a():\n"
         "    def b():\n"
         "        x = 1\n"
         "        y = 2\n"
     )  # At EOF, DEDENTs must be emitted to close b and a
-    tokens, errors = _lex_all(src)
+    tokens, errors = _lex_all(src, shared_lexer)
     inds = _indent_types(tokens)
     assert not errors
     assert inds.count("INDENT") == 2
     assert inds.count("DEDENT") == 2
 
-def test_blank_lines_and_comments_do_not_change_indentation():
+def test_blank_lines_and_comments_do_not_change_indentation(shared_lexer):
     src = (
         "def f():\n"
         "    x = 1\n"
@@ -72,28 +64,72 @@ def test_blank_lines_and_comments_do_not_change_indentation():
         "    y = 2\n"
         "pass\n"
     )  # 'pass' at level 0 forces the DEDENT of f's block
-    tokens, errors = _lex_all(src)
+    tokens, errors = _lex_all(src, shared_lexer)
     inds = _indent_types(tokens)
     assert not errors
     assert inds == ["INDENT", "DEDENT"]
 
-def test_inconsistent_tabs_and_spaces_reports_error():
+def test_inconsistent_tabs_and_spaces_reports_error(shared_lexer):
     src = (
         "def f():\n"
         "\t x = 1\n"    # tab
         "    y = 2\n"   # spaces
     )
-    tokens, errors = _lex_all(src)
+    tokens, errors = _lex_all(src, shared_lexer)
     # There must be at least one indentation error for mixing tabs and spaces
     assert any("indent" in e.message.lower() for e in errors)
 
-def test_unindent_not_matching_any_level_reports_error():
+def test_unindent_not_matching_any_level_reports_error(shared_lexer):
     # First line indented with 6 spaces; next line with 4 spaces (not in the stack)
     src = (
         "def f():\n"
         "      x = 1\n"   # 6 spaces
         "    y = 2\n"     # 4 spaces -> does not match 0 or 6
     )
-    tokens, errors = _lex_all(src)
+    tokens, errors = _lex_all(src, shared_lexer)
     assert errors, "An error must be reported for a misaligned dedent"
     assert any("unindent" in e.message.lower() or "indentation" in e.message.lower() for e in errors)
+
+def test_indented_first_line_reports_unexpected_indent(shared_lexer):
+    # No newline precedes the first line, but its indentation is still checked
+    tokens, errors = _lex_all("    x = 1\n", shared_lexer)
+    assert _indent_types(tokens) == ["INDENT", "DEDENT"]
+    assert any("unexpected indent" in e.message.lower() for e in errors)
+
+def test_input_keeps_source_positions(shared_lexer):
+    # Lexer.input must not shift line numbers or positions of the source text
+    tokens, _ = _lex_all("x = 1\ny = 2\n", shared_lexer)
+    assert [(t.value, t.lineno, t.lexpos) for t in tokens if t.type == "ID"] == [
+        ("x", 1, 0),
+        ("y", 2, 6),
+    ]
+
+def test_indentation_errors_point_at_the_indented_line(shared_lexer):
+    # Errors and INDENT tokens refer to the badly indented line, not the one before
+    _, errors = _lex_all("x = 1\nif x:\ny = 2\n", shared_lexer)
+    assert [(e.message, e.line, e.column) for e in errors] == [
+        ("Expected an indented block", 3, 12),
+    ]
+    tokens, errors = _lex_all("x = 1\ny = 2\n   z = 3\n", shared_lexer)
+    assert [(e.message, e.line) for e in errors] == [
+        ("Indentation is not a multiple of 4", 3),
+        ("Unexpected indent", 3),
+    ]
+    assert repr(errors[1]).endswith("On:\nz = 3\n^")
+    indent = next(t for t in tokens if t.type == "INDENT")
+    assert (indent.lineno, indent.lexpos) == (3, 12)
+
+def test_synthetic_tokens_are_slotted(shared_lexer):
+    # INDENT/DEDENT tokens carry the LexToken fields without an instance dict
+    tokens, _ = _lex_all("if x:\n    y = 1\n", shared_lexer)
+    indent = next(t for t in tokens if t.type == "INDENT")
+    assert not hasattr(indent, "__dict__")
+    assert repr(indent) == f"LexToken(INDENT,{indent.value!r},{indent.lineno},{indent.lexpos})"
+
+def test_reused_lexer_starts_each_input_fresh(shared_lexer):
+    # An unclosed '(' and a pending block must not leak into the next input
+    _lex_all("if x:\n    f(\n", shared_lexer)
+    tokens, errors = _lex_all("y = 1\n", shared_lexer)
+    assert not errors
+    assert _indent_types(tokens) == []
+    assert [(t.type, t.lineno) for t in tokens][:3] == [("ID", 1), ("ASSIGN", 1), ("NUMBER", 1)]
@@ -1,41 +1,37 @@
 '''Unit tests for the Lexer component of the TransPYler project.'''
 
+from src.core.symbol_table import SymbolTable
+from src.core.utils import get_context
 from src.lexer.lexer import Lexer
 
 
-def _lex_all(src):
+def _lex_all(src, shared_lexer):
     """Helper function to lex all tokens from a source string.
+    Reuses the session lexer from `shared_lexer`, clearing its errors first.
     Returns list of tokens and any lexical errors."""
-    errors = []
-    lx = Lexer(errors)
-    lx.build()
-    lx.data = src
-    lx.lex.input(lx.data)
-    tokens = []
-    while True:
-        t = lx.lex.token()
-        if not t:
-            break
-        tokens.append(t)
+    lx, errors = shared_lexer
+    errors.clear()
+    lx.input(src)
+    tokens = list(iter(lx.lex.token, None))
     return tokens, errors
 
 
-def test_correct_keywords():
+def test_correct_keywords(shared_lexer):
     """
     Test if lexer correctly identifies and tokenizes Python keywords.
     Raises:
         AssertionError: If token types or values don't match expected keywords,
         or if lexical errors are found
     """
-    tokens, errors = _lex_all("if else while return")
+    tokens, errors = _lex_all("if else while return", shared_lexer)
     assert [t.type for t in tokens] == ["IF", "ELSE", "WHILE", "RETURN"]
     assert all(t.value in ["if", "else", "while", "return"] for t in tokens)
     assert not errors
 
 
-def test_correct_numbers():
+def test_correct_numbers(shared_lexer):
     """Test lexer on various correct number formats."""
-    tokens, errors = _lex_all("123 45.67 0.001 1000 .6767676785894595")
+    tokens, errors = _lex_all("123 45.67 0.001 1000 .6767676785894595", shared_lexer)
     assert [t.type for t in tokens] == [
         "NUMBER",
         "NUMBER",
@@ -47,10 +43,10 @@ def test_correct_numbers():
     assert not errors
 
 
-def test_number_dot_number():
+def test_number_dot_number(shared_lexer):
     """Test lexer on incorrect input: number dot number without spaces. This is not a lexical error,
     but should be tokenized as three separate NUMBER TOKENS"""
-    tokens, errors = _lex_all("127.0 .0 .1")
+    tokens, errors = _lex_all("127.0 .0 .1", shared_lexer)
     assert len(tokens) == 3
     assert tokens[0].type == "NUMBER"
     assert abs(tokens[0].value - 127.0) < 1e-10
@@ -61,20 +57,20 @@ def test_number_dot_number():
     assert not errors
 
 
-def test_negative_numbers():
+def test_negative_numbers(shared_lexer):
     """Test that negative numbers are tokenized as separate MINUS and NUMBER tokens."""
-    tokens, errors = _lex_all("-42 -3.14 -.001 -0.5")
+    tokens, errors = _lex_all("-42 -3.14 -.001 -0.5", shared_lexer)
     types = ["MINUS", "NUMBER", "MINUS", "NUMBER", "MINUS", "NUMBER", "MINUS", "NUMBER"]
     assert [t.type for t in tokens] == types
     assert [t.value for t in tokens] == ["-", 42, "-", 3.14, "-", 0.001, "-", 0.5]
     assert not errors
 
 
-def test_leading_zeros():
+def test_leading_zeros(shared_lexer):
     """Test lexer for numbers with leading zeros. This is not a lexical error,
     but the leading zeros should be ignored in the token value. This is a parser concern.
     """
-    tokens, errors = _lex_all("007 000.5 0123")
+    tokens, errors = _lex_all("007 000.5 0123", shared_lexer)
     types = ["NUMBER", "NUMBER", "NUMBER"]
     values = [7, 0.5, 123]
     assert [t.type for t in tokens] == types
@@ -82,9 +78,9 @@ def test_leading_zeros():
     assert not errors
 
 
-def test_numbers_with_operators():
+def test_numbers_with_operators(shared_lexer):
     """Test lexer for numbers mixed with operators."""
-    tokens, errors = _lex_all("5-3 4.5+2.3")
+    tokens, errors = _lex_all("5-3 4.5+2.3", shared_lexer)
     assert [t.type for t in tokens] == [
         "NUMBER",
         "MINUS",
@@ -97,9 +93,9 @@ def test_numbers_with_operators():
     assert not errors
 
 
-def test_large_numbers():
+def test_large_numbers(shared_lexer):
     """Test lexer for very large numbers."""
-    tokens, errors = _lex_all("12345678901234567890 1.7976931348623157e+308")
+    tokens, errors = _lex_all("12345678901234567890 1.7976931348623157e+308", shared_lexer)
     types = ["NUMBER", "NUMBER"]
     values = [12345678901234567890, 1.7976931348623157e308]
     assert [t.type for t in tokens] == types
@@ -107,9 +103,9 @@ def test_large_numbers():
     assert not errors
 
 
-def test_scientific_notation():
+def test_scientific_notation(shared_lexer):
     """Test lexer for numbers in scientific notation."""
-    tokens, errors = _lex_all("1e10 3.14e-2 2E+5 -1.23e-4")
+    tokens, errors = _lex_all("1e10 3.14e-2 2E+5 -1.23e-4", shared_lexer)
     types = ["NUMBER", "NUMBER", "NUMBER", "MINUS", "NUMBER"]
     values = [1e10, 3.14e-2, 2e5, "-", 1.23e-4]
     assert [t.type for t in tokens] == types
@@ -117,33 +113,33 @@ def test_scientific_notation():
     assert not errors
 
 
-def test_basic_strings():
+def test_basic_strings(shared_lexer):
     """Test lexer on basic string formats with single and double quotes."""
-    tokens, errors = _lex_all("\"Hello\" 'World' \"Python\" 'Testing'")
+    tokens, errors = _lex_all("\"Hello\" 'World' \"Python\" 'Testing'", shared_lexer)
     assert [t.type for t in tokens] == ["STRING", "STRING", "STRING", "STRING"]
     assert [t.value for t in tokens] == ["Hello", "World", "Python", "Testing"]
     assert not errors
 
 
-def test_empty_strings():
+def test_empty_strings(shared_lexer):
     """Test lexer on empty strings."""
-    tokens, errors = _lex_all("\"\" '' \"\" ''")
+    tokens, errors = _lex_all("\"\" '' \"\" ''", shared_lexer)
     assert [t.type for t in tokens] == ["STRING", "STRING", "STRING", "STRING"]
     assert [t.value for t in tokens] == ["", "", "", ""]
     assert not errors
 
 
-def test_strings_with_spaces():
+def test_strings_with_spaces(shared_lexer):
     """Test lexer on strings containing spaces and special characters."""
-    tokens, errors = _lex_all('"Hello World" "  spaces  " "!@#$%^&*()"')
+    tokens, errors = _lex_all('"Hello World" "  spaces  " "!@#$%^&*()"', shared_lexer)
     assert [t.type for t in tokens] == ["STRING", "STRING", "STRING"]
     assert [t.value for t in tokens] == ["Hello World", "  spaces  ", "!@#$%^&*()"]
     assert not errors
 
 
-def test_mixed_quotes():
+def test_mixed_quotes(shared_lexer):
     """Test lexer on strings with mixed quote types."""
-    tokens, errors = _lex_all("\"Contains 'single' quotes\" 'Contains \"double\" quotes'")
+    tokens, errors = _lex_all("\"Contains 'single' quotes\" 'Contains \"double\" quotes'", shared_lexer)
     assert [t.type for t in tokens] == ["STRING", "STRING"]
     assert [t.value for t in tokens] == [
         "Contains 'single' quotes",
@@ -152,34 +148,50 @@ def test_mixed_quotes():
     assert not errors
 
 
-def test_strings_with_numbers():
+def test_strings_with_numbers(shared_lexer):
     """Test lexer on strings containing numbers and mixed content."""
-    tokens, errors = _lex_all('"123" "num 456" "0.123" "1e10"')
+    tokens, errors = _lex_all('"123" "num 456" "0.123" "1e10"', shared_lexer)
     assert [t.type for t in tokens] == ["STRING", "STRING", "STRING", "STRING"]
     assert [t.value for t in tokens] == ["123", "num 456", "0.123", "1e10"]
     assert not errors
 
 
-def test_unterminated_string():
+def test_unterminated_string(shared_lexer):
     """Test lexer on an unterminated string to ensure it raises a lexical error."""
-    tokens, errors = _lex_all('"Unfinished string')
+    tokens, errors = _lex_all('"Unfinished string', shared_lexer)
     assert len(tokens) == 0
     assert len(errors) == 1
     assert errors[0].message == "Unterminated string literal"
 
 
-def test_multiline_strings():
+def test_multiline_strings(shared_lexer):
     """Test lexer on multiline strings using line continuation."""
     tokens, errors = \
-    _lex_all("'''Triple quotation string\n continues here''' 'But single quotation ones\n do not'")
+    _lex_all("'''Triple quotation string\n continues here''' 'But single quotation ones\n do not'", shared_lexer)
     assert tokens[0].type == "STRING"
-    assert len(errors) == 1
-    assert errors[0].message == "Unterminated string literal"
+    # Only the broken literal is skipped, so the next line is lexed and its own
+    # problems (the odd indent and the lone closing quote) are reported too.
+    assert [e.message for e in errors] == [
+        "Unterminated string literal",
+        "Indentation is not a multiple of 4",
+        "Unexpected indent",
+        "Illegal character '''",
+    ]
+    assert [t.value for t in tokens if t.type in ("ID", "NOT")] == ["do", "not"]
+
+
+def test_unterminated_string_skips_only_the_literal(shared_lexer):
+    """Test that tokens right after an unterminated string's line still lex."""
+    tokens, errors = _lex_all('x = "abc\ny = 1', shared_lexer)
+    assert [(t.type, t.value) for t in tokens] == [
+        ("ID", "x"), ("ASSIGN", "="), ("ID", "y"), ("ASSIGN", "="), ("NUMBER", 1),
+    ]
+    assert [e.message for e in errors] == ["Unterminated string literal"]
 
 
-def test_strings_with_escapes():
+def test_strings_with_escapes(shared_lexer):
     """Test lexer on strings containing escape sequences."""
-    tokens, errors = _lex_all(r""""Tab\there" "Quote\"mark" 'Back\\slash' ''""")
+    tokens, errors = _lex_all(r""""Tab\there" "Quote\"mark" 'Back\\slash' ''""", shared_lexer)
     assert not errors
     assert [t.type for t in tokens] == ["STRING", "STRING", "STRING", "STRING"]
     assert [t.value for t in tokens] == [
@@ -189,10 +201,92 @@ def test_strings_with_escapes():
         "",
     ]
 
-def test_unknown_escapes_are_preserved():
+def test_escaped_backslash_is_not_reprocessed(shared_lexer):
+    """Test that an escaped backslash followed by 'n' is not turned into a newline."""
+    tokens, errors = _lex_all(r'"a\\nb" "c\\\"d"', shared_lexer)
+    assert not errors
+    assert [t.value for t in tokens] == ["a\\nb", 'c\\"d']
+
+def test_unknown_escapes_are_preserved(shared_lexer):
     '''Test lexer on strings with unknown escape sequences to ensure they are preserved as-is.'''
     s = r'"foo\qbar\xZZ"'
-    tokens, errors = _lex_all(s)
+    tokens, errors = _lex_all(s, shared_lexer)
     assert tokens[0].type == "STRING"
     assert tokens[0].value == r"foo\qbar\xZZ"
     assert not errors
+
+def test_fast_path_tokens_carry_the_lexer(shared_lexer):
+    """Test that punctuation skipping PLY's master regex still exposes `.lexer`."""
+    tokens, errors = _lex_all("f(a, b)[0]:", shared_lexer)
+    punctuation = [t for t in tokens if t.type not in ("ID", "NUMBER")]
+    assert [t.value for t in punctuation] == ["(", ",", ")", "[", "]", ":"]
+    assert all(t.lexer is shared_lexer[0].lex for t in punctuation)
+    assert not errors
+
+
+def test_symbol_table_keeps_first_occurrence():
+    '''Test that identifiers reach the symbol table once lexing ends, at their first position.'''
+    errors = []
+    lx = Lexer(errors)
+    lx.build()
+    lx.input("x = y\nif x:\n    z = y\n")
+    list(iter(lx.lex.token, None))
+    table = lx.symbol_table.table
+    assert list(table) == ["x", "y", "z"]
+    assert table["y"]["Position"] == {"line": 1, "pos": 4}
+    assert "if" not in table
+
+def test_symbol_table_get_and_remove():
+    '''Test that get rebuilds an entry and remove forgets only the removed symbol.'''
+    table = SymbolTable()
+    table.add("a", 0, 1, "identifier")
+    table.extend([("b", (4, 2)), ("a", (9, 9))], "identifier")
+    assert table.get("a") == {"Position": {"line": 1, "pos": 0}, "Type": "identifier"}
+    table.remove("a")
+    assert not table.exists("a")
+    assert list(table.table) == ["b"]
+    assert table.get("b")["Position"] == {"line": 2, "pos": 4}
+
+def test_symbol_table_accessors_and_snapshots():
+    '''Test the per-field accessors, and that get/table return detached snapshots.'''
+    table = SymbolTable()
+    table.add("a", 7, 3, "identifier")
+    assert (table.line_of("a"), table.pos_of("a"), table.type_of("a")) == (3, 7, "identifier")
+    table.get("a")["Type"] = "changed"
+    table.table["a"]["Position"]["line"] = 99
+    assert table.get("a") == {"Position": {"line": 3, "pos": 7}, "Type": "identifier"}
+    table.set_type("a", "function")
+    assert table.type_of("a") == "function" == table.table["a"]["Type"]
+
+def test_symbol_table_accepts_missing_positions():
+    '''Test that a None line or position is stored and returned as None.'''
+    table = SymbolTable()
+    table.add("a", None, None)
+    table.add("b", 0, None)
+    assert table.get("a")["Position"] == {"line": None, "pos": None}
+    assert table.get("b")["Position"] == {"line": None, "pos": 0}
+    assert (table.line_of("b"), table.pos_of("a")) == (None, None)
+
+def test_symbol_table_reuses_removed_rows():
+    '''Test that adding after removing does not grow the columns.'''
+    table = SymbolTable()
+    table.extend([("a", (0, 1)), ("b", (4, 1))], "identifier")
+    for _ in range(3):
+        table.remove("a")
+        table.add("a", 8, 2, "identifier")
+    assert len(table._lines) == len(table._types) == 2
+    assert list(table.table) == ["b", "a"]
+    assert table.get("a") == {"Position": {"line": 2, "pos": 8}, "Type": "identifier"}
+    assert table.get("b")["Position"] == {"line": 1, "pos": 4}
+
+def test_get_context_out_of_range_lines():
+    '''Test that line 0 (end of input) and lines past the end show the last line.'''
+    data = "x = 1\ny = 2\n"
+    assert get_context(data, 0, 0) == get_context(data, 3, 0) == "\n^"
+    assert get_context(data, 99, 12) == "\n^"
+
+def test_get_context_last_line_without_newline():
+    '''Test the caret on a final line that has no trailing newline.'''
+    data = "x = 1\n    y = )"
+    assert get_context(data, 2, 14) == "y = )\n    ^"
+    assert get_context(data, 5, 14) == get_context(data, 2, 14)
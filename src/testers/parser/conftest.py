@@ -0,0 +1,48 @@
+'''Shared fixtures for the parser tests.'''
+
+import pytest
+
+from src.parser.parser import Parser
+
+# Covers every node kind the AST utility tests look at, including empty
+# calls, parameter lists and elif chains.
+AST_SOURCE = """
+def f(a, b=2):
+    return a.b[1] + -a
+class C:
+    x = {1: "one"}
+    y = {1, 2}
+if x > 1:
+    pass
+elif x == 0:
+    continue
+else:
+    break
+for i in range(3):
+    print((i, [i]))
+g()
+def h():
+    pass
+if y:
+    z
+"""
+
+
+@pytest.fixture(scope="session")
+def shared_parser():
+    """One Parser for the whole session; building it sets up the lexer and
+    the LALR tables. `Parser.parse` clears errors and lexer state per call."""
+    return Parser(debug=False)
+
+
+@pytest.fixture
+def parser(shared_parser):
+    """The session parser, with no errors left over from a previous test."""
+    shared_parser.errors.clear()
+    return shared_parser
+
+
+@pytest.fixture
+def tree(parser):
+    """A fresh parse of `AST_SOURCE` with the session parser; tests may mutate it."""
+    return parser.parse(AST_SOURCE)
@@ -0,0 +1,52 @@
+"""
+Tests for the on-disk AST cache used by `ast_cli --cache`.
+"""
+
+import os
+
+from src.core.ast import Identifier
+from src.tools.ast_cache import get_ast, parse_cached, put_ast
+
+SOURCE = "x = [1, 2]\nif x:\n    print(x)\n"
+
+
+class TestAstCache:
+    """Test storing and reusing parsed trees by source hash."""
+
+    def test_second_parse_is_served_from_cache(self, parser, tmp_path):
+        tree = parse_cached(parser, SOURCE, tmp_path)
+        assert len(list(tmp_path.iterdir())) == 1
+        cached = parse_cached(parser, SOURCE, tmp_path)
+        assert cached is not tree and cached == tree
+        assert not parser.errors
+
+    def test_changed_source_misses(self, parser, tmp_path):
+        put_ast(SOURCE, parser.parse(SOURCE), tmp_path)
+        assert get_ast(SOURCE + "y = 1\n", tmp_path) is None
+
+    def test_parse_with_errors_is_not_cached(self, parser, tmp_path):
+        parse_cached(parser, "x = (1 +\n", tmp_path)
+        assert parser.errors
+        assert not list(tmp_path.iterdir())
+
+    def test_cached_tree_has_no_stale_hashes(self, parser, tmp_path):
+        tree = parser.parse(SOURCE).freeze()
+        value = hash(tree)
+        put_ast(SOURCE, tree, tmp_path)
+        assert tree._hash == value
+        cached = get_ast(SOURCE, tmp_path)
+        assert cached._hash is None and cached == tree and hash(cached) == value
+
+    def test_entry_that_is_not_a_module_misses(self, tmp_path):
+        put_ast(SOURCE, Identifier(name="x"), tmp_path)
+        assert len(list(tmp_path.iterdir())) == 1
+        assert get_ast(SOURCE, tmp_path) is None
+
+    def test_directory_of_another_user_is_ignored(self, parser, tmp_path, monkeypatch):
+        put_ast(SOURCE, parser.parse(SOURCE), tmp_path)
+        other = tmp_path / "other"
+        other.mkdir()
+        monkeypatch.setattr(os, "getuid", lambda: tmp_path.stat().st_uid + 1, raising=False)
+        assert get_ast(SOURCE, tmp_path) is None
+        put_ast(SOURCE, parser.parse(SOURCE), other)
+        assert not list(other.iterdir())
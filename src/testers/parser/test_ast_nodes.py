@@ -0,0 +1,203 @@
+"""
+Tests for AST node utilities (serialization and traversal).
+"""
+
+import json
+from dataclasses import FrozenInstanceError
+
+import pytest
+from src.core.ast import (
+    AstNode,
+    Block,
+    Break,
+    Continue,
+    Identifier,
+    NodeVisitor,
+    Pass,
+    ToDictVisitor,
+    load_ast,
+    save_ast,
+    walk,
+)
+from src.core.ast import ast_base
+from src.tools.ast_viewer import write_ast_json
+
+
+class TestVisitor:
+    """Test the shared NodeVisitor traversal."""
+
+    def test_to_dict_visitor_matches_to_dict(self, tree):
+        assert ToDictVisitor().visit(tree) == tree.to_dict()
+
+    def test_generic_visit_reaches_nested_nodes(self, tree):
+        class NameCollector(NodeVisitor):
+            def __init__(self):
+                self.names = []
+
+            def visit_Identifier(self, node):
+                self.names.append(node.name)
+
+        collector = NameCollector()
+        collector.visit(tree)
+        assert collector.names.count("a") == 3
+        assert "range" in collector.names and "print" in collector.names
+        assert NameCollector._handlers[Identifier.KIND] is NameCollector.visit_Identifier
+
+    def test_walk_matches_visitor_order(self, tree):
+        class Recorder(NodeVisitor):
+            def __init__(self):
+                self.seen = []
+
+            def visit(self, node):
+                self.seen.append(node)
+                return super().visit(node)
+
+        recorder = Recorder()
+        recorder.visit(tree)
+        assert [id(n) for n in walk(tree)] == [id(n) for n in recorder.seen]
+
+
+class TestFreeze:
+    """Test converting parsed trees to immutable child sequences."""
+
+    def test_freeze_preserves_to_dict(self, tree):
+        expected = tree.to_dict()
+        assert tree.freeze() is tree
+        assert tree.to_dict() == expected
+
+    def test_freeze_replaces_lists_with_tuples(self, tree):
+        tree.freeze()
+        func, if_stmt = tree.body[0], tree.body[2]
+        assert isinstance(tree.body, tuple)
+        assert isinstance(func.params, tuple)
+        assert isinstance(func.body.statements, tuple)
+        assert isinstance(if_stmt.elifs, tuple)
+        assert all(isinstance(pair, tuple) for pair in if_stmt.elifs)
+
+
+class TestEmptySequences:
+    """Test that empty child sequences are lists, like non-empty ones."""
+
+    def test_parsed_empty_sequences_are_lists(self, tree):
+        call, func, if_stmt = tree.body[-3:]
+        assert call.value.args == [] and isinstance(call.value.args, list)
+        assert func.params == [] and isinstance(func.params, list)
+        assert if_stmt.elifs == [] and isinstance(if_stmt.elifs, list)
+
+    def test_defaults_are_fresh_lists(self):
+        first, second = Block(), Block()
+        assert first.statements == [] and first.statements is not second.statements
+
+
+class TestSharedLeaves:
+    """Test that position-less Break/Continue/Pass nodes are shared."""
+
+    def test_get_without_position_returns_singleton(self):
+        assert Pass.get() is Pass.get()
+        assert Break.get() is not Continue.get()
+
+    def test_get_with_position_builds_new_node(self):
+        node = Break.get(line=3, col=4)
+        assert node is not Break.get()
+        assert (node.line, node.col) == (3, 4)
+
+
+class TestFromDict:
+    """Test rebuilding trees from their dictionary form."""
+
+    def test_round_trip_through_dict(self, tree):
+        assert AstNode.from_dict(tree.to_dict()) == tree
+
+    def test_round_trip_through_file(self, tree, tmp_path):
+        path = tmp_path / "ast.json"
+        save_ast(tree, path)
+        assert load_ast(path) == tree
+
+    def test_json_bytes_with_integer_beyond_64_bits(self, parser):
+        big = parser.parse("x = 123456789012345678901234567890\n")
+        for indent in (False, True):
+            assert json.loads(big.to_json_bytes(indent)) == big.to_dict()
+
+    def test_json_bytes_keeps_non_finite_floats(self, parser):
+        inf = parser.parse("x = 1e400\n")
+        compact = inf.to_json_bytes()
+        assert b"Infinity" in compact and b"null" not in compact
+        assert json.loads(compact) == inf.to_dict()
+
+    def test_non_finite_float_round_trips(self, parser, tmp_path):
+        inf = parser.parse("x = 1e400\n")
+        path = tmp_path / "ast.json"
+        save_ast(inf, path)
+        loaded = load_ast(path)
+        assert loaded == inf and loaded.body[0].value.value == float("inf")
+        write_ast_json(inf, path)
+        assert json.loads(path.read_bytes()) == inf.to_dict()
+
+    def test_json_bytes_fallback_output(self, parser, monkeypatch):
+        # Without orjson the json module writes the document, float spelling
+        # included, exactly as pinned here.
+        monkeypatch.setattr(ast_base, "ORJSON_OK", False)
+        small = parser.parse("x = 2.5e-7\n")
+        assert small.to_json_bytes() == (
+            b'{"_type":"Module","body":[{"_type":"Assign","target":'
+            b'{"_type":"Identifier","name":"x","line":1,"col":0},"op":"=",'
+            b'"value":{"_type":"LiteralExpr","value":2.5e-07,"line":1,"col":4},'
+            b'"line":0,"col":0}],"line":1,"col":0}'
+        )
+        assert small.to_json_bytes(indent=True).startswith(
+            b'{\n  "_type": "Module",\n  "body": [\n    {\n'
+        )
+
+    def test_from_dict_checks_requested_class(self, tree):
+        with pytest.raises(TypeError):
+            Identifier.from_dict(tree.to_dict())
+
+
+class TestSlots:
+    """Test that nodes are slotted dataclasses without an instance dict."""
+
+    def test_parsed_nodes_have_no_instance_dict(self, tree):
+        for node in (tree, tree.body[0], tree.body[2], tree.body[2].body):
+            assert not hasattr(node, "__dict__")
+
+    def test_undeclared_attributes_are_rejected(self):
+        with pytest.raises(AttributeError):
+            Pass(line=1).extra = True
+
+
+class TestHash:
+    """Test the structural hash of frozen trees."""
+
+    def test_equal_trees_hash_equal(self, tree):
+        other = AstNode.from_dict(tree.to_dict())
+        assert other == tree and hash(other.freeze()) == hash(tree.freeze())
+
+    def test_unfrozen_nodes_are_unhashable(self, tree):
+        with pytest.raises(TypeError):
+            hash(tree)
+        with pytest.raises(TypeError):
+            {Identifier(name="x")}
+
+    def test_hash_is_cached_once_frozen(self, tree):
+        value = hash(tree.freeze())
+        assert tree._hash == value == hash(tree)
+        assert tree.body[0]._hash is not None
+
+    def test_frozen_nodes_reject_assignment(self, tree):
+        node = Identifier(name="x").freeze()
+        with pytest.raises(FrozenInstanceError):
+            node.name = "y"
+        tree.freeze()
+        with pytest.raises(FrozenInstanceError):
+            tree.body[0].body = None
+        assert tree.freeze() is tree
+
+    def test_hash_ignores_positions(self):
+        assert hash(Identifier(name="x", line=1).freeze()) == hash(
+            Identifier(name="x", line=9).freeze()
+        )
+        assert hash(Identifier(name="x").freeze()) != hash(Identifier(name="y").freeze())
+
+    def test_nodes_deduplicate_in_sets(self):
+        nodes = {n.freeze() for n in (Identifier(name="x"), Identifier(name="x"), Pass.get())}
+        assert len(nodes) == 2
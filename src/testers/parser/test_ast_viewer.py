@@ -0,0 +1,40 @@
+"""
+Tests for the AST viewers on trees with optional (None) children.
+"""
+
+import io
+
+import pytest
+from src.tools.ast_viewer import (
+    build_expr_tree,
+    build_rich_tree_generic,
+    render_ascii,
+    render_mermaid,
+    unwrap_expr,
+)
+
+rich_console = pytest.importorskip("rich.console")
+
+SLICES = ["a[1:]\n", "a[::2]\n", "a[:]\n"]
+
+
+def _rich_text(tree):
+    buf = io.StringIO()
+    rich_console.Console(file=buf, width=120).print(tree)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("source", SLICES)
+class TestSliceViews:
+    """Test that every view renders slices whose bounds are missing."""
+
+    def test_rich_views_render_slice(self, parser, source):
+        expr = unwrap_expr(parser.parse(source))
+        for verbose in (False, True):
+            assert "TupleExpr" in _rich_text(build_rich_tree_generic(expr, verbose=verbose))
+            assert _rich_text(build_expr_tree(expr, verbose=verbose)).strip()
+
+    def test_text_views_render_slice(self, parser, source):
+        tree = parser.parse(source)
+        assert "TupleExpr" in render_ascii(tree)
+        assert render_mermaid(tree).startswith("graph")
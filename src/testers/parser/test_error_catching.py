@@ -9,14 +9,13 @@ including cases where lexer errors occur before parser errors.
 """
 
 import pytest
-from src.parser.parser import Parser
 from src.core.utils import Error
 
 
 class TestPErrorDetection:
     """Test that p_error detects different types of syntax errors."""
 
-    def test_missing_colon_control_structures(self):
+    def test_missing_colon_control_structures(self, parser):
         """Test detection of missing colons in if/while/for/def/class."""
         test_cases = [
             "if x > 5\n    y = 10",
@@ -27,37 +26,33 @@ class TestPErrorDetection:
         ]
 
         for code in test_cases:
-            parser = Parser(debug=False)
             parser.parse(code)
             assert (
                 len(parser.errors) > 0
             ), f"Should detect missing colon in: {code[:20]}..."
             assert parser.errors[0].type in ("lexer", "parser")
 
-    def test_incomplete_binary_expressions(self):
+    def test_incomplete_binary_expressions(self, parser):
         """Test detection of incomplete binary operations."""
         code = "x = 5 + 3 *"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0, "Should detect incomplete expression"
 
-    def test_unexpected_closing_delimiters(self):
+    def test_unexpected_closing_delimiters(self, parser):
         """Test detection of unmatched closing delimiters."""
         delimiters = [")", "]", "}"]
 
         for delim in delimiters:
             code = f"x = 5 {delim}"
-            parser = Parser(debug=False)
             parser.parse(code)
 
             assert len(parser.errors) > 0, f"Should detect unexpected '{delim}'"
             assert delim in parser.errors[0].message
 
-    def test_unexpected_end_of_file(self):
+    def test_unexpected_end_of_file(self, parser):
         """Test detection of unexpected EOF in incomplete statement."""
         code = "if x > 5:"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0, "Should detect incomplete if statement"
@@ -68,13 +63,12 @@ class TestPErrorDetection:
             or "indent" in error_msg
         )
 
-    def test_assignment_without_target(self):
+    def test_assignment_without_target(self, parser):
         """Test detection of assignment operators without target."""
         operators = ["=", "+=", "-="]
 
         for op in operators:
             code = f"{op} 5"
-            parser = Parser(debug=False)
             parser.parse(code)
 
             assert len(parser.errors) > 0, f"Should detect invalid '{op}' usage"
@@ -89,39 +83,35 @@ class TestPErrorDetection:
 class TestPErrorMessages:
     """Test that p_error produces specific and helpful error messages."""
 
-    def test_indent_error_message(self):
+    def test_indent_error_message(self, parser):
         """Test INDENT error has specific message about indentation."""
         code = "x = 5\n    y = 10"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
         assert "indent" in parser.errors[0].message.lower()
 
-    def test_dedent_error_message(self):
+    def test_dedent_error_message(self, parser):
         """Test DEDENT error mentions unindent/dedent."""
         code = "def foo():\n    x = 5\n  y = 10"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
         error_msg = parser.errors[0].message.lower()
         assert "dedent" in error_msg or "unindent" in error_msg or "indent" in error_msg
 
-    def test_delimiter_error_messages(self):
+    def test_delimiter_error_messages(self, parser):
         """Test delimiter errors mention 'delimiter' or 'closing'."""
         code = "x = ]"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
         error_msg = parser.errors[0].message.lower()
         assert "delimiter" in error_msg or "closing" in error_msg
 
-    def test_colon_error_message(self):
+    def test_colon_error_message(self, parser):
         """Test unexpected colon error mentions control structures."""
         code = "x = 5 :"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
@@ -129,10 +119,9 @@ class TestPErrorMessages:
         keywords = ["if", "while", "for", "def", "class", "syntax", ":"]
         assert any(kw in error_msg for kw in keywords)
 
-    def test_comma_error_message(self):
+    def test_comma_error_message(self, parser):
         """Test unexpected comma error mentions list/tuple/argument."""
         code = "x = , 5"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
@@ -140,10 +129,9 @@ class TestPErrorMessages:
         keywords = ["list", "tuple", "argument", "syntax", ","]
         assert any(kw in error_msg for kw in keywords)
 
-    def test_operator_error_messages(self):
+    def test_operator_error_messages(self, parser):
         """Test operator errors are detected."""
         code = "x = 5 +"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
@@ -155,35 +143,33 @@ class TestPErrorMessages:
 class TestPErrorRecovery:
     """Test that p_error recovery mechanism allows continued parsing."""
 
-    def test_recovery_continues_after_error(self):
+    def test_recovery_continues_after_error(self, parser):
         """Test parser continues after encountering an error."""
         code = """
 x = 5
 y = 10 +
 z = 15
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
 
         # Should detect error but not crash
         assert len(parser.errors) > 0
         assert ast is not None
 
-    def test_multiple_errors_in_one_pass(self):
+    def test_multiple_errors_in_one_pass(self, parser):
         """Test parser detects multiple errors without stopping."""
         code = """
 x = 5 +
 if y
     z = 10
 """
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) >= 1
         for err in parser.errors:
             assert isinstance(err, Error)
 
-    def test_recovery_sync_on_control_structures(self):
+    def test_recovery_sync_on_control_structures(self, parser):
         """Test recovery synchronizes on statement-starting keywords."""
         code = """
 x = )
@@ -192,19 +178,17 @@ def foo():
 while True:
     pass
 """
-        parser = Parser(debug=False)
         parser.parse(code)
 
         # Should detect error in first line but continue
         assert len(parser.errors) > 0
 
-    def test_consecutive_delimiter_errors(self):
+    def test_consecutive_delimiter_errors(self, parser):
         """Test recovery handles consecutive errors."""
         code = """
 x = )
 y = ]
 """
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) >= 1
@@ -213,10 +197,9 @@ y = ]
 class TestPErrorAttributes:
     """Test that Error objects have correct attributes."""
 
-    def test_error_object_structure(self):
+    def test_error_object_structure(self, parser):
         """Test Error object has all required attributes."""
         code = "x = )"
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
@@ -229,46 +212,60 @@ class TestPErrorAttributes:
         assert hasattr(err, "type") and err.type in ("lexer", "parser")
         assert hasattr(err, "data")
 
-    def test_error_line_accuracy(self):
+    def test_error_line_accuracy(self, parser):
         """Test that error line numbers are reasonably accurate."""
         code = """
 x = 5
 y = )
 """
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
         # Error should be near line 3 (where 'y = )' is)
         assert parser.errors[0].line >= 2
 
+    def test_reused_parser_restarts_line_numbers(self, parser):
+        """Test that a second parse reports lines of its own input only."""
+        parser.parse("a = 1\nb = 2\nc = (\n")
+        parser.parse("y = )")
+
+        assert "DELIMITERS" in parser.errors[0].message
+        assert parser.errors[0].line == 1
+
+    def test_equal_errors_deduplicate(self, parser):
+        """Test that errors comparing equal also hash equal."""
+        parser.parse("x = )")
+        err = parser.errors[0]
+        copy = Error(err.message, err.line, err.column, err.type)
+
+        assert copy == err and len({err, copy}) == 1
+        first = repr(err)
+        assert repr(err) == first
+
 
 class TestPErrorEdgeCases:
     """Test edge cases and special scenarios."""
 
-    def test_empty_input_no_crash(self):
+    def test_empty_input_no_crash(self, parser):
         """Test empty input doesn't crash."""
-        parser = Parser(debug=False)
         parser.parse("")
 
         # The important thing is it doesn't crash
         assert True  # If we got here, no crash occurred
 
-    def test_whitespace_only_no_crash(self):
+    def test_whitespace_only_no_crash(self, parser):
         """Test whitespace-only input doesn't crash."""
-        parser = Parser(debug=False)
         parser.parse("   \n\n   \n")
         assert True  # If we got here, no crash occurred
 
-    def test_error_at_end_of_file(self):
+    def test_error_at_end_of_file(self, parser):
         """Test error detection at EOF."""
         code = "x = 5\ny = 10\nz ="
-        parser = Parser(debug=False)
         parser.parse(code)
 
         assert len(parser.errors) > 0
 
-    def test_valid_code_produces_no_errors(self):
+    def test_valid_code_produces_no_errors(self, parser):
         """Test that syntactically correct code has no parser errors."""
         code = """
 x = 5
@@ -281,7 +278,6 @@ else:
 def foo(a, b):
     return a * b
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
 
         assert (
@@ -293,7 +289,7 @@ def foo(a, b):
 class TestPErrorComplexScenarios:
     """Test complex scenarios mixing different error types."""
 
-    def test_mixed_errors_in_nested_structures(self):
+    def test_mixed_errors_in_nested_structures(self, parser):
         """Test errors in nested control structures."""
         code = """
 if x > 5:
@@ -302,26 +298,24 @@ if x > 5:
     for i in items:
         process(i)
 """
-        parser = Parser(debug=False)
         parser.parse(code)
 
         # Should detect missing colon in while
         assert len(parser.errors) > 0
 
-    def test_error_in_function_with_complex_body(self):
+    def test_error_in_function_with_complex_body(self, parser):
         """Test error detection within function bodies."""
         code = """
 def calculate(x, y):
     result = x + y *
     return result
 """
-        parser = Parser(debug=False)
         parser.parse(code)
 
         # Should detect incomplete expression
         assert len(parser.errors) > 0
 
-    def test_error_recovery_across_class_definition(self):
+    def test_error_recovery_across_class_definition(self, parser):
         """Test recovery works across class boundaries."""
         code = """
 x = )
@@ -332,13 +326,12 @@ class MyClass:
     def method(self):
         return self.value
 """
-        parser = Parser(debug=False)
         parser.parse(code)
 
         # Should detect delimiter error but recover for class
         assert len(parser.errors) > 0
 
-    def test_multiple_statement_types_with_error(self):
+    def test_multiple_statement_types_with_error(self, parser):
         """Test mixed valid and invalid statements."""
         code = """
 x = 5
@@ -348,7 +341,6 @@ w = 20
 if w > 10:
     print(w)
 """
-        parser = Parser(debug=False)
         parser.parse(code)
 
         # Should detect error in incomplete expression
@@ -358,7 +350,7 @@ if w > 10:
 class TestPErrorNoExceptions:
     """Test that p_error never raises exceptions for any syntax error."""
 
-    def test_no_exception_on_critical_errors(self):
+    def test_no_exception_on_critical_errors(self, parser):
         """Verify critical syntax errors don't crash the parser."""
         bad_codes = [
             "if x > 5\n    pass",  # Missing colon (may be lexer error)
@@ -369,7 +361,6 @@ class TestPErrorNoExceptions:
         ]
 
         for code in bad_codes:
-            parser = Parser(debug=False)
             try:
                 parser.parse(code)
                 assert len(parser.errors) > 0, f"Should detect error in: {code[:30]}..."
@@ -388,9 +379,8 @@ class TestPErrorNoExceptions:
         ("x = 5 :", [":", "if", "while", "for", "def", "class", "syntax"]),
     ],
 )
-def test_error_messages_are_descriptive(code, expected_keywords):
+def test_error_messages_are_descriptive(parser, code, expected_keywords):
     """Parametrized test: verify error messages contain relevant keywords."""
-    parser = Parser(debug=False)
     parser.parse(code)
 
     assert len(parser.errors) > 0, f"Should detect error in: {code}"
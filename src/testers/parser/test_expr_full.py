@@ -110,3 +110,13 @@ def test_expr_call():
     assert ast.args[0].value == 1
     assert ast.args[1].value == 2
     assert ast.args[2].value == 3
+
+def test_expr_call_trailing_comma():
+    ast = parse("func(1, 2,)")
+    assert isinstance(ast, CallExpr)
+    assert [arg.value for arg in ast.args] == [1, 2]
+
+def test_expr_call_many_args():
+    ast = parse("func(" + ", ".join(str(i) for i in range(500)) + ")")
+    assert isinstance(ast, CallExpr)
+    assert [arg.value for arg in ast.args] == list(range(500))
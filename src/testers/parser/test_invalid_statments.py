@@ -3,12 +3,19 @@ Tests for parsing invalid Python-like statements and structures.
 """
 
 import pytest
-from src.parser.parser import Parser
 
 
-@pytest.fixture
-def parser():
-    return Parser(debug=False)
+# Inputs for TestParserResilience; all run through the one shared parser.
+INVALID_CODE = (
+    "1 = a",
+    "(a + b) = 5",
+    "for i in range(3)",
+    "while x < 5",
+    "nums = [1, 2,, 3]",
+    'data = {"key": 1, "value"}',
+    "broken = [1, [2, [3, 4]]",
+    'weird_dict = {"a": 1, "b": 2',
+)
 
 
 class TestInvalidAssignments:
@@ -106,19 +113,7 @@ class TestInvalidOperators:
 class TestParserResilience:
     """Ensure parser does not crash on invalid input."""
 
-    @pytest.mark.parametrize(
-        "code",
-        [
-            "1 = a",
-            "(a + b) = 5",
-            "for i in range(3)",
-            "while x < 5",
-            "nums = [1, 2,, 3]",
-            'data = {"key": 1, "value"}',
-            "broken = [1, [2, [3, 4]]",
-            'weird_dict = {"a": 1, "b": 2',
-        ],
-    )
+    @pytest.mark.parametrize("code", INVALID_CODE, ids=repr)
     def test_parser_does_not_crash_on_invalid_code(self, parser, code):
         try:
             parser.parse(code)
@@ -3,25 +3,23 @@ Tests for parsing valid Python-like structures (assignments, lists, dicts, loops
 """
 
 import pytest
-from src.parser.parser import Parser
 
 
 class TestValidAssignments:
     """Test parsing of assignment expressions"""
 
-    def test_basic_assignments(self):
+    def test_basic_assignments(self, parser):
         code = """
 a = 1
 b = 2
 c = 3
 x = a + b
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
         assert ast is not None
         assert len(parser.errors) == 0
 
-    def test_mixed_assignment_structures(self):
+    def test_mixed_assignment_structures(self, parser):
         code = """
 nums = [1, 2, 3, 4]
 empty_list = []
@@ -32,7 +30,6 @@ empty_dict = {}
 data = {"sum": 1 + 2, "nested": {"ok": True, "list": [1, 2, 3]}}
 mixed = [1, (2, 3), {"a": 4, "b": [5, 6]}]
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
         assert ast is not None
         assert len(parser.errors) == 0, parser.errors
@@ -41,7 +38,7 @@ mixed = [1, (2, 3), {"a": 4, "b": [5, 6]}]
 class TestValidConditionals:
     """Test correct parsing of if/elif/else structures"""
 
-    def test_if_elif_else(self):
+    def test_if_elif_else(self, parser):
         code = """
 a = 1
 b = 2
@@ -55,7 +52,6 @@ elif x == 3:
 else:
     result = 0
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
         assert ast is not None
         assert len(parser.errors) == 0
@@ -64,7 +60,7 @@ else:
 class TestValidLoops:
     """Test parsing of while and for loops"""
 
-    def test_while_loop(self):
+    def test_while_loop(self, parser):
         code = """
 counter = 0
 while counter < 3:
@@ -74,17 +70,15 @@ while counter < 3:
     if counter == 3:
         break
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
         assert ast is not None
         assert len(parser.errors) == 0
 
-    def test_for_loop(self):
+    def test_for_loop(self, parser):
         code = """
 for i in range(2):
     print(i)
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
         assert ast is not None
         assert len(parser.errors) == 0
@@ -93,7 +87,7 @@ for i in range(2):
 class TestNestedStructures:
     """Test nested lists, tuples, and dicts."""
 
-    def test_nested_data_structures(self):
+    def test_nested_data_structures(self, parser):
         code = """
 nested_list = [1, [2, [3, [4, [5]]]]]
 nested_tuple = (1, (2, (3, (4, 5))))
@@ -109,7 +103,6 @@ nested_dict = {
     }
 }
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
         assert ast is not None
         assert len(parser.errors) == 0
@@ -118,7 +111,7 @@ nested_dict = {
 class TestMixedControlFlow:
     """Test mixing if, for, and while inside valid nested scopes."""
 
-    def test_if_for_while_mix(self):
+    def test_if_for_while_mix(self, parser):
         code = """
 a = 1
 b = 2
@@ -153,7 +146,6 @@ final_structure = [
     [{"inner_list": [0, 1, {"deep": [10, 20]}]}]
 ]
 """
-        parser = Parser(debug=False)
         ast = parser.parse(code)
         assert ast is not None
         assert len(parser.errors) == 0, f"Unexpected parser errors: {parser.errors}"
@@ -172,8 +164,7 @@ class TestParserNoCrashes:
             "for i in range(3):\n    print(i)",
         ],
     )
-    def test_no_crash_on_valid_code(self, code):
-        parser = Parser(debug=False)
+    def test_no_crash_on_valid_code(self, parser, code):
         try:
             parser.parse(code)
         except Exception as e:
@@ -0,0 +1,120 @@
+"""
+On-disk cache of parsed ASTs, keyed by a hash of the source text.
+
+Entries are pickled trees stored as ``<digest>.ast.pkl`` in the cache
+directory (``~/.cache/transpyler`` by default). The key also covers the
+source of the lexer, parser and core packages (parser tables included) and
+``CACHE_VERSION``, so a change to any of them is a miss instead of a stale
+tree. Only sources that parse without errors are cached, and a cache
+directory owned by another user is never read or written, since loading
+a pickle can run code.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from functools import cache
+from pathlib import Path
+from typing import Optional
+
+from src.core.ast import AstNode, Module
+from src.parser.parser import Parser
+
+# Bump to drop every existing entry, e.g. when the entry format changes.
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "transpyler"
+
+# Packages (under src/) whose code decides what a parse produces.
+_KEY_PACKAGES = ("lexer", "parser", "core")
+
+
+@cache
+def _key_seed():
+    """Hash state seeded with everything a key depends on besides the source."""
+    h = hashlib.blake2b(str(CACHE_VERSION).encode("utf-8"), digest_size=16)
+    root = Path(__file__).resolve().parent.parent
+    for package in _KEY_PACKAGES:
+        for path in sorted((root / package).rglob("*.py")):
+            h.update(path.relative_to(root).as_posix().encode("utf-8"))
+            h.update(path.read_bytes())
+    return h
+
+
+def _entry_path(code: str, directory: Path) -> Path:
+    h = _key_seed().copy()
+    h.update(code.encode("utf-8"))
+    return directory / f"{h.hexdigest()}.ast.pkl"
+
+
+def _cache_dir(cache_dir) -> Path:
+    return Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+
+
+def _owned_by_user(directory: Path) -> bool:
+    """False if ``directory`` is missing or belongs to someone else."""
+    try:
+        st = directory.stat()
+    except OSError:
+        return False
+    # Platforms without POSIX owners (Windows) have no os.getuid.
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def get_ast(code: str, cache_dir=None) -> Optional[Module]:
+    """Return the cached tree for ``code``, or None on a miss."""
+    directory = _cache_dir(cache_dir)
+    if not _owned_by_user(directory):
+        return None
+    try:
+        with open(_entry_path(code, directory), "rb") as fh:
+            tree = pickle.load(fh)
+    except Exception:
+        # Missing, truncated or unreadable entries are all just misses.
+        return None
+    return tree if isinstance(tree, Module) else None
+
+
+def put_ast(code: str, tree: AstNode, cache_dir=None) -> None:
+    """Store ``tree`` as the parse of ``code``; write failures are ignored.
+
+    ``tree`` itself is left untouched: cached structural hashes are never
+    pickled (see ``AstNode.__getstate__``).
+    """
+    directory = _cache_dir(cache_dir)
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return
+    if not _owned_by_user(directory):
+        return
+    path = _entry_path(code, directory)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as fh:
+            pickle.dump(tree, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        # Readers never see a partly written entry.
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def parse_cached(parser: Parser, code: str, cache_dir=None) -> AstNode:
+    """``parser.parse(code)``, served from and saved to the cache.
+
+    On a hit ``parser.errors`` is left empty, as only error-free parses are
+    stored.
+    """
+    tree = get_ast(code, cache_dir)
+    if tree is not None:
+        parser.errors.clear()
+        return tree
+    tree = parser.parse(code)
+    if not parser.errors:
+        put_ast(code, tree, cache_dir)
+    return tree
@@ -1,44 +1,37 @@
 from __future__ import annotations
 import argparse
 import sys
+from functools import cache
+from importlib.util import find_spec
 from pathlib import Path
 
 from src.parser.parser import Parser
-from src.core.ast import (
-    Module,
-    ExprStmt,
-)
+from src.tools.ast_cache import parse_cached
 from src.tools.ast_viewer import (
-    ast_to_json,
+    write_ast_json,
     build_rich_tree_generic,
     build_expr_tree,
-    render_ascii,
+    write_ascii,
+    render_text_tree,
     render_mermaid,
+    unwrap_expr,
 )
 
-try:
-    from rich.console import Console
-    from rich.panel import Panel
+# rich is imported on first output that needs it; the Mermaid view and
+# plain-text fallbacks run without loading it.
+RICH_OK = find_spec("rich") is not None
 
-    RICH_OK = True
-    console = Console()
-except Exception:
-    RICH_OK = False
-    console = None
-    Panel = None
 
+@cache
+def _console():
+    from rich.console import Console
 
-def _maybe_unwrap_expr(tree):
-    if (
-        isinstance(tree, Module)
-        and len(tree.body) == 1
-        and isinstance(tree.body[0], ExprStmt)
-    ):
-        return tree.body[0].value
-    return tree
+    return Console()
 
 
-def _parse_args() -> argparse.Namespace:
+@cache
+def _arg_parser() -> argparse.ArgumentParser:
+    """Build the option parser once; ``main`` may be called many times."""
     ap = argparse.ArgumentParser(
         description="Parse source, save AST JSON, and print (Rich/ASCII/Mermaid)."
     )
@@ -47,7 +40,17 @@ def _parse_args() -> argparse.Namespace:
     g.add_argument("--file", help="Path to a source file (.py/.flpy)")
     ap.add_argument("--out", help="JSON output path (default: repo_root/ast.json)")
     ap.add_argument(
-        "--view", choices=["expr", "generic", "diagram", "mermaid"], default="expr"
+        "--compact-json",
+        action="store_true",
+        help="Write the AST JSON without indentation (smaller and faster)",
+    )
+    ap.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse ASTs of unchanged sources cached in ~/.cache/transpyler",
+    )
+    ap.add_argument(
+        "--view", choices=["expr", "generic", "diagram", "text", "mermaid"], default="expr"
     )
     ap.add_argument(
         "--unwrap-expr",
@@ -59,7 +62,17 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Show internal fields (line/col) in the printed tree",
     )
-    return ap.parse_args()
+    return ap
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    return _arg_parser().parse_args(argv)
+
+
+@cache
+def _parser() -> Parser:
+    """Shared Parser; ``Parser.parse`` resets errors and lexer state per call."""
+    return Parser(debug=False)
 
 
 def _read_source(args: argparse.Namespace) -> tuple[str, str]:
@@ -76,24 +89,31 @@ def _read_source(args: argparse.Namespace) -> tuple[str, str]:
 
 
 def _default_json_path() -> Path:
-    return Path(__file__).resolve().parents[2] / "ast.json"
+    return _DEFAULT_JSON_PATH
+
+
+# Resolved once at import; resolve() walks the path with a syscall per part.
+_DEFAULT_JSON_PATH = Path(__file__).resolve().parents[2] / "ast.json"
 
 
 def _print_header(src_label: str, out_path: Path):
     if not RICH_OK:
         print(f"[TransPyler] AST generated\nSource: {src_label}\nJSON:   {out_path}\n")
         return
+    from rich.panel import Panel
+
     header = Panel.fit(
         f"[bold green]AST generated[/bold green]\n"
         f"Source: {src_label}\n"
         f"JSON:   {out_path}",
         title="[white]TransPyler[/white]",
     )
-    console.print(header)
+    _console().print(header)
 
 
-def main():
-    args = _parse_args()
+def main(argv=None):
+    """Run the CLI on ``argv`` (defaults to ``sys.argv[1:]``)."""
+    args = _parse_args(argv)
 
     # 1) Source
     source, src_label = _read_source(args)
@@ -102,29 +122,35 @@ def main():
     out_path = Path(args.out) if args.out else _default_json_path()
 
     # 3) Parse
-    parser = Parser(debug=False)
-    ast_root = parser.parse(source)
+    parser = _parser()
+    ast_root = parse_cached(parser, source) if args.cache else parser.parse(source)
 
     if parser.errors:
         msg = "\n".join(e.exact() for e in parser.errors)
         if RICH_OK:
-            console.print(f"\n[bold red][PARSE ERROR][/bold red]\n{msg}")
+            _console().print(f"\n[bold red][PARSE ERROR][/bold red]\n{msg}")
         else:
             print("\n[PARSE ERROR]\n" + msg)
         sys.exit(1)
 
     # 4) Unwrap expr:
     if args.expr is not None or args.unwrap_expr:
-        ast_root = _maybe_unwrap_expr(ast_root)
+        ast_root = unwrap_expr(ast_root)
 
     # 5) Save JSON
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(ast_to_json(ast_root), encoding="utf-8")
+    if not out_path.parent.is_dir():
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+    write_ast_json(ast_root, out_path, compact=args.compact_json)
 
     # 6) Print selected view
     if args.view == "diagram":
         _print_header(src_label, out_path)
-        print(render_ascii(ast_root))
+        write_ascii(ast_root, sys.stdout)
+        return
+
+    if args.view == "text":
+        _print_header(src_label, out_path)
+        print(render_text_tree(ast_root))
         return
 
     if args.view == "mermaid":
@@ -136,7 +162,7 @@ def main():
     # Rich: expr / generic
     if not RICH_OK:
         _print_header(src_label, out_path)
-        print("(Rich not installed) Use --view diagram or --view mermaid.")
+        print("(Rich not installed) Use --view diagram, text or mermaid.")
         return
 
     _print_header(src_label, out_path)
@@ -145,7 +171,7 @@ def main():
         if args.view == "expr"
         else build_rich_tree_generic(ast_root, verbose=args.verbose)
     )
-    console.print(tree)
+    _console().print(tree)
 
 
 if __name__ == "__main__":
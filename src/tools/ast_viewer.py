@@ -1,9 +1,14 @@
 from __future__ import annotations
-import json
+from dataclasses import fields
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import islice
+from operator import attrgetter
 from typing import Iterable, List, TYPE_CHECKING, Any
 
 from src.core.ast.ast_base import AstNode
 from src.core.ast import (
+    Module,
     ExprStmt,
     If,
     While,
@@ -33,36 +38,106 @@ VALUE_STYLE = "magenta"
 PLAIN_DIM = "dim"
 
 
+def unwrap_expr(tree):
+    """The bare expression of a module holding a single expression statement.
+
+    Any other tree is returned unchanged.
+    """
+    if (
+        isinstance(tree, Module)
+        and len(tree.body) == 1
+        and isinstance(tree.body[0], ExprStmt)
+    ):
+        return tree.body[0].value
+    return tree
+
+
 # ---------------- JSON ----------------
-def ast_to_json(node: AstNode) -> str:
-    return json.dumps(node.to_dict(), indent=2, ensure_ascii=False)
+def ast_to_json(node: AstNode, compact: bool = False) -> str:
+    return node.to_json_bytes(indent=not compact).decode("utf-8")
+
+
+def write_ast_json(node: AstNode, path, compact: bool = False) -> None:
+    """Write the same JSON as ``ast_to_json`` to ``path``.
+
+    Nothing is streamed: ``to_json_bytes`` (orjson when installed) builds
+    the whole document in memory and it is written with a single call.
+    ``compact`` drops the indentation and separator spaces.
+    """
+    with open(path, "wb") as fp:
+        fp.write(node.to_json_bytes(indent=not compact))
 
 
 # --------------- Rich -----------------
-try:
-    from rich.tree import Tree
+# rich is imported by the first Rich view built (see _require_rich), so the
+# ASCII, text and Mermaid views never pay for loading it.
+RICH_OK = find_spec("rich") is not None
+Tree = None  # type: ignore  # rich.tree.Tree once loaded
 
-    RICH_OK = True
-except Exception:
-    RICH_OK = False
-    Tree = None  # type: ignore
+
+def _require_rich() -> None:
+    global Tree
+    if Tree is None:
+        if not RICH_OK:
+            raise RuntimeError("Rich is not available.")
+        from rich.tree import Tree as tree_cls
+
+        Tree = tree_cls
 
 # ---------- helpers (Rich) ------------
 
-_HIDE_FIELDS = {"line", "col"}
+_HIDE_FIELDS = frozenset(("line", "col"))
+# Sequence fields the generic view leaves out when they hold no sequence.
+_SEQUENCE_FIELDS = frozenset(("statements", "elements", "pairs"))
 
 
 def _fields_for_print(node: AstNode, verbose: bool) -> dict:
-    data = dict(getattr(node, "__dict__", {}))
-    if not verbose:
-        for field_key in _HIDE_FIELDS:
-            data.pop(field_key, None)
-    return data
+    if not isinstance(node, AstNode):  # e.g. the None holes of a slice
+        return {}
+    key = (node.__class__, verbose)
+    reader = _FIELD_READERS.get(key)
+    if reader is None:
+        reader = _FIELD_READERS[key] = _compile_field_reader(*key)
+    return reader(node)
+
+
+def _compile_field_reader(cls, verbose: bool):
+    """Generate a function returning the printable fields of a ``cls`` node.
+
+    The field list of a class never changes, so it is resolved once here
+    instead of calling ``dataclasses.fields`` and filtering for every node.
+    """
+    names = [
+        f.name
+        for f in fields(cls)
+        if not f.name.startswith("_") and (verbose or f.name not in _HIDE_FIELDS)
+    ]
+    items = ", ".join(f"{name!r}: node.{name}" for name in names)
+    namespace: dict = {}
+    exec(f"def read(node):\n    return {{{items}}}", namespace)
+    read = namespace["read"]
+    read.__qualname__ = f"_read_{cls.__name__}"
+    return read
+
+
+_FIELD_READERS: dict = {}
+
+
+# Class and field names repeat across a whole tree, so their markup is
+# formatted once per name and reused.
+@lru_cache(maxsize=None)
+def _node_title(title: str) -> str:
+    return f"[{NODE_STYLE}]{title}[/]"
+
+
+@lru_cache(maxsize=None)
+def _field_title(name: str) -> str:
+    return f"[{FIELD_STYLE}]{name}[/]"
 
 
 def _label(node: AstNode, title: str, verbose: bool) -> str:
     if not verbose:
-        return f"[{NODE_STYLE}]{title}[/]"
+        return _node_title(title)
     line = getattr(node, "line", None)
     col = getattr(node, "col", None)
     meta = (
@@ -70,7 +145,7 @@ def _label(node: AstNode, title: str, verbose: bool) -> str:
         if line is not None and col is not None
         else ""
     )
-    return f"[{NODE_STYLE}]{title}[/]{meta}"
+    return f"{_node_title(title)}{meta}"
 
 
 def _add_list(
@@ -99,10 +174,15 @@ def _render_elements_node(
 
 
 def build_rich_tree_generic(
-    node: AstNode, *, label: str | None = None, verbose: bool = False
+    node: AstNode,
+    *,
+    label: str | None = None,
+    verbose: bool = False,
+    unwrap: bool = False,
 ):
-    if not RICH_OK:
-        raise RuntimeError("Rich is not available.")
+    _require_rich()
+    if unwrap:
+        node = unwrap_expr(node)
     if node is None:
         return Tree("[dim]∅[/dim]")
 
@@ -117,49 +197,81 @@ def build_rich_tree_generic(
 
 
 def _render_node(node: AstNode, parent: RichTree, verbose: bool, is_root: bool = False):
-    if isinstance(node, ExprStmt):
-        _render_node(node.value, parent, verbose, is_root=is_root)
-        return
+    # Walk with an explicit stack instead of recursing: deep trees no longer
+    # pay a Python frame per node or risk a RecursionError. Children are
+    # pushed in reverse so they are rendered, and added, in source order.
+    stack = [(node, parent, is_root)]
+    while stack:
+        node, parent, is_root = stack.pop()
+        pending = _expand_node(node, parent, verbose, is_root)
+        stack.extend(reversed(pending))
 
-    if isinstance(node, Block):
-        b = parent if is_root else parent.add(_label(node, "Block", verbose))
-        _add_list(b, "statements", node.statements or [], _render_node, verbose)
-        return
 
-    if isinstance(node, ListExpr):
-        b = parent if is_root else parent.add(_label(node, "ListExpr", verbose))
-        _add_list(b, "elements", node.elements or [], _render_node, verbose)
-        return
+def _list_branch(branch: RichTree, label: str, items, pending: list):
+    items = list(items)
+    lst = branch.add(f"[{SECTION_STYLE}]{label}[/] [dim][{len(items)}][/dim]")
+    pending.extend((it, lst, False) for it in items)
 
-    if isinstance(node, TupleExpr):
-        b = parent if is_root else parent.add(_label(node, "TupleExpr", verbose))
-        _add_list(b, "elements", node.elements or [], _render_node, verbose)
-        return
 
-    if isinstance(node, DictExpr):
-        b = parent if is_root else parent.add(_label(node, "DictExpr", verbose))
-        pairs = b.add(f"[{SECTION_STYLE}]pairs[/]")
-        for k, v in node.pairs or []:
-            kv = pairs.add(f"[{SECTION_STYLE}]pair[/]")
-            _render_node(k, kv.add(f"[{FIELD_STYLE}]key[/]"), verbose)
-            _render_node(v, kv.add(f"[{FIELD_STYLE}]value[/]"), verbose)
-        return
+def _expand_node(node: AstNode, parent: RichTree, verbose: bool, is_root: bool):
+    """Add `node`'s own branches under `parent`.
+
+    Returns the (child, container, is_root) entries still to be rendered.
+    """
+    handler = _dispatch(_EXPAND_HANDLERS, _choose_expand, node)
+    return handler(node, parent, verbose, is_root)
+
+
+def _expand_expr_stmt(node, parent, verbose, is_root):
+    return [(node.value, parent, is_root)]
 
-    if isinstance(node, If):
-        b = parent if is_root else parent.add(_label(node, "If", verbose))
-        _render_node(node.cond, b.add("cond"), verbose)
-        _render_node(node.body, b.add("body"), verbose)
-
-        el = b.add("elifs")
-        for c, blk in node.elifs or []:
-            e = el.add("elif")
-            _render_node(c, e.add("cond"), verbose)
-            _render_node(blk, e.add("body"), verbose)
-
-        o = b.add("orelse")
-        _render_node(node.orelse, o, verbose) if node.orelse else o.add("None")
-        return
 
+def _expand_listing(title: str, attr: str):
+    """Handler for a node shown as one list branch, e.g. Block.statements."""
+    get = attrgetter(attr)
+
+    def expand(node, parent, verbose, is_root):
+        pending = []
+        b = parent if is_root else parent.add(_label(node, title, verbose))
+        _list_branch(b, attr, get(node) or [], pending)
+        return pending
+
+    return expand
+
+
+def _expand_dict(node, parent, verbose, is_root):
+    pending = []
+    b = parent if is_root else parent.add(_label(node, "DictExpr", verbose))
+    pairs = b.add(f"[{SECTION_STYLE}]pairs[/]")
+    for k, v in node.pairs or []:
+        kv = pairs.add(f"[{SECTION_STYLE}]pair[/]")
+        pending.append((k, kv.add(_field_title("key")), False))
+        pending.append((v, kv.add(_field_title("value")), False))
+    return pending
+
+
+def _expand_if(node, parent, verbose, is_root):
+    pending = []
+    b = parent if is_root else parent.add(_label(node, "If", verbose))
+    pending.append((node.cond, b.add("cond"), False))
+    pending.append((node.body, b.add("body"), False))
+
+    el = b.add("elifs")
+    for c, blk in node.elifs or []:
+        e = el.add("elif")
+        pending.append((c, e.add("cond"), False))
+        pending.append((blk, e.add("body"), False))
+
+    o = b.add("orelse")
+    if node.orelse:
+        pending.append((node.orelse, o, False))
+    else:
+        o.add("None")
+    return pending
+
+
+def _expand_generic(node, parent, verbose, is_root):
+    pending = []
     b = (
         parent
         if is_root
@@ -169,99 +281,203 @@ def _render_node(node: AstNode, parent: RichTree, verbose: bool, is_root: bool =
 
     for k, v in data.items():
         if isinstance(v, AstNode):
-            _render_node(v, b.add(f"[{FIELD_STYLE}]{k}[/]"), verbose)
+            pending.append((v, b.add(_field_title(k)), False))
 
-        elif isinstance(v, list):
+        elif isinstance(v, (list, tuple)):
             only_nodes = [x for x in v if isinstance(x, AstNode)]
             if only_nodes:
-                _add_list(b, k, only_nodes, _render_node, verbose)
+                _list_branch(b, k, only_nodes, pending)
             else:
-                b.add(f"[{FIELD_STYLE}]{k}[/] = {repr(v)}")
+                b.add(f"{_field_title(k)} = {repr(v)}")
 
         else:
-            if k not in ("statements", "elements", "pairs"):
-                b.add(f"[{FIELD_STYLE}]{k}[/] = [{VALUE_STYLE}]{repr(v)}[/]")
+            if k not in _SEQUENCE_FIELDS:
+                b.add(f"{_field_title(k)} = [{VALUE_STYLE}]{repr(v)}[/]")
+    return pending
+
+
+_EXPAND_BLOCK = _expand_listing("Block", "statements")
+_EXPAND_LIST = _expand_listing("ListExpr", "elements")
+_EXPAND_TUPLE = _expand_listing("TupleExpr", "elements")
+
+
+def _choose_expand(node: AstNode):
+    if isinstance(node, ExprStmt):
+        return _expand_expr_stmt
+    if isinstance(node, Block):
+        return _EXPAND_BLOCK
+    if isinstance(node, ListExpr):
+        return _EXPAND_LIST
+    if isinstance(node, TupleExpr):
+        return _EXPAND_TUPLE
+    if isinstance(node, DictExpr):
+        return _expand_dict
+    if isinstance(node, If):
+        return _expand_if
+    return _expand_generic
+
+
+_EXPAND_HANDLERS: dict = {}
+
+
+# ---------- per-class dispatch ----------
+# The views below pick a handler by probing which fields a node has. Node
+# classes are slotted dataclasses, so those probes give the same answer for
+# every instance of a class: run them once per class and cache the handler.
+
+
+def _dispatch(cache: dict, choose, node):
+    cls = node.__class__
+    handler = cache.get(cls)
+    if handler is None:
+        handler = cache[cls] = choose(node)
+    return handler
 
 
 # ======= EXPRESSION-ONLY VIEW (Rich) =======
-def build_expr_tree(node: AstNode, *, verbose: bool = False):
-    if not RICH_OK:
-        raise RuntimeError("Rich is not available.")
+# Handlers build a node's own Tree and queue (container, child) pairs in
+# `todo` instead of recursing; build_expr_tree drains the queue with an
+# explicit stack and adds each child's Tree to its container.
+#
+# Finished Trees are attached through `children` rather than `Tree.add`:
+# add() would wrap each one in an extra Tree with the same default styles,
+# which renders identically but doubles the node count.
+def build_expr_tree(node: AstNode, *, verbose: bool = False, unwrap: bool = False):
+    _require_rich()
+    if unwrap:
+        node = unwrap_expr(node)
+    root, todo = _expr_tree_node(node, verbose)
+    stack = todo[::-1]
+    while stack:
+        container, child = stack.pop()
+        tree, todo = _expr_tree_node(child, verbose)
+        stack.extend(reversed(todo))
+        container.children.append(tree)
+    return root
+
+
+def _expr_tree_node(node: AstNode, verbose: bool):
+    todo: list = []
     if node is None:
-        return Tree("[dim]∅[/dim]")
+        return Tree("[dim]∅[/dim]"), todo
+    handler = _dispatch(_EXPR_TREE_HANDLERS, _choose_expr_tree, node)
+    return handler(node, verbose, todo), todo
+
+
+_PAIR_LABEL = ":"
+
+
+@lru_cache(maxsize=None)
+def _lbl(text: str) -> str:
+    return f"[bold]{text}[/bold]"
+
+
+def _branch(name: str, child: AstNode, todo: list):
+    t = Tree(f"[dim]{name}[/dim]")
+    todo.append((t, child))
+    return t
+
+
+def _expr_tree_binary(node, verbose, todo):
+    root = Tree(_lbl(str(node.op)))
+    root.children.extend(
+        (_branch("left", node.left, todo), _branch("right", node.right, todo))
+    )
+    return root
+
+
+def _expr_tree_unary(node, verbose, todo):
+    root = Tree(_lbl(str(node.op)))
+    root.children.append(_branch("operand", node.operand, todo))
+    return root
+
+
+def _expr_tree_name(node, verbose, todo):
+    return Tree(f"[cyan]{node.name}[/cyan]")
+
+
+def _expr_tree_value(node, verbose, todo):
+    return Tree(f"[magenta]{repr(node.value)}[/magenta]")
+
+
+def _expr_tree_call(node, verbose, todo):
+    root = Tree(_lbl("call"))
+    callee_t = _branch("callee", node.callee, todo)
+    args_t = Tree("[dim]args[/dim]")
+    todo.extend((args_t, a) for a in node.args)
+    root.children.extend((callee_t, args_t))
+    return root
+
+
+def _expr_tree_subscript(node, verbose, todo):
+    root = Tree(_lbl("[]"))
+    root.children.extend(
+        (_branch("value", node.value, todo), _branch("index", node.index, todo))
+    )
+    return root
+
+
+def _expr_tree_attribute(node, verbose, todo):
+    root = Tree(_lbl("."))  # attribute access
+    root.children.extend(
+        (_branch("value", node.value, todo), Tree(f"[cyan]{node.attr}[/cyan]"))
+    )
+    return root
+
+
+def _expr_tree_sequence(node, verbose, todo):
+    root = Tree(_lbl("()" if isinstance(node, TupleExpr) else "[]"))
+    todo.extend((root, e) for e in node.elements)
+    return root
+
+
+def _expr_tree_dict(node, verbose, todo):
+    root = Tree(_lbl("{}"))
+    pairs = [Tree(_PAIR_LABEL) for _ in node.pairs]
+    for pair, (k, v) in zip(pairs, node.pairs):
+        todo.append((pair, k))
+        todo.append((pair, v))
+    root.children.extend(pairs)
+    return root
+
 
-    def _lbl(text: str) -> str:
-        return f"[bold]{text}[/bold]"
+def _expr_tree_generic(node, verbose, todo):
+    return build_rich_tree_generic(node, verbose=verbose)
 
-    def _branch(name: str, child: AstNode):
-        t = Tree(f"[dim]{name}[/dim]")
-        t.add(build_expr_tree(child, verbose=verbose))
-        return t
 
+def _choose_expr_tree(node: AstNode):
     # Binary
     if all(hasattr(node, a) for a in ("left", "right", "op")):
-        root = Tree(_lbl(str(getattr(node, "op"))))
-        root.add(_branch("left", node.left))
-        root.add(_branch("right", node.right))
-        return root
-
+        return _expr_tree_binary
     # Unary
     if hasattr(node, "op") and hasattr(node, "operand"):
-        root = Tree(_lbl(str(getattr(node, "op"))))
-        root.add(_branch("operand", node.operand))
-        return root
-
+        return _expr_tree_unary
     # Identifier / Literal
     if hasattr(node, "name"):
-        return Tree(f"[cyan]{getattr(node, 'name')}[/cyan]")
+        return _expr_tree_name
     if hasattr(node, "value"):
-        return Tree(f"[magenta]{repr(getattr(node, 'value'))}[/magenta]")
-
+        return _expr_tree_value
     # Call
     if hasattr(node, "callee") and hasattr(node, "args"):
-        root = Tree(_lbl("call"))
-        root.add(_branch("callee", node.callee))
-        args_t = Tree("[dim]args[/dim]")
-        for a in node.args:
-            args_t.add(build_expr_tree(a, verbose=verbose))
-        root.add(args_t)
-        return root
-
+        return _expr_tree_call
     # Subscript / Attribute / Collections
     if isinstance(node, Subscript):
-        root = Tree(_lbl("[]"))
-        root.add(_branch("value", node.value))
-        root.add(_branch("index", node.index))
-        return root
-
+        return _expr_tree_subscript
     if isinstance(node, Attribute):
-        root = Tree(_lbl("."))  # attribute access
-        root.add(_branch("value", node.value))
-        root.add(Tree(f"[cyan]{node.attr}[/cyan]"))
-        return root
-
+        return _expr_tree_attribute
     if isinstance(node, (TupleExpr, ListExpr)):
-        root = Tree(_lbl("()" if isinstance(node, TupleExpr) else "[]"))
-        for e in node.elements:
-            root.add(build_expr_tree(e, verbose=verbose))
-        return root
-
+        return _expr_tree_sequence
     if isinstance(node, DictExpr):
-        root = Tree(_lbl("{}"))
-        for k, v in node.pairs:
-            pair = Tree(":")
-            pair.add(build_expr_tree(k, verbose=verbose))
-            pair.add(build_expr_tree(v, verbose=verbose))
-            root.add(pair)
-        return root
+        return _expr_tree_dict
+    return _expr_tree_generic
 
-    return build_rich_tree_generic(node, verbose=verbose)
+
+_EXPR_TREE_HANDLERS: dict = {}
 
 
 # --------------- ASCII ----------------
-def _expr_label(node: AstNode) -> str:
-    cls = node.__class__.__name__
-    if cls in {
+_STATEMENT_LABELS = frozenset(
+    (
         "Module",
         "Block",
         "If",
@@ -272,87 +488,164 @@ def _expr_label(node: AstNode) -> str:
         "Continue",
         "Break",
         "ExprStmt",
-    }:
-        return cls
+    )
+)
+
+
+def _describe(node: AstNode):
+    """Return (label, children) for the ASCII and Mermaid views."""
+    label_fn, children_fn = _dispatch(_DESCRIBE_HANDLERS, _choose_description, node)
+    return label_fn(node), children_fn(node)
+
+
+def _choose_description(node: AstNode):
+    return _choose_label(node), _choose_children(node)
+
+
+_DESCRIBE_HANDLERS: dict = {}
+
+
+def _expr_label(node: AstNode) -> str:
+    return _dispatch(_DESCRIBE_HANDLERS, _choose_description, node)[0](node)
+
+
+def _choose_label(node: AstNode):
+    cls = node.__class__.__name__
+    if cls in _STATEMENT_LABELS:
+        return lambda n: cls
     if hasattr(node, "op"):
-        return str(node.op)
+        return lambda n: str(n.op)
     if hasattr(node, "name"):
-        return str(node.name)
+        return lambda n: str(n.name)
     if hasattr(node, "value"):
-        return repr(node.value)
+        return lambda n: repr(n.value)
     if hasattr(node, "callee"):
-        return "call"
-    return cls
+        return lambda n: "call"
+    return lambda n: cls
+
+
+# Callers only iterate over the children, so node sequences are returned as
+# they are and every leaf shares one empty tuple instead of a fresh list.
+_NO_CHILDREN: tuple = ()
 
 
 def _expr_children(node: AstNode):
+    return _dispatch(_DESCRIBE_HANDLERS, _choose_description, node)[1](node)
+
+
+def _children_function(node):
+    children = []
+    children.extend(node.params)
+    if node.body:
+        children.append(node.body)
+    return children
+
+
+def _children_optional(attr: str):
+    get = attrgetter(attr)
+
+    def children(node):
+        value = get(node)
+        return (value,) if value else _NO_CHILDREN
+
+    return children
+
+
+def _children_assign(node):
+    children = []
+    if node.target:
+        children.append(node.target)
+    if node.value:
+        children.append(node.value)
+    return children
+
+
+def _children_if(node):
+    out = [node.cond, node.body]
+    for cond, blk in node.elifs or []:
+        out.extend([cond, blk])
+    if node.orelse:
+        out.append(node.orelse)
+    return out
+
+
+def _children_dict(node):
+    out = []
+    for k, v in node.pairs:
+        out.extend([k, v])
+    return out
+
+
+def _choose_children(node: AstNode):
     # Block
     if isinstance(node, ExprStmt):
-        return [node.value]
+        return lambda n: [n.value]
 
     # FunctionDef y ClassDef
     if isinstance(node, FunctionDef):
-        children = []
-        children.extend(node.params)
-        if node.body:
-            children.append(node.body)
-        return children
-
+        return _children_function
     if isinstance(node, ClassDef):
-        if node.body:
-            return [node.body]
-        return []
+        return _children_optional("body")
 
     # Return statement
     if isinstance(node, Return):
-        if node.value:
-            return [node.value]
-        return []
+        return _children_optional("value")
 
     # Assign statement
     if isinstance(node, Assign):
-        children = []
-        if node.target:
-            children.append(node.target)
-        if node.value:
-            children.append(node.value)
-        return children
-
-    if hasattr(node, "body") and isinstance(node.body, list):
-        return node.body
-    if hasattr(node, "statements") and isinstance(node.statements, list):
-        return node.statements
+        return _children_assign
+
+    if hasattr(node, "body") and isinstance(node.body, (list, tuple)):
+        return lambda n: n.body
+    if hasattr(node, "statements") and isinstance(node.statements, (list, tuple)):
+        return lambda n: n.statements
 
     if isinstance(node, If):
-        out = [node.cond, node.body]
-        for cond, blk in node.elifs or []:
-            out.extend([cond, blk])
-        if node.orelse:
-            out.append(node.orelse)
-        return out
+        return _children_if
     if isinstance(node, While):
-        return [node.cond, node.body]
+        return lambda n: [n.cond, n.body]
     if isinstance(node, For):
-        return [node.target, node.iterable, node.body]
+        return lambda n: [n.target, n.iterable, n.body]
 
     if all(hasattr(node, a) for a in ("left", "right", "op")):
-        return [node.left, node.right]
+        return lambda n: [n.left, n.right]
     if hasattr(node, "op") and hasattr(node, "operand"):
-        return [node.operand]
+        return lambda n: [n.operand]
     if hasattr(node, "callee") and hasattr(node, "args"):
-        return [node.callee] + list(node.args)
+        return lambda n: [n.callee, *n.args]
     if isinstance(node, Subscript):
-        return [node.value, node.index]
+        return lambda n: [n.value, n.index]
     if isinstance(node, Attribute):
-        return [node.value]
+        return lambda n: [n.value]
     if isinstance(node, (TupleExpr, ListExpr)):
-        return list(node.elements)
+        return lambda n: n.elements
     if isinstance(node, DictExpr):
-        out = []
-        for k, v in node.pairs:
-            out.extend([k, v])
-        return out
-    return []
+        return _children_dict
+    return lambda n: _NO_CHILDREN
+
+
+# Rows are built as nested lists of fragments and joined into strings only
+# once, in render_ascii. Concatenating at every level re-copied each row of a
+# subtree once per ancestor.
+#
+# A block is (rows, width, mid, height). Its rows form a chain of
+# (head_rows, tail) pairs ending in None, so a node with a single child
+# stacks its three label/connector rows on top of the child's chain without
+# copying it; only nodes with several children have to re-slice rows.
+
+
+@lru_cache(maxsize=None)
+def _blank(width: int) -> str:
+    return " " * width
+
+
+def _row_list(rows) -> list:
+    """Flatten a chain of row lists into one list."""
+    out = []
+    while rows is not None:
+        head, rows = rows
+        out.extend(head)
+    return out
 
 
 def _merge_ascii(children_lines, gap=4):
@@ -360,15 +653,15 @@ def _merge_ascii(children_lines, gap=4):
     if not children_lines:
         return [], 0, 0, []
 
-    heights = [len(lines) for lines, _, _ in children_lines]
-    max_h = max(heights)
+    max_h = max(h for _, _, _, h in children_lines)
 
     padded = []
-    for lines, w, m in children_lines:
-        pad = lines + [" " * w] * (max_h - len(lines))
-        padded.append((pad, w, m))
+    for rows, w, m, h in children_lines:
+        lines = _row_list(rows)
+        if h < max_h:
+            lines += [_blank(w)] * (max_h - h)
+        padded.append((lines, w, m))
 
-    merged: List[str] = []
     total_w = sum(w for _, w, _ in padded) + gap * (len(padded) - 1)
 
     child_mids: List[int] = []
@@ -377,110 +670,249 @@ def _merge_ascii(children_lines, gap=4):
         child_mids.append(x + m)
         x += w + gap
 
-    for r in range(max_h):
-        line = ""
-        for i, (lines, w, _) in enumerate(padded):
-            line += lines[r]
-            if i < len(padded) - 1:
-                line += " " * gap
-        merged.append(line)
+    # Row r is [row r of child 0, gap, row r of child 1, ...].
+    spacer = _blank(gap)
+    columns = [lines for lines, _, _ in padded]
+    merged = []
+    for parts in zip(*columns):
+        row = [spacer] * (2 * len(parts) - 1)
+        row[::2] = parts
+        merged.append(row)
 
     block_mid = sum(child_mids) // len(child_mids)
     return merged, total_w, block_mid, child_mids
 
 
-def _render_ascii(node: AstNode):
+def _join_row(row) -> str:
+    """Flatten one row of nested fragment lists into a string."""
+    if isinstance(row, str):
+        return row
+    out = []
+    stack = [iter(row)]
+    while stack:
+        for part in stack[-1]:
+            if isinstance(part, str):
+                out.append(part)
+            else:
+                stack.append(iter(part))
+                break
+        else:
+            stack.pop()
+    return "".join(out)
 
-    label = f"({_expr_label(node)})"
-    children = [c for c in _expr_children(node) if c is not None]
 
-    if not children:
-        return [label], len(label), len(label) // 2
+def _render_ascii(node: AstNode):
+    """Render ``node`` bottom-up with an explicit stack (no recursion).
+
+    Each node is visited twice: first to queue its children, then, once
+    their blocks sit on top of ``results``, to combine them under its label.
+
+    Blocks are read-only once built, so identical subtrees share one: a
+    block is keyed by its label and the identities of its children's
+    blocks, which are themselves shared. Repeated names, literals and
+    subexpressions are laid out once per render.
+    """
+    stack = [(node, None)]
+    results = []
+    memo = {}
+    while stack:
+        node, pending = stack.pop()
+        if pending is not None:
+            label, count = pending
+            rendered = results[-count:]
+            del results[-count:]
+            key = (label, *map(id, rendered))
+            block = memo.get(key)
+            if block is None:
+                block = memo[key] = _ascii_block(label, rendered)
+            results.append(block)
+            continue
 
-    rendered = [_render_ascii(c) for c in children]
-    merged, block_w, block_mid, child_mids = _merge_ascii(rendered)
+        label, children = _describe(node)
+        label = f"({label})"
+        if children is not _NO_CHILDREN:  # leaves skip the filtering copy
+            children = [c for c in children if c is not None]
+        if not children:
+            block = memo.get(label)
+            if block is None:
+                block = memo[label] = (([label], None), len(label), len(label) // 2, 1)
+            results.append(block)
+            continue
+        stack.append((node, (label, len(children))))
+        stack.extend((c, None) for c in reversed(children))
+    return results[0]
+
+
+def _ascii_block(label: str, rendered: list):
+    """Place ``label`` and its connectors above the children's blocks."""
+    if len(rendered) == 1:
+        # Only child: its rows sit under the connectors unchanged.
+        merged, block_w, block_mid, height = rendered[0]
+        child_mids = [block_mid]
+    else:
+        merged, block_w, block_mid, child_mids = _merge_ascii(rendered)
+        height = len(merged)
+        merged = (merged, None)
 
     root_w = len(label)
     root_mid = root_w // 2
     left_pad = max(0, block_mid - root_mid)
 
-    first_line = " " * left_pad + label
+    first_line = _blank(left_pad) + label
     if len(first_line) < block_w:
-        first_line += " " * (block_w - len(first_line))
+        first_line += _blank(block_w - len(first_line))
 
-    connector_vert = [" "] * block_w
-    if 0 <= block_mid < block_w:
-        connector_vert[block_mid] = "│"
-    connector_vert = "".join(connector_vert)
+    # Connector rows are built from whole runs of the same character; only
+    # the span between the outer children is drawn one cell at a time.
+    # block_mid is the mean of child_mids, so it always lies in [lo, hi].
+    connector_vert = _blank(block_mid) + "│" + _blank(block_w - block_mid - 1)
 
-    connector_h = [" "] * block_w
-    if child_mids:
-        lo, hi = min(child_mids), max(child_mids)
-        for x in range(lo, hi + 1):
-            connector_h[x] = "─"
-        for mid in child_mids:
-            connector_h[mid] = "┬"
-        connector_h[block_mid] = "┼" if lo <= block_mid <= hi else "┴"
-    connector_h = "".join(connector_h)
+    lo, hi = child_mids[0], child_mids[-1]
+    span = ["─"] * (hi - lo + 1)
+    for mid in child_mids:
+        span[mid - lo] = "┬"
+    span[block_mid - lo] = "┼"
+    connector_h = _blank(lo) + "".join(span) + _blank(block_w - hi - 1)
 
-    lines = [first_line, connector_vert, connector_h] + merged
-    return lines, block_w, block_mid
+    rows = ([first_line, connector_vert, connector_h], merged)
+    return rows, block_w, block_mid, height + 3
 
 
-def render_ascii(ast_root: AstNode) -> str:
+def _ascii_lines(ast_root: AstNode):
+    """Yield the diagram line by line, each row joined only when reached."""
     if ast_root is None:
-        return "<< empty AST >>"
-    lines, _, _ = _render_ascii(ast_root)
+        yield "<< empty AST >>"
+        return
+    rows, _, _, _ = _render_ascii(ast_root)
+    width = len(rows[0][0])  # the root label row is always a plain string
     title = "Expression"
-    top = " " * max(0, (len(lines[0]) - len(title)) // 2) + title
-    arrow = " " * (len(lines[0]) // 2) + "↓"
-    return "\n".join([top, arrow] + lines)
+    yield " " * max(0, (width - len(title)) // 2) + title
+    yield " " * (width // 2) + "↓"
+    while rows is not None:
+        head, rows = rows
+        for row in head:
+            yield _join_row(row)
+
+
+def render_ascii(ast_root: AstNode, *, unwrap: bool = False) -> str:
+    if unwrap:
+        ast_root = unwrap_expr(ast_root)
+    return "\n".join(_ascii_lines(ast_root))
+
+
+def write_ascii(ast_root: AstNode, out, chunk_lines: int = 256) -> None:
+    """Write the ``render_ascii`` diagram and a final newline to ``out``.
+
+    Lines are written in chunks of ``chunk_lines``: a line-buffered stream
+    (stdout on a terminal) flushes on every write containing a newline.
+    """
+    lines = _ascii_lines(ast_root)
+    while True:
+        chunk = list(islice(lines, chunk_lines))
+        if not chunk:
+            return
+        chunk.append("")
+        out.write("\n".join(chunk))
+
+
 
+# ------------- Plain text tree ---------------
+# Same labels and children as the ASCII diagram, printed as an indented tree
+# without Rich: no Tree objects and no markup to parse, so it stays fast on
+# large inputs.
+_TEE, _ELBOW = "├── ", "└── "
+_PIPE, _BLANK = "│   ", "    "
+
+
+def render_text_tree(ast_root: AstNode) -> str:
+    if ast_root is None:
+        return "<< empty AST >>"
+    label, children = _describe(ast_root)
+    lines = [label]
+    stack = _text_children(children, "")
+    while stack:
+        node, prefix, last = stack.pop()
+        label, children = _describe(node)
+        lines.append(prefix + (_ELBOW if last else _TEE) + label)
+        stack.extend(_text_children(children, prefix + (_BLANK if last else _PIPE)))
+    return "\n".join(lines)
+
+
+def _text_children(children, prefix: str):
+    """Stack entries for `children`, reversed so the first one pops first."""
+    if children is _NO_CHILDREN:
+        return []
+    children = [c for c in children if c is not None]
+    last = len(children) - 1
+    return [(c, prefix, i == last) for i, c in reversed(list(enumerate(children)))]
 
 # ------------- Mermaid ---------------
+_SANITIZE = str.maketrans({'"': "'", "{": "(", "}": ")", "\n": " "})
+
+
 def _sanitize(label: str) -> str:
-    return (
-        label.replace('"', "'").replace("{", "(").replace("}", ")").replace("\n", " ")
-    )
+    return label.translate(_SANITIZE)
 
 
-def ast_to_mermaid_lines(node: AstNode, node_id=None, counter=None):
+def ast_to_mermaid_lines(node: AstNode, node_id=None, counter=None, out=None):
+    """Mermaid lines for ``node``'s subtree, appended to ``out`` if given."""
     if counter is None:
         counter = {"n": 0}
     if node_id is None:
         node_id = f"N{counter['n']}"
         counter["n"] += 1
 
-    label = node.__class__.__name__
+    # Iterative pre-order walk. A child's id is taken when its edge is
+    # written, so edges wait on the stack as (parent_id, child) entries.
+    n = counter["n"]
+    lines = [] if out is None else out
+    stack = [(None, node)]
+    while stack:
+        parent_id, node = stack.pop()
+        if parent_id is not None:
+            node_id = f"N{n}"
+            n += 1
+            lines.append(f"{parent_id} --> {node_id}")
+        lines.append(f'{node_id}["{_sanitize(_mermaid_label(node))}"]')
+        children = _expr_children(node)
+        if children is not _NO_CHILDREN:
+            children = [c for c in children if c is not None]
+            stack.extend((node_id, c) for c in reversed(children))
+    counter["n"] = n
+    return lines
+
+
+def _mermaid_label(node: AstNode) -> str:
+    return _dispatch(_MERMAID_LABELS, _choose_mermaid_label, node)(node)
+
+
+def _choose_mermaid_label(node: AstNode):
+    cls = node.__class__.__name__
     if hasattr(node, "name"):
-        label += f": {node.name}"
-    elif hasattr(node, "value") and not hasattr(node, "callee"):
-        val_str = repr(node.value)
-        # Truncate long strings
-        if len(val_str) > 30:
-            val_str = val_str[:27] + "..."
-        label += f": {val_str}"
-    elif hasattr(node, "op"):
-        label += f" ({node.op})"
-
-    lines = [f'{node_id}["{_sanitize(label)}"]']
-
-    # Process children
-    children = _expr_children(node)
-    for child in children:
-        if child is None:
-            continue
-        cid = f"N{counter['n']}"
-        counter["n"] += 1
-        lines.append(f"{node_id} --> {cid}")
-        lines.extend(ast_to_mermaid_lines(child, cid, counter))
+        return lambda n: f"{cls}: {n.name}"
+    if hasattr(node, "value") and not hasattr(node, "callee"):
+        return lambda n: f"{cls}: {_short_repr(n.value)}"
+    if hasattr(node, "op"):
+        return lambda n: f"{cls} ({n.op})"
+    return lambda n: cls
 
-    return lines
+
+def _short_repr(value) -> str:
+    val_str = repr(value)
+    # Truncate long strings
+    if len(val_str) > 30:
+        val_str = val_str[:27] + "..."
+    return val_str
+
+
+_MERMAID_LABELS: dict = {}
 
 
-def render_mermaid(ast_root: AstNode) -> str:
+def render_mermaid(ast_root: AstNode, *, unwrap: bool = False) -> str:
+    if unwrap:
+        ast_root = unwrap_expr(ast_root)
     if ast_root is None:
         return "graph TD\nEmptyAST"
     lines = ["graph TD"]
-    lines.extend(ast_to_mermaid_lines(ast_root))
+    ast_to_mermaid_lines(ast_root, out=lines)
     return "\n".join(lines)